@@ -0,0 +1,45 @@
+import sys
+import timeit
+
+import sqlglot
+from tests.helpers import load_sql_fixture_pairs
+
+# Run from the repository root: python -m benchmarks.generate
+sys.setrecursionlimit(10000)
+
+
+def nested(depth):
+    sql = "SELECT a, b, c FROM t WHERE x = 1"
+    for i in range(depth):
+        sql = f"SELECT a, b, c, a + b AS d{i} FROM ({sql}) AS q{i} WHERE a > {i}"
+    return sqlglot.parse_one(sql)
+
+
+def bench(name, trees):
+    nodes = sum(1 for tree in trees for _ in tree.walk_nodes())
+    print(f"{name}: {len(trees)} queries, {nodes} nodes")
+
+    for pretty in (False, True):
+        # The trees aren't mutated by generation when copy=False, so they can be reused across runs
+        seconds = (
+            min(
+                timeit.repeat(
+                    lambda: [tree.sql(pretty=pretty, copy=False) for tree in trees],
+                    number=10,
+                    repeat=5,
+                )
+            )
+            / 10
+        )
+
+        mode = "pretty" if pretty else "compact"
+        print(f"  {mode + ':':8} {seconds * 1000:.2f} ms ({nodes / seconds / 1e6:.2f}M nodes/s)")
+
+
+bench(
+    "tpc-h",
+    [sqlglot.parse_one(sql) for _, sql, _ in load_sql_fixture_pairs("optimizer/tpc-h/tpc-h.sql")],
+)
+
+for depth in (50, 100, 200):
+    bench(f"nested subqueries, depth {depth}", [nested(depth)])
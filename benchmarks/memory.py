@@ -0,0 +1,28 @@
+import gc
+import sys
+import tracemalloc
+
+import sqlglot
+from tests.helpers import load_sql_fixture_pairs
+
+# Run from the repository root: python -m benchmarks.memory
+sqls = [sql for _, sql, _ in load_sql_fixture_pairs("optimizer/tpc-ds/tpc-ds.sql")]
+
+# Warm up the tokenizer and parser so their tables aren't counted
+sqlglot.parse_one("SELECT 1")
+gc.collect()
+
+tracemalloc.start()
+trees = [sqlglot.parse_one(sql) for sql in sqls]
+gc.collect()
+size, _ = tracemalloc.get_traced_memory()
+tracemalloc.stop()
+
+nodes = [node for tree in trees for node in tree.walk_nodes()]
+args = sum(sys.getsizeof(node.args) for node in nodes)
+
+print(f"queries:   {len(trees)}")
+print(f"nodes:     {len(nodes)}")
+print(f"total:     {size / 1e6:.2f} MB ({size / len(nodes):.0f} bytes per node)")
+print(f"instances: {sum(sys.getsizeof(node) for node in nodes) / 1e6:.2f} MB")
+print(f"args:      {args / 1e6:.2f} MB")
@@ -0,0 +1,340 @@
+"""
+An asyncio client for Doris, so that a single process can keep hundreds of queries in flight.
+
+Queries run on a pool of connections to the MySQL-protocol port of the FE, with a bound on the
+number of queries that run at once. A query that times out or whose task is cancelled is killed on
+the server with `KILL QUERY`, instead of being left to run. Transpiling is CPU-bound, so `transpile`
+runs it in a process pool, off the event loop:
+
+    >>> async def handle(sql):  # doctest: +SKIP
+    ...     async with AsyncDorisClient("127.0.0.1", 9030, "root", "", "tpch") as client:
+    ...         return await client.transpile_and_query(sql, read="presto", timeout=30)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import logging
+import typing as t
+from concurrent.futures import Executor, ProcessPoolExecutor
+
+from pydoris import dorisApi
+from pydoris.batchFetch import (
+    COM_QUERY,
+    MAX_PACKET_SIZE,
+    ColumnBatch,
+    DorisError,
+    _auth_switch_response,
+    _error,
+    _frame,
+    _handshake_response,
+    _is_end,
+    _parse_column,
+    _parse_handshake,
+    _read_length,
+    _split_row,
+    _to_array,
+)
+
+logger = logging.getLogger("pydoris")
+
+_executor: t.Optional[Executor] = None
+
+
+class AsyncConnection:
+    """A minimal asyncio connection to the MySQL-protocol port of a Doris FE."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self._reader = reader
+        self._writer = writer
+        self._sequence = 0
+        self.connection_id = 0
+
+    @classmethod
+    async def connect(
+        cls,
+        host: str,
+        port: int | str,
+        user: str,
+        password: str = "",
+        database: t.Optional[str] = None,
+    ) -> AsyncConnection:
+        reader, writer = await asyncio.open_connection(host, int(port))
+        connection = cls(reader, writer)
+
+        try:
+            await connection._handshake(user, password, database)
+        except BaseException:
+            connection.close()
+            raise
+
+        return connection
+
+    async def query(self, sql: str) -> t.Optional[ColumnBatch]:
+        """
+        Runs a statement and returns its whole result as a single batch, or None if the statement
+        has no result set.
+        """
+        self._sequence = 0
+        await self._write_packet(bytes([COM_QUERY]) + sql.encode())
+        packet = await self._read_packet()
+
+        if packet[0] == 0xFF:
+            raise _error(packet)
+        if packet[0] == 0x00:
+            return None
+
+        num_columns, _ = _read_length(packet, 0)
+        columns = [_parse_column(await self._read_packet()) for _ in range(num_columns)]
+        await self._read_packet()  # EOF
+
+        buffers: t.List[t.List[t.Any]] = [[] for _ in columns]
+
+        while True:
+            packet = await self._read_packet()
+            if _is_end(packet):
+                if packet[0] == 0xFF:
+                    raise _error(packet)
+                break
+
+            _split_row(packet, buffers)
+
+        return ColumnBatch(
+            {column.name: _to_array(column, buffer) for column, buffer in zip(columns, buffers)}
+        )
+
+    def close(self) -> None:
+        self._writer.close()
+
+    async def _handshake(self, user: str, password: str, database: t.Optional[str]) -> None:
+        packet = await self._read_packet()
+        if packet[0] == 0xFF:
+            raise _error(packet)
+
+        self.connection_id, scramble = _parse_handshake(packet)
+        await self._write_packet(_handshake_response(user, password, database, scramble))
+
+        packet = await self._read_packet()
+        if packet[0] == 0xFE:
+            await self._write_packet(_auth_switch_response(packet, password))
+            packet = await self._read_packet()
+        if packet[0] == 0xFF:
+            raise _error(packet)
+
+    async def _write_packet(self, payload: bytes) -> None:
+        data, self._sequence = _frame(payload, self._sequence)
+        self._writer.write(data)
+        await self._writer.drain()
+
+    async def _read_packet(self) -> bytes:
+        payload = b""
+
+        while True:
+            header = await self._reader.readexactly(4)
+            length = header[0] | header[1] << 8 | header[2] << 16
+            self._sequence = (header[3] + 1) & 0xFF
+            payload += await self._reader.readexactly(length)
+
+            if length < MAX_PACKET_SIZE:
+                return payload
+
+
+class AsyncDorisClient:
+    """
+    Runs queries concurrently on a pool of connections.
+
+    Args:
+        host: the host of the FE.
+        port: the query port of the FE.
+        user: the user to connect as.
+        password: the password of the user.
+        database: the default database of the connections, if any.
+        pool_size: the maximum number of idle connections that are kept open.
+        max_concurrency: the maximum number of queries that run at once, which defaults to
+            `pool_size`. Other queries wait for a slot.
+        timeout: the default timeout of a query, in seconds, including the wait for a slot.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int | str,
+        user: str,
+        password: str = "",
+        database: t.Optional[str] = None,
+        pool_size: int = 10,
+        max_concurrency: t.Optional[int] = None,
+        timeout: t.Optional[float] = None,
+    ):
+        self.host = host
+        self.port = int(port)
+        self.user = user
+        self.password = password
+        self.database = database
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self._slots = asyncio.Semaphore(max_concurrency or pool_size)
+        self._idle: t.List[AsyncConnection] = []
+        self._kills: t.Set[asyncio.Task] = set()
+
+    async def query(self, sql: str, timeout: t.Optional[float] = None) -> t.Optional[ColumnBatch]:
+        """
+        Runs a statement and returns its result, or None if it has no result set.
+
+        Raises:
+            asyncio.TimeoutError: if the statement didn't complete within the timeout, in which case
+                it's killed.
+            DorisError: if the server returned an error.
+        """
+        return (await self.execute_many([sql], timeout=timeout))[0]
+
+    async def execute_many(
+        self, statements: t.Sequence[str], timeout: t.Optional[float] = None
+    ) -> t.List[t.Optional[ColumnBatch]]:
+        """
+        Runs statements in order, on the same connection, so that they share session variables.
+
+        Args:
+            statements: the statements.
+            timeout: the timeout of all the statements, which defaults to that of the client.
+
+        Returns:
+            The result of each statement.
+        """
+        return await asyncio.wait_for(
+            self._execute_many(statements), self.timeout if timeout is None else timeout
+        )
+
+    async def transpile_and_query(
+        self,
+        sql: str,
+        read: str,
+        write: str = "doris",
+        timeout: t.Optional[float] = None,
+        executor: t.Optional[Executor] = None,
+        **opts: t.Any,
+    ) -> t.List[t.Optional[ColumnBatch]]:
+        """
+        Transpiles SQL into Doris SQL off the event loop, then runs the resulting statements.
+
+        Args:
+            sql: the SQL to transpile, which may contain several statements.
+            read: the dialect of `sql`.
+            write: the dialect to run the statements in.
+            timeout: the timeout of the statements, which doesn't include transpiling.
+            executor: the executor to transpile in, which defaults to a shared process pool.
+            **opts: other `dorisApi.transpile` options.
+
+        Returns:
+            The result of each statement.
+        """
+        statements = await transpile(sql, read=read, write=write, executor=executor, **opts)
+        return await self.execute_many(statements, timeout=timeout)
+
+    async def close(self) -> None:
+        """Closes the idle connections and waits for the pending kills."""
+        idle, self._idle = self._idle, []
+        for connection in idle:
+            connection.close()
+
+        if self._kills:
+            await asyncio.gather(*self._kills, return_exceptions=True)
+
+    async def __aenter__(self) -> AsyncDorisClient:
+        return self
+
+    async def __aexit__(self, *args: t.Any) -> None:
+        await self.close()
+
+    async def _execute_many(self, statements: t.Sequence[str]) -> t.List[t.Optional[ColumnBatch]]:
+        async with self._slots:
+            connection = await self._acquire()
+
+            try:
+                results = [await connection.query(statement) for statement in statements]
+            except DorisError:
+                # The statement failed, but the connection is still in a clean state
+                self._release(connection)
+                raise
+            except asyncio.CancelledError:
+                # Also raised by wait_for when the timeout expires
+                connection.close()
+                self._kill(connection.connection_id)
+                raise
+            except BaseException:
+                connection.close()
+                raise
+
+            self._release(connection)
+            return results
+
+    async def _acquire(self) -> AsyncConnection:
+        if self._idle:
+            return self._idle.pop()
+
+        return await AsyncConnection.connect(
+            self.host, self.port, self.user, self.password, self.database
+        )
+
+    def _release(self, connection: AsyncConnection) -> None:
+        if len(self._idle) < self.pool_size:
+            self._idle.append(connection)
+        else:
+            connection.close()
+
+    def _kill(self, connection_id: int) -> None:
+        """Kills the query running on a connection, in the background."""
+
+        async def _kill() -> None:
+            try:
+                connection = await AsyncConnection.connect(
+                    self.host, self.port, self.user, self.password
+                )
+                try:
+                    await connection.query(f"KILL QUERY {connection_id}")
+                finally:
+                    connection.close()
+            except (OSError, DorisError) as e:
+                logger.warning("Could not kill the query of connection %s: %s", connection_id, e)
+
+        task = asyncio.ensure_future(_kill())
+        self._kills.add(task)
+        task.add_done_callback(self._kills.discard)
+
+
+def _get_executor() -> Executor:
+    global _executor
+
+    if _executor is None:
+        _executor = ProcessPoolExecutor()
+    return _executor
+
+
+async def transpile(
+    sql: str,
+    read: t.Optional[str] = None,
+    write: t.Optional[str] = "doris",
+    executor: t.Optional[Executor] = None,
+    **opts: t.Any,
+) -> t.List[str]:
+    """
+    Runs `dorisApi.transpile` in an executor, so that parsing and generating SQL doesn't block the
+    event loop.
+
+    Args:
+        sql: the SQL to transpile.
+        read: the source dialect.
+        write: the target dialect.
+        executor: the executor to run in, which defaults to a process pool that's shared by all the
+            calls, since transpiling holds the GIL.
+        **opts: other `dorisApi.transpile` options, e.g. `case_sensitive` or `pretty`.
+
+    Returns:
+        The transpiled statements.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        executor or _get_executor(),
+        functools.partial(dorisApi.transpile, sql, read=read, write=write, **opts),
+    )
@@ -0,0 +1,420 @@
+"""
+Columnar, batched fetching of Doris query results over the MySQL protocol.
+
+A DB-API cursor builds a tuple of Python objects per row, which `query_to_dataframe` then transposes
+into columns. Here, the row packets are split straight into one buffer of raw values per column, and
+each batch of `batch_size` rows is converted into NumPy arrays by vectorized casts, so no row or
+per-value Python object is built for integer, float and temporal columns:
+
+    >>> with DorisConnection("127.0.0.1", 9030, "root", "", "tpch") as conn:  # doctest: +SKIP
+    ...     for batch in conn.iter_batches("SELECT * FROM lineitem", batch_size=65536):
+    ...         process(batch.to_pandas())
+
+Only one batch is held in memory at a time, so results bigger than memory can be streamed. Batches
+can also be converted to Arrow record batches, if pyarrow is installed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from decimal import Decimal
+import socket
+import struct
+import typing as t
+
+import numpy as np
+
+if t.TYPE_CHECKING:
+    import pandas as pd
+
+# Capability flags of the client
+CLIENT_LONG_PASSWORD = 1
+CLIENT_CONNECT_WITH_DB = 1 << 3
+CLIENT_PROTOCOL_41 = 1 << 9
+CLIENT_TRANSACTIONS = 1 << 13
+CLIENT_SECURE_CONNECTION = 1 << 15
+CLIENT_PLUGIN_AUTH = 1 << 19
+
+CAPABILITIES = (
+    CLIENT_LONG_PASSWORD
+    | CLIENT_PROTOCOL_41
+    | CLIENT_TRANSACTIONS
+    | CLIENT_SECURE_CONNECTION
+    | CLIENT_PLUGIN_AUTH
+)
+
+COM_QUERY = 3
+UTF8MB4_GENERAL_CI = 45
+MAX_PACKET_SIZE = 0xFFFFFF
+UNSIGNED_FLAG = 32
+NULL = 0xFB
+
+# Column type codes, grouped by the dtype their values are cast to. Decimals are decoded into object
+# arrays of Decimals, so that they keep their precision, and values of other types, e.g. strings,
+# LARGEINT or TIME, into object arrays of strings
+INT_TYPES = {1, 2, 3, 8, 9, 13}
+FLOAT_TYPES = {4, 5}
+DECIMAL_TYPES = {0, 246}
+DATE_TYPES = {10, 14}
+DATETIME_TYPES = {7, 12}
+
+
+class DorisError(Exception):
+    """Raised when the server returns an error"""
+
+    def __init__(self, code: int, message: str):
+        super().__init__(f"({code}) {message}")
+        self.code = code
+
+
+class Column(t.NamedTuple):
+    name: str
+    type: int
+    flags: int
+
+    @property
+    def dtype(self) -> t.Optional[np.dtype]:
+        if self.type in INT_TYPES:
+            return np.dtype(np.uint64 if self.flags & UNSIGNED_FLAG else np.int64)
+        if self.type in FLOAT_TYPES:
+            return np.dtype(np.float64)
+        if self.type in DATE_TYPES:
+            return np.dtype("datetime64[D]")
+        if self.type in DATETIME_TYPES:
+            return np.dtype("datetime64[us]")
+        return None
+
+
+class ColumnBatch:
+    """
+    A batch of rows, stored column by column.
+
+    Integer columns with NULLs are returned as floats, with NaN for NULL, like `pandas.read_sql`
+    does. Decimals are returned as `Decimal` objects, with None for NULL, and dates that can't be
+    represented, e.g. 0000-00-00, as NaT.
+    """
+
+    def __init__(self, columns: t.Dict[str, np.ndarray]):
+        self.columns = columns
+
+    @property
+    def num_rows(self) -> int:
+        return len(next(iter(self.columns.values()))) if self.columns else 0
+
+    def to_pandas(self) -> pd.DataFrame:
+        import pandas as pd
+
+        # The frame is backed by the arrays of the batch, instead of copies of them
+        return pd.DataFrame(self.columns, copy=False)
+
+    def to_arrow(self) -> t.Any:
+        """Returns the batch as a `pyarrow.RecordBatch`, which reuses the buffers of numeric columns."""
+        import pyarrow as pa
+
+        return pa.RecordBatch.from_arrays(
+            [pa.array(array, from_pandas=True) for array in self.columns.values()],
+            names=list(self.columns),
+        )
+
+
+class DorisConnection:
+    """
+    A minimal connection to the MySQL-protocol port of a Doris FE, which only runs queries.
+
+    Args:
+        host: the host of the FE.
+        port: the query port of the FE.
+        user: the user to connect as.
+        password: the password of the user.
+        database: the default database, if any.
+        timeout: the socket timeout, in seconds.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int | str,
+        user: str,
+        password: str = "",
+        database: t.Optional[str] = None,
+        timeout: t.Optional[float] = None,
+    ):
+        self._socket = socket.create_connection((host, int(port)), timeout=timeout)
+        self._file = self._socket.makefile("rb")
+        self._sequence = 0
+
+        try:
+            self._handshake(user, password, database)
+        except BaseException:
+            self.close()
+            raise
+
+    def iter_batches(self, sql: str, batch_size: int = 65536) -> t.Iterator[ColumnBatch]:
+        """
+        Runs a query and yields its result in batches of `batch_size` rows.
+
+        Statements without a result set yield nothing. If the iteration is stopped early, the rest
+        of the result is read and discarded, so that the connection can be reused.
+        """
+        self._send_command(COM_QUERY, sql.encode())
+        packet = self._read_packet()
+
+        if packet[0] == 0xFF:
+            raise _error(packet)
+        if packet[0] == 0x00:
+            return
+
+        num_columns, _ = _read_length(packet, 0)
+        columns = [self._read_column() for _ in range(num_columns)]
+        self._read_packet()  # EOF
+
+        done = False
+        try:
+            while not done:
+                buffers: t.List[t.List[t.Any]] = [[] for _ in columns]
+                num_rows = 0
+
+                while num_rows < batch_size:
+                    packet = self._read_packet()
+                    if _is_end(packet):
+                        done = True
+                        if packet[0] == 0xFF:
+                            raise _error(packet)
+                        break
+
+                    _split_row(packet, buffers)
+                    num_rows += 1
+
+                if num_rows:
+                    yield ColumnBatch(
+                        {
+                            column.name: _to_array(column, buffer)
+                            for column, buffer in zip(columns, buffers)
+                        }
+                    )
+        finally:
+            while not done:
+                done = _is_end(self._read_packet())
+
+    def query_to_dataframe(self, sql: str, batch_size: int = 65536) -> pd.DataFrame:
+        """Runs a query and returns its whole result as a DataFrame."""
+        import pandas as pd
+
+        frames = [batch.to_pandas() for batch in self.iter_batches(sql, batch_size)]
+        if not frames:
+            return pd.DataFrame()
+        return pd.concat(frames, ignore_index=True)
+
+    def execute(self, sql: str) -> None:
+        """Runs a statement and discards its result, if any."""
+        for _ in self.iter_batches(sql):
+            pass
+
+    def close(self) -> None:
+        self._file.close()
+        self._socket.close()
+
+    def __enter__(self) -> DorisConnection:
+        return self
+
+    def __exit__(self, *args: t.Any) -> None:
+        self.close()
+
+    def _handshake(self, user: str, password: str, database: t.Optional[str]) -> None:
+        packet = self._read_packet()
+        if packet[0] == 0xFF:
+            raise _error(packet)
+
+        self.connection_id, scramble = _parse_handshake(packet)
+        self._write_packet(_handshake_response(user, password, database, scramble))
+
+        packet = self._read_packet()
+        if packet[0] == 0xFE:
+            self._write_packet(_auth_switch_response(packet, password))
+            packet = self._read_packet()
+        if packet[0] == 0xFF:
+            raise _error(packet)
+
+    def _read_column(self) -> Column:
+        return _parse_column(self._read_packet())
+
+    def _send_command(self, command: int, payload: bytes) -> None:
+        self._sequence = 0
+        self._write_packet(bytes([command]) + payload)
+
+    def _write_packet(self, payload: bytes) -> None:
+        data, self._sequence = _frame(payload, self._sequence)
+        self._socket.sendall(data)
+
+    def _read_packet(self) -> bytes:
+        payload = b""
+
+        while True:
+            header = self._file.read(4)
+            if len(header) < 4:
+                raise ConnectionError("Lost connection to the server")
+
+            length = header[0] | header[1] << 8 | header[2] << 16
+            self._sequence = (header[3] + 1) & 0xFF
+            payload += self._file.read(length)
+
+            if length < MAX_PACKET_SIZE:
+                return payload
+
+
+def _parse_handshake(packet: bytes) -> t.Tuple[int, bytes]:
+    """Returns the connection id and the scramble of the server's initial handshake packet."""
+    # Protocol version, then the NUL-terminated server version
+    offset = packet.index(b"\0", 1) + 1
+    connection_id = struct.unpack_from("<I", packet, offset)[0]
+    # The first 8 bytes of the scramble follow the connection id
+    scramble = packet[offset + 4 : offset + 12]
+    # A filler, the capabilities, the charset and the status flags precede the scramble length
+    offset += 20
+    scramble_length = packet[offset]
+    # The rest of the scramble follows 10 reserved bytes and ends with a NUL
+    offset += 11
+    scramble += packet[offset : offset + max(13, scramble_length - 8) - 1]
+    return connection_id, scramble
+
+
+def _handshake_response(
+    user: str, password: str, database: t.Optional[str], scramble: bytes
+) -> bytes:
+    flags = CAPABILITIES | (CLIENT_CONNECT_WITH_DB if database else 0)
+    auth = _scramble_native_password(password, scramble)
+
+    response = struct.pack("<IIB23x", flags, MAX_PACKET_SIZE, UTF8MB4_GENERAL_CI)
+    response += user.encode() + b"\0" + bytes([len(auth)]) + auth
+    if database:
+        response += database.encode() + b"\0"
+    return response + b"mysql_native_password\0"
+
+
+def _auth_switch_response(packet: bytes, password: str) -> bytes:
+    # The plugin name and a new scramble follow the status byte
+    end = packet.index(b"\0", 1)
+    if packet[1:end] != b"mysql_native_password":
+        raise DorisError(0, f"Unsupported auth plugin {packet[1:end].decode()}")
+    return _scramble_native_password(password, packet[end + 1 :].rstrip(b"\0"))
+
+
+def _parse_column(packet: bytes) -> Column:
+    offset = 0
+    values = []
+
+    # Catalog, schema, table, original table, name and original name
+    for _ in range(6):
+        length, offset = _read_length(packet, offset)
+        values.append(packet[offset : offset + length])
+        offset += length
+
+    # The length of the fixed fields, the charset and the column length
+    offset += 7
+    type, flags = struct.unpack_from("<BH", packet, offset)
+    return Column(values[4].decode(), type, flags)
+
+
+def _frame(payload: bytes, sequence: int) -> t.Tuple[bytes, int]:
+    """Splits a payload into packets, returning them along with the next sequence id."""
+    packets = []
+
+    for start in range(0, len(payload) + 1, MAX_PACKET_SIZE):
+        chunk = payload[start : start + MAX_PACKET_SIZE]
+        packets.append(struct.pack("<I", len(chunk))[:3] + bytes([sequence]) + chunk)
+        sequence = (sequence + 1) & 0xFF
+
+    return b"".join(packets), sequence
+
+
+def _error(packet: bytes) -> DorisError:
+    code = struct.unpack_from("<H", packet, 1)[0]
+    # The SQL state marker and the SQL state precede the message
+    message = packet[9:] if packet[3:4] == b"#" else packet[3:]
+    return DorisError(code, message.decode(errors="replace"))
+
+
+def _scramble_native_password(password: str, scramble: bytes) -> bytes:
+    if not password:
+        return b""
+
+    stage1 = hashlib.sha1(password.encode()).digest()
+    stage2 = hashlib.sha1(stage1).digest()
+    mask = hashlib.sha1(scramble + stage2).digest()
+    return bytes(a ^ b for a, b in zip(stage1, mask))
+
+
+def _read_length(packet: bytes, offset: int) -> t.Tuple[int, int]:
+    """Reads a length-encoded integer, returning it along with the offset that follows it."""
+    first = packet[offset]
+    if first < 0xFB:
+        return first, offset + 1
+    if first == 0xFC:
+        return packet[offset + 1] | packet[offset + 2] << 8, offset + 3
+    if first == 0xFD:
+        return int.from_bytes(packet[offset + 1 : offset + 4], "little"), offset + 4
+    return int.from_bytes(packet[offset + 1 : offset + 9], "little"), offset + 9
+
+
+def _is_end(packet: bytes) -> bool:
+    """Whether a packet is the EOF or the ERR packet that ends a result set"""
+    return packet[0] == 0xFF or (packet[0] == 0xFE and len(packet) < 9)
+
+
+def _split_row(packet: bytes, buffers: t.List[t.List[t.Any]]) -> None:
+    """Appends the raw values of a text-protocol row to the buffers of their columns."""
+    offset = 0
+
+    for buffer in buffers:
+        length = packet[offset]
+
+        if length == NULL:
+            buffer.append(None)
+            offset += 1
+            continue
+        if length < NULL:
+            offset += 1
+        else:
+            length, offset = _read_length(packet, offset)
+
+        buffer.append(packet[offset : offset + length])
+        offset += length
+
+
+def _to_array(column: Column, values: t.List[t.Optional[bytes]]) -> np.ndarray:
+    dtype = column.dtype
+
+    if column.type in DECIMAL_TYPES:
+        return np.array(
+            [None if value is None else Decimal(value.decode()) for value in values], dtype=object
+        )
+
+    if dtype is None:
+        return np.array(
+            [None if value is None else value.decode() for value in values], dtype=object
+        )
+
+    has_nulls = None in values
+
+    if dtype.kind == "M":
+        raw = [b"NaT" if value is None else value for value in values] if has_nulls else values
+        try:
+            return np.array(raw, dtype=bytes).astype(dtype)
+        except ValueError:
+            return np.array([_to_datetime64(value, dtype) for value in values], dtype=dtype)
+
+    if has_nulls:
+        return np.array([b"nan" if value is None else value for value in values]).astype(np.float64)
+
+    return np.array(values, dtype=bytes).astype(dtype)
+
+
+def _to_datetime64(value: t.Optional[bytes], dtype: np.dtype) -> np.datetime64:
+    """Parses a single date or datetime, which is NaT if it's NULL or invalid, e.g. 0000-00-00."""
+    if value is None:
+        return np.datetime64("NaT")
+
+    try:
+        return np.datetime64(value.decode()).astype(dtype)
+    except ValueError:
+        return np.datetime64("NaT")
@@ -0,0 +1,532 @@
+"""
+Transpiles a file of SQL statements into Doris SQL and runs them, overlapping parsing with execution.
+
+The statements are streamed from the file and transpiled on a process pool, while a bounded pool of
+Doris connections runs the ones that are transpiled, so neither the file nor its transpiled form is
+held in memory at once. Statements run concurrently unless they depend on each other:
+
+    - a query or DML statement waits for the earlier statements that write a table it reads or
+      writes, and for the earlier ones that read a table it writes,
+    - DDL and other statements whose effects are unknown are barriers: they wait for all the
+      earlier statements, and all the later ones wait for them,
+    - session statements, e.g. USE or SET, are barriers too, and are replayed on every connection.
+
+Usage:
+
+    python -m pydoris.pipeline migration.sql --host 127.0.0.1 --port 9030 --user root --read presto
+
+A summary of the throughput and of the latency of each stage is printed at the end.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+import threading
+import time
+import typing as t
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from dataclasses import dataclass, field
+
+from sqlglot import exp
+from sqlglot.dialects.dialect import Dialect
+from sqlglot.optimizer.qualify_tables import qualify_tables
+
+from pydoris import dorisApi
+from pydoris.batchFetch import DorisConnection
+
+logger = logging.getLogger("pydoris")
+
+DML = "dml"
+BARRIER = "barrier"
+SESSION = "session"
+
+DML_TYPES = (exp.Subqueryable, exp.Insert, exp.Update, exp.Delete, exp.Merge)
+SESSION_TYPES = (exp.Use, exp.Set)
+
+# The stages of a statement, each measured from the end of the previous one:
+#   transpile: until it's transpiled, including the wait for a process,
+#   ordering: until the statements before it in the file are transpiled,
+#   dependencies: until the statements it depends on have run,
+#   connection: until a connection is free,
+#   execute: until it has run.
+STAGES = ("transpile", "ordering", "dependencies", "connection", "execute")
+
+
+@dataclass
+class Statement:
+    """A statement of the file, along with the statements it was transpiled into"""
+
+    index: int
+    source: str
+    sqls: t.List[str] = field(default_factory=list)
+    kind: str = DML
+    reads: t.FrozenSet[str] = frozenset()
+    writes: t.FrozenSet[str] = frozenset()
+    error: t.Optional[str] = None
+    times: t.Dict[str, float] = field(default_factory=dict)
+
+
+class Metrics:
+    """The throughput of a pipeline and the latency of each stage of its statements."""
+
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        self.finished = self.started
+        self.statements = 0
+        self.latencies: t.Dict[str, t.List[float]] = {stage: [] for stage in STAGES}
+
+    def record(self, statement: Statement) -> None:
+        times = statement.times
+        previous = times["submitted"]
+
+        for stage in STAGES:
+            if stage not in times:
+                break
+            self.latencies[stage].append(times[stage] - previous)
+            previous = times[stage]
+
+        self.statements += 1
+        self.finished = time.perf_counter()
+
+    @property
+    def elapsed(self) -> float:
+        return self.finished - self.started
+
+    @property
+    def throughput(self) -> float:
+        return self.statements / self.elapsed if self.elapsed else 0.0
+
+    def summary(self) -> str:
+        lines = [
+            f"{self.statements} statements in {self.elapsed:.2f}s ({self.throughput:.1f}/s)",
+            f"{'stage':<14}{'p50':>10}{'p95':>10}{'max':>10}",
+        ]
+
+        for stage, latencies in self.latencies.items():
+            if latencies:
+                latencies = sorted(latencies)
+                p50 = latencies[len(latencies) // 2]
+                p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+                lines.append(
+                    f"{stage:<14}"
+                    + "".join(f"{latency * 1000:>8.1f}ms" for latency in (p50, p95, latencies[-1]))
+                )
+
+        return "\n".join(lines)
+
+
+class PipelineError(Exception):
+    def __init__(self, statement: Statement, message: str):
+        super().__init__(f"Statement {statement.index + 1} failed: {message}\n{statement.source}")
+        self.statement = statement
+
+
+def iter_statements(lines: t.Iterable[str], escapes: t.Collection[str] = ()) -> t.Iterator[str]:
+    """
+    Splits SQL into statements on semicolons, lazily, skipping the ones in strings, quoted
+    identifiers and comments.
+
+    Args:
+        lines: the SQL, e.g. an open file.
+        escapes: the characters that escape the next one in strings, e.g. a backslash in MySQL.
+    """
+    buffer: t.List[str] = []
+    quote = None
+    block_comment = False
+
+    for line in lines:
+        start = i = 0
+
+        while i < len(line):
+            char = line[i]
+
+            if block_comment:
+                if line.startswith("*/", i):
+                    block_comment = False
+                    i += 1
+            elif quote:
+                if char in escapes:
+                    i += 1
+                elif char == quote:
+                    quote = None
+            elif char in "'\"`":
+                quote = char
+            elif line.startswith("--", i):
+                break
+            elif line.startswith("/*", i):
+                block_comment = True
+                i += 1
+            elif char == ";":
+                buffer.append(line[start:i])
+                statement = "".join(buffer).strip()
+                if statement:
+                    yield statement
+                buffer = []
+                start = i + 1
+
+            i += 1
+
+        buffer.append(line[start:])
+
+    statement = "".join(buffer).strip()
+    if statement:
+        yield statement
+
+
+def transpile_statement(
+    index: int, source: str, read: str, write: str, opts: t.Dict[str, t.Any]
+) -> Statement:
+    """
+    Transpiles a statement like `dorisApi.transpile`, and finds the tables it reads and writes.
+    This runs in the processes of the pipeline.
+    """
+    statement = Statement(index, source)
+    dialect = Dialect.get_or_raise(write)
+    case_sensitive = opts.pop("case_sensitive", None)
+    reads: t.Set[str] = set()
+    writes: t.Set[str] = set()
+
+    try:
+        for expression in dorisApi.parse(source, read):
+            if not expression:
+                continue
+
+            if isinstance(expression, SESSION_TYPES):
+                statement.kind = SESSION
+            elif not isinstance(expression, DML_TYPES) and statement.kind == DML:
+                statement.kind = BARRIER
+
+            target = expression.this if isinstance(expression, DML_TYPES) else None
+            target = target if isinstance(target, exp.Table) else target and target.find(exp.Table)
+            ctes = {cte.alias for cte in expression.find_all(exp.CTE)}
+
+            for table in expression.find_all(exp.Table):
+                # Only table names are compared, so that `t` and `db.t` are assumed to be the same
+                name = table.name.lower()
+                if table is target:
+                    writes.add(name)
+                elif name not in ctes:
+                    reads.add(name)
+
+            expression = qualify_tables(expression, case_sensitive=case_sensitive)
+            statement.sqls.append(dialect.generate(expression, copy=False, **opts))
+    except Exception as e:
+        statement.error = str(e)
+
+    statement.reads = frozenset(reads)
+    statement.writes = frozenset(writes)
+    return statement
+
+
+class Pipeline:
+    """
+    Transpiles and runs statements, see the module's docstring.
+
+    Args:
+        host: the host of the FE.
+        port: the query port of the FE.
+        user: the user to connect as.
+        password: the password of the user.
+        database: the default database of the connections, if any.
+        read: the dialect of the statements.
+        write: the dialect to run the statements in.
+        transpile_workers: the number of processes that transpile statements.
+        connections: the number of statements that run at once.
+        max_pending: the maximum number of statements read from the file that haven't run yet,
+            which bounds memory use.
+        dry_run: whether to print the transpiled statements, in order, instead of running them.
+        output: where the transpiled statements of a dry run are printed, which defaults to stdout.
+        **opts: other `dorisApi.transpile` options, e.g. `case_sensitive`.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int | str = 9030,
+        user: str = "root",
+        password: str = "",
+        database: t.Optional[str] = None,
+        read: str = "presto",
+        write: str = "doris",
+        transpile_workers: t.Optional[int] = None,
+        connections: int = 8,
+        max_pending: t.Optional[int] = None,
+        dry_run: bool = False,
+        output: t.TextIO = sys.stdout,
+        **opts: t.Any,
+    ):
+        self.connect = lambda: DorisConnection(host, port, user, password, database)
+        self.read = read
+        self.write = write
+        self.transpile_workers = transpile_workers
+        self.connections = connections
+        self.max_pending = max_pending or 4 * connections
+        self.dry_run = dry_run
+        self.output = output
+        self.opts = opts
+
+        self._local = threading.local()
+        self._opened: t.List[DorisConnection] = []
+        self._session: t.List[str] = []
+
+    def run(self, statements: t.Iterable[str]) -> Metrics:
+        """
+        Transpiles and runs statements.
+
+        Args:
+            statements: the statements, e.g. the output of `iter_statements`.
+
+        Returns:
+            The metrics of the run.
+
+        Raises:
+            PipelineError: if a statement couldn't be transpiled or run. The statements that were
+                running are completed, but no other one is started.
+        """
+        with ProcessPoolExecutor(self.transpile_workers) as transpiler, ThreadPoolExecutor(
+            self.connections
+        ) as executor:
+            try:
+                return _Scheduler(self, transpiler, executor).run(iter(statements))
+            finally:
+                executor.shutdown(wait=True)
+                for connection in self._opened:
+                    connection.close()
+
+    def execute(self, statement: Statement) -> Statement:
+        """Runs a transpiled statement on the connection of the current thread."""
+        statement.times["connection"] = time.perf_counter()
+        connection = getattr(self._local, "connection", None)
+
+        if connection is None:
+            connection = self._local.connection = self.connect()
+            self._local.applied = 0
+            self._opened.append(connection)
+
+        for sql in self._session[self._local.applied :]:
+            connection.execute(sql)
+
+        for sql in statement.sqls:
+            connection.execute(sql)
+
+        if statement.kind == SESSION:
+            # This is a barrier, so no other statement is running
+            self._session.extend(statement.sqls)
+
+        self._local.applied = len(self._session)
+        statement.times["execute"] = time.perf_counter()
+        return statement
+
+
+class _Scheduler:
+    def __init__(
+        self, pipeline: Pipeline, transpiler: ProcessPoolExecutor, executor: ThreadPoolExecutor
+    ):
+        self.pipeline = pipeline
+        self.transpiler = transpiler
+        self.executor = executor
+        self.metrics = Metrics()
+
+        self.transpiling: t.Dict[Future, Statement] = {}
+        self.running: t.Dict[Future, Statement] = {}
+        # Transpiled statements that wait for the ones before them to be transpiled
+        self.transpiled: t.Dict[int, Statement] = {}
+        self.next_index = 0
+
+        # The statements that were admitted and haven't run yet, mapped to the number of
+        # statements they wait for and to the statements that wait for them
+        self.waiting_for: t.Dict[int, int] = {}
+        self.dependents: t.Dict[int, t.List[Statement]] = {}
+        self.last_writer: t.Dict[str, int] = {}
+        self.readers: t.Dict[str, t.Set[int]] = {}
+        self.last_barrier: t.Optional[int] = None
+
+        self.error: t.Optional[PipelineError] = None
+
+    @property
+    def pending(self) -> int:
+        return len(self.transpiling) + len(self.transpiled) + len(self.dependents)
+
+    def run(self, statements: t.Iterator[str]) -> Metrics:
+        exhausted = False
+        index = 0
+
+        while True:
+            while not exhausted and not self.error and self.pending < self.pipeline.max_pending:
+                source = next(statements, None)
+                if source is None:
+                    exhausted = True
+                    break
+
+                future = self.transpiler.submit(
+                    transpile_statement,
+                    index,
+                    source,
+                    self.pipeline.read,
+                    self.pipeline.write,
+                    dict(self.pipeline.opts),
+                )
+                self.transpiling[future] = Statement(
+                    index, source, times={"submitted": time.perf_counter()}
+                )
+                index += 1
+
+            if not self.transpiling and not self.running:
+                break
+
+            done, _ = wait([*self.transpiling, *self.running], return_when=FIRST_COMPLETED)
+
+            for future in done:
+                if future in self.transpiling:
+                    self._on_transpiled(future)
+                else:
+                    self._on_executed(future)
+
+        if self.error:
+            raise self.error
+        return self.metrics
+
+    def _on_transpiled(self, future: Future) -> None:
+        submitted = self.transpiling.pop(future)
+        if future.cancelled():
+            return
+
+        statement = future.result()
+        statement.times = {**submitted.times, "transpile": time.perf_counter()}
+        self.transpiled[statement.index] = statement
+
+        while self.next_index in self.transpiled and not self.error:
+            self._admit(self.transpiled.pop(self.next_index))
+            self.next_index += 1
+
+    def _admit(self, statement: Statement) -> None:
+        statement.times["ordering"] = time.perf_counter()
+
+        if statement.error is not None:
+            self._fail(statement, statement.error)
+            return
+
+        if self.pipeline.dry_run:
+            for sql in statement.sqls:
+                self.pipeline.output.write(f"{sql};\n")
+            self.metrics.record(statement)
+            return
+
+        index = statement.index
+        dependencies: t.Set[int] = set()
+
+        if statement.kind == DML:
+            for table in statement.reads | statement.writes:
+                if table in self.last_writer:
+                    dependencies.add(self.last_writer[table])
+            for table in statement.writes:
+                dependencies |= self.readers.pop(table, set())
+                self.last_writer[table] = index
+            for table in statement.reads:
+                self.readers.setdefault(table, set()).add(index)
+            if self.last_barrier is not None:
+                dependencies.add(self.last_barrier)
+        else:
+            dependencies = set(self.dependents)
+            self.last_writer.clear()
+            self.readers.clear()
+            self.last_barrier = index
+
+        dependencies = {i for i in dependencies if i in self.dependents}
+        self.dependents[index] = []
+        self.waiting_for[index] = len(dependencies)
+
+        for dependency in dependencies:
+            self.dependents[dependency].append(statement)
+
+        if not dependencies:
+            self._dispatch(statement)
+
+    def _dispatch(self, statement: Statement) -> None:
+        statement.times["dependencies"] = time.perf_counter()
+        self.running[self.executor.submit(self.pipeline.execute, statement)] = statement
+
+    def _on_executed(self, future: Future) -> None:
+        statement = self.running.pop(future)
+        error = future.exception()
+
+        if error:
+            self._fail(statement, str(error))
+            return
+
+        self.metrics.record(statement)
+        self.waiting_for.pop(statement.index)
+
+        for dependent in self.dependents.pop(statement.index):
+            self.waiting_for[dependent.index] -= 1
+            if not self.waiting_for[dependent.index] and not self.error:
+                self._dispatch(dependent)
+
+    def _fail(self, statement: Statement, message: str) -> None:
+        if not self.error:
+            self.error = PipelineError(statement, message)
+
+            for future in self.transpiling:
+                future.cancel()
+
+
+def main(argv: t.Optional[t.Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("file", help="the file of SQL statements, or - for stdin")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9030)
+    parser.add_argument("--user", default="root")
+    parser.add_argument("--password", default="")
+    parser.add_argument("--database")
+    parser.add_argument("--read", default="presto", help="the dialect of the statements")
+    parser.add_argument("--write", default="doris", help="the dialect to run the statements in")
+    parser.add_argument("--transpile-workers", type=int, help="defaults to the number of CPUs")
+    parser.add_argument("--connections", type=int, default=8)
+    parser.add_argument("--max-pending", type=int)
+    parser.add_argument("--case-sensitive", action="store_true")
+    parser.add_argument(
+        "--dry-run", action="store_true", help="print the transpiled statements instead"
+    )
+    args = parser.parse_args(argv)
+
+    pipeline = Pipeline(
+        host=args.host,
+        port=args.port,
+        user=args.user,
+        password=args.password,
+        database=args.database,
+        read=args.read,
+        write=args.write,
+        transpile_workers=args.transpile_workers,
+        connections=args.connections,
+        max_pending=args.max_pending,
+        dry_run=args.dry_run,
+        case_sensitive=args.case_sensitive,
+    )
+    escapes = Dialect.get_or_raise(args.read).tokenizer_class.STRING_ESCAPES
+    escapes = [escape for escape in escapes if escape not in "'\"`"]
+
+    file = sys.stdin if args.file == "-" else open(args.file, encoding="utf-8")
+
+    try:
+        metrics = pipeline.run(iter_statements(file, escapes))
+    except PipelineError as e:
+        print(e, file=sys.stderr)
+        return 1
+    finally:
+        file.close()
+
+    print(metrics.summary(), file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,10 @@
 from pydoris.doris_client import *
 from pydoris.util.generate_test_data import *
+from pydoris.streamLoad import StreamLoadWriter, csv_chunks
+from pydoris.batchFetch import DorisConnection
+from pydoris.asyncClient import AsyncDorisClient
+import asyncio
+from pydoris.pipeline import Pipeline, iter_statements
 
 fe_host = "10.16.10.6"
 fe_http_port = "8141"
@@ -77,6 +82,18 @@ def test_write_json():
     doris_client.write("test.write_test", json_data, options=options)
 
 
+# Streams the rows in chunks of about 64MB, loading 4 chunks at a time, instead of building the whole
+# payload as one string. Reusing the label prefix skips the chunks that an earlier run already loaded
+def test_write_stream_load():
+    writer = StreamLoadWriter(fe_host, fe_http_port, username, passwd, "pydoris_client_test", "write_test",
+                              options={"column_separator": ","}, parallelism=4,
+                              label_prefix="write_test_20231231")
+    with writer:
+        rows = (row for _ in range(10) for row in gen_test_data(100000))
+        results = writer.write(csv_chunks(rows, max_bytes=64 << 20, column_separator=","))
+    print(sum(result["NumberLoadedRows"] for result in results))
+
+
 # data_df: pd.DataFrame, table_name: str, table_model: str is must
 # When repeat_replacement = True, tables with duplicate names will be deleted，be careful
 def test_write_from_df():
@@ -97,12 +114,41 @@ def test_read_to_df():
         print(dataframe)
 
 
+# Decodes the result column by column, in batches of 65536 rows, so that results bigger than memory
+# can be processed one batch at a time
+def test_read_batches():
+    with DorisConnection(fe_host, fe_query_port, username, passwd, "pydoris_client_test") as conn:
+        for batch in conn.iter_batches("select * from write_test", batch_size=65536):
+            print(batch.to_pandas().describe())
+
+
 def test_query(query):
     result = doris_client.query(query)
     print(result)
 
 
 
+# Transpiles and runs many Presto queries concurrently from a single thread: at most 50 run at once,
+# and a query that takes more than 60 seconds is killed
+def test_async_transpile_and_query(queries):
+    async def run():
+        async with AsyncDorisClient(fe_host, fe_query_port, username, passwd, db,
+                                    pool_size=50, timeout=60) as client:
+            return await asyncio.gather(*[client.transpile_and_query(query, read="presto")
+                                          for query in queries], return_exceptions=True)
+
+    for result in asyncio.run(run()):
+        print(result)
+
+
+# Migrates a file of Presto statements: statements on unrelated tables run on 8 connections at
+# once, while DDL and session statements run alone
+def test_run_migration(path):
+    pipeline = Pipeline(fe_host, fe_query_port, username, passwd, db, read="presto", connections=8)
+    with open(path) as file:
+        print(pipeline.run(iter_statements(file)).summary())
+
+
 def test_list_tables():
     tables = doris_client.list_tables("pydoris_client_test")
     print(tables)
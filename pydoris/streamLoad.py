@@ -0,0 +1,363 @@
+"""
+Bulk writes to Doris through Stream Load, without building the whole payload in memory.
+
+The data is given as an iterable of chunks, e.g. the output of `csv_chunks` or `dataframe_chunks`,
+and each chunk is loaded with its own label. Up to `parallelism` chunks are loaded at once over
+keep-alive connections, and the iterable is only advanced when a load slot is free, so that memory
+use is bounded by `parallelism` times the size of a chunk, whatever the size of the data:
+
+    >>> writer = StreamLoadWriter("127.0.0.1", 8030, "root", "", "db", "tbl")  # doctest: +SKIP
+    >>> writer.write(csv_chunks(rows, max_bytes=64 << 20))  # doctest: +SKIP
+
+Each chunk is loaded atomically, but the chunks aren't loaded in a single transaction: if a load
+fails, the chunks that were already loaded stay visible.
+"""
+
+from __future__ import annotations
+
+import base64
+import csv
+import http.client
+import io
+import json
+import logging
+import queue
+import threading
+import time
+import typing as t
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+logger = logging.getLogger("pydoris")
+
+# The statuses of a load whose data was committed. Publish Timeout means that the transaction was
+# committed, but that the data isn't visible on every replica yet
+SUCCESS_STATUSES = ("Success", "Publish Timeout")
+
+# The statuses of the job that holds a label when a retried load finds it already taken
+FINISHED_JOB_STATUSES = ("FINISHED", "VISIBLE")
+
+Chunk = t.Union[bytes, str]
+
+
+class StreamLoadError(Exception):
+    """Raised when a load fails, with the response of the last attempt, if any"""
+
+    def __init__(self, message: str, result: t.Optional[t.Dict[str, t.Any]] = None):
+        super().__init__(message)
+        self.result = result
+
+
+class ConnectionPool:
+    """
+    Keep-alive HTTP connections, pooled per host and port.
+
+    Args:
+        max_size: the maximum number of idle connections that are kept per host and port.
+        timeout: the socket timeout of the connections, in seconds.
+    """
+
+    def __init__(self, max_size: int = 8, timeout: float = 600):
+        self.max_size = max_size
+        self.timeout = timeout
+        self._idle: t.Dict[t.Tuple[str, int], queue.LifoQueue] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, host: str, port: int) -> http.client.HTTPConnection:
+        """Returns an idle connection to `host:port`, or a new one if there's none."""
+        with self._lock:
+            idle = self._idle.setdefault((host, port), queue.LifoQueue(self.max_size))
+
+        try:
+            return idle.get_nowait()
+        except queue.Empty:
+            return http.client.HTTPConnection(host, port, timeout=self.timeout)
+
+    def release(self, connection: http.client.HTTPConnection, reusable: bool = True) -> None:
+        """Returns a connection to the pool, or closes it if it can't be reused."""
+        idle = self._idle.get((connection.host, connection.port))
+
+        if reusable and idle is not None:
+            try:
+                idle.put_nowait(connection)
+                return
+            except queue.Full:
+                pass
+
+        connection.close()
+
+    def close(self) -> None:
+        """Closes all the idle connections."""
+        with self._lock:
+            idles, self._idle = list(self._idle.values()), {}
+
+        for idle in idles:
+            while not idle.empty():
+                idle.get_nowait().close()
+
+
+class StreamLoadWriter:
+    """
+    Loads chunks of data into a Doris table through Stream Load.
+
+    Each load is sent to the FE, which redirects it to a BE, as `curl --location-trusted` would.
+    Loads that fail because of the network or of a server error are retried with the same label,
+    so a chunk is never loaded twice, even if the response to a successful load was lost.
+
+    Args:
+        fe_host: the host of the FE.
+        fe_http_port: the HTTP port of the FE.
+        username: the user to load the data as.
+        password: the password of the user.
+        db: the database of the table.
+        table: the table to load the data into.
+        format: the format of the chunks, e.g. "csv" or "json".
+        options: other Stream Load headers, e.g. {"columns": "a, b"} or {"read_json_by_line": "true"}.
+        parallelism: the number of chunks that are loaded concurrently.
+        max_retries: the number of times a failed load is retried.
+        retry_backoff: the delay before the first retry, in seconds, which doubles on each retry.
+        label_prefix: the prefix of the labels of the loads, which are suffixed with the position of
+            their chunk. A random one is generated if it's omitted.
+        pool: the connections to use, which are shared with other writers if it's given.
+    """
+
+    def __init__(
+        self,
+        fe_host: str,
+        fe_http_port: int | str,
+        username: str,
+        password: str,
+        db: str,
+        table: str,
+        format: str = "csv",
+        options: t.Optional[t.Dict[str, str]] = None,
+        parallelism: int = 4,
+        max_retries: int = 3,
+        retry_backoff: float = 1.0,
+        label_prefix: t.Optional[str] = None,
+        pool: t.Optional[ConnectionPool] = None,
+    ):
+        self.fe_host = fe_host
+        self.fe_http_port = int(fe_http_port)
+        self.db = db
+        self.table = table
+        self.parallelism = parallelism
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.label_prefix = label_prefix or f"pydoris_{db}_{table}_{uuid.uuid4().hex}"
+        self.pool = pool or ConnectionPool(max_size=parallelism)
+        self._owns_pool = pool is None
+
+        credentials = base64.b64encode(f"{username}:{password}".encode()).decode()
+        self.headers = {
+            "Authorization": f"Basic {credentials}",
+            "Expect": "100-continue",
+            "format": format,
+            **(options or {}),
+        }
+
+    @property
+    def path(self) -> str:
+        return f"/api/{self.db}/{self.table}/_stream_load"
+
+    def write(self, chunks: t.Iterable[Chunk]) -> t.List[t.Dict[str, t.Any]]:
+        """
+        Loads every chunk of `chunks`, concurrently.
+
+        Args:
+            chunks: the data, in the format of the writer. Empty chunks are skipped.
+
+        Returns:
+            The responses of the loads, in the order of their chunks.
+
+        Raises:
+            StreamLoadError: if a chunk couldn't be loaded. No more chunks are loaded after that.
+        """
+        slots = threading.BoundedSemaphore(self.parallelism)
+        futures: t.List[Future] = []
+        failed = threading.Event()
+
+        def _release(future: Future) -> None:
+            if future.exception():
+                failed.set()
+            slots.release()
+
+        with ThreadPoolExecutor(max_workers=self.parallelism) as executor:
+            for index, chunk in enumerate(chunks):
+                if not chunk:
+                    continue
+
+                slots.acquire()
+                if failed.is_set():
+                    slots.release()
+                    break
+
+                future = executor.submit(self.load, chunk, f"{self.label_prefix}_{index}")
+                future.add_done_callback(_release)
+                futures.append(future)
+
+        return [future.result() for future in futures]
+
+    def load(self, data: Chunk, label: str) -> t.Dict[str, t.Any]:
+        """
+        Loads a single chunk of data, with retries.
+
+        Args:
+            data: the chunk to load.
+            label: the label of the load, which must be unique in the database.
+
+        Returns:
+            The response of the load.
+        """
+        body = data.encode() if isinstance(data, str) else data
+        delay = self.retry_backoff
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                result = self._load(body, label)
+            except (OSError, http.client.HTTPException) as e:
+                error: Exception = e
+            else:
+                status = result.get("Status")
+
+                if status in SUCCESS_STATUSES:
+                    return result
+                if status != "Label Already Exists":
+                    raise StreamLoadError(
+                        f"Stream load {label} failed: {result.get('Message')} "
+                        f"(see {result.get('ErrorURL')})",
+                        result,
+                    )
+                if result.get("ExistingJobStatus") in FINISHED_JOB_STATUSES:
+                    # The chunk was loaded by an earlier attempt, or by an earlier run of the
+                    # same labels, whose response was lost
+                    return result
+
+                error = StreamLoadError(f"Stream load {label} is still running", result)
+
+            if attempt < self.max_retries:
+                logger.warning("Retrying stream load %s in %.1fs: %s", label, delay, error)
+                time.sleep(delay)
+                delay *= 2
+
+        raise StreamLoadError(
+            f"Stream load {label} failed after {self.max_retries + 1} attempts: {error}",
+            getattr(error, "result", None),
+        ) from error
+
+    def _load(self, body: bytes, label: str) -> t.Dict[str, t.Any]:
+        headers = {**self.headers, "label": label}
+
+        # The FE only redirects the load, so the body is only sent to the BE it redirects to
+        status, location, response = self._request(
+            self.fe_host, self.fe_http_port, self.path, headers, b""
+        )
+
+        if status == 307 and location:
+            url = urlsplit(location)
+            path = f"{url.path}?{url.query}" if url.query else url.path
+            status, _, response = self._request(
+                url.hostname or self.fe_host, url.port or 80, path, headers, body
+            )
+
+        if status >= 500:
+            raise http.client.HTTPException(f"HTTP {status}: {response[:200]!r}")
+
+        try:
+            return json.loads(response)
+        except ValueError:
+            raise StreamLoadError(f"HTTP {status}: {response[:200]!r}")
+
+    def _request(
+        self, host: str, port: int, path: str, headers: t.Dict[str, str], body: bytes
+    ) -> t.Tuple[int, t.Optional[str], bytes]:
+        connection = self.pool.acquire(host, port)
+        reusable = False
+
+        try:
+            connection.request("PUT", path, body=body, headers=headers)
+            response = connection.getresponse()
+            content = response.read()
+            reusable = not response.will_close
+            return response.status, response.getheader("Location"), content
+        finally:
+            self.pool.release(connection, reusable)
+
+    def close(self) -> None:
+        if self._owns_pool:
+            self.pool.close()
+
+    def __enter__(self) -> StreamLoadWriter:
+        return self
+
+    def __exit__(self, *args: t.Any) -> None:
+        self.close()
+
+
+def csv_chunks(
+    rows: t.Iterable[t.Sequence[t.Any]],
+    max_bytes: int = 64 << 20,
+    column_separator: str = "\t",
+    line_delimiter: str = "\n",
+) -> t.Iterator[bytes]:
+    """
+    Serializes rows into CSV chunks of about `max_bytes` each, lazily.
+
+    The separators must match the `column_separator` and `line_delimiter` options of the writer,
+    whose defaults are a tab and a newline.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, delimiter=column_separator, lineterminator=line_delimiter)
+
+    for row in rows:
+        writer.writerow(row)
+
+        if buffer.tell() >= max_bytes:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+def json_chunks(
+    records: t.Iterable[t.Dict[str, t.Any]], max_bytes: int = 64 << 20
+) -> t.Iterator[bytes]:
+    """
+    Serializes records into chunks of JSON lines of about `max_bytes` each, lazily.
+
+    The writer needs the `{"read_json_by_line": "true"}` option to load them.
+    """
+    lines: t.List[bytes] = []
+    size = 0
+
+    for record in records:
+        line = json.dumps(record, default=str).encode() + b"\n"
+        lines.append(line)
+        size += len(line)
+
+        if size >= max_bytes:
+            yield b"".join(lines)
+            lines, size = [], 0
+
+    if lines:
+        yield b"".join(lines)
+
+
+def dataframe_chunks(df: t.Any, rows_per_chunk: int = 100_000, **opts: t.Any) -> t.Iterator[bytes]:
+    """
+    Serializes a pandas DataFrame into CSV chunks of `rows_per_chunk` rows, so that only one chunk
+    is held as text at a time, instead of the whole frame.
+
+    Args:
+        df: the DataFrame.
+        rows_per_chunk: the number of rows of each chunk.
+        **opts: other `DataFrame.to_csv` options, e.g. `sep`, which default to a headerless,
+            tab-separated CSV without the index.
+    """
+    opts = {"header": False, "index": False, "sep": "\t", **opts}
+
+    for start in range(0, len(df), rows_per_chunk):
+        yield df.iloc[start : start + rows_per_chunk].to_csv(**opts).encode()
@@ -114,7 +114,7 @@ class SparkSession:
             if isinstance(expression, exp.Insert):
                 select_expression.set("with", expression.args.get("with"))
                 expression.set("with", None)
-            del expression.args["expression"]
+            expression.set("expression", None)
             df = DataFrame(self, select_expression, output_expression_container=expression)  # type: ignore
             df = df._convert_leaf_to_cte()
         else:
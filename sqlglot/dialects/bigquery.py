@@ -51,7 +51,7 @@ def _derived_table_values_to_unnest(self: BigQuery.Generator, expression: exp.Va
                 )
             ]
         )
-        for t in expression.find_all(exp.Tuple)
+        for t in expression.rows
     ]
 
     return self.unnest_sql(exp.Unnest(expressions=[exp.Array(expressions=structs)]))
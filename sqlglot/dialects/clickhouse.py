@@ -550,7 +550,8 @@ class ClickHouse(Dialect):
             join = super()._parse_join(skip_join_token=skip_join_token, parse_bracket=True)
 
             if join:
-                join.set("global", join.args.pop("method", None))
+                join.set("global", join.args.get("method"))
+                join.set("method", None)
             return join
 
         def _parse_function(
@@ -449,6 +449,15 @@ class Dialect(metaclass=_Dialect):
     def generate(self, expression: exp.Expression, copy: bool = True, **opts) -> str:
         return self.generator(**opts).generate(expression, copy=copy)
 
+    def generate_to(
+        self,
+        expression: exp.Expression,
+        stream: t.Union[t.TextIO, t.List[str]],
+        copy: bool = True,
+        **opts,
+    ) -> None:
+        self.generator(**opts).generate_to(expression, stream, copy=copy)
+
     def transpile(self, sql: str, **opts) -> t.List[str]:
         return [
             self.generate(expression, copy=False, **opts) if expression else ""
@@ -526,7 +535,7 @@ def no_paren_current_date_sql(self: Generator, expression: exp.CurrentDate) -> s
 def no_recursive_cte_sql(self: Generator, expression: exp.With) -> str:
     if expression.args.get("recursive"):
         self.unsupported("Recursive CTEs are unsupported")
-        expression.args["recursive"] = False
+        expression.set("recursive", False)
     return self.with_sql(expression)
 
 
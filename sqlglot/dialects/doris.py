@@ -6,12 +6,12 @@ from sqlglot import exp, generator
 from sqlglot.dialects.dialect import (
     approx_count_distinct_sql,
     count_if_to_sum,
-    parse_timestamp_trunc,
     rename_func,
     time_format,
 )
 from sqlglot.dialects.mysql import MySQL
 from sqlglot.dialects.tsql import DATE_DELTA_INTERVAL
+from sqlglot.helper import seq_get
 
 
 def handle_date_trunc(self, expression: exp.DateTrunc | exp.DateTrunc_oracle) -> str:
@@ -266,7 +266,9 @@ class Doris(MySQL):
             "COUNTEQUAL": exp.Repeat.from_arg_list,
             "COLLECT_LIST": exp.ArrayAgg.from_arg_list,
             "COLLECT_SET": exp.ArrayUniqueAgg.from_arg_list,
-            "DATE_TRUNC": parse_timestamp_trunc,
+            "DATE_TRUNC": lambda args: exp.TimestampTrunc(
+                this=seq_get(args, 0), unit=seq_get(args, 1)
+            ),
             "FROM_UNIXTIME": exp.StrToUnix.from_arg_list,
             "GROUP_ARRAY": exp.ArrayAgg.from_arg_list,
             "LAST_DAY": exp.LastDay.from_arg_list,
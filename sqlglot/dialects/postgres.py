@@ -54,7 +54,7 @@ def _date_add_sql(kind: str) -> t.Callable[[Postgres.Generator, DATE_ADD_OR_SUB]
         if not isinstance(expression, exp.Literal):
             self.unsupported("Cannot add non literal")
 
-        expression.args["is_string"] = True
+        expression.set("is_string", True)
         return f"{this} {kind} {self.sql(exp.Interval(this=expression, unit=unit))}"
 
     return func
@@ -120,7 +120,7 @@ def _auto_increment_to_serial(expression: exp.Expression) -> exp.Expression:
     auto = expression.find(exp.AutoIncrementColumnConstraint)
 
     if auto:
-        expression.args["constraints"].remove(auto.parent)
+        t.cast(exp.Expression, auto.parent).pop()
         kind = expression.args["kind"]
 
         if kind.this == exp.DataType.Type.INT:
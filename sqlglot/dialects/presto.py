@@ -75,7 +75,9 @@ def _schema_sql(self: Presto.Generator, expression: exp.Schema) -> str:
         for schema in expression.parent.find_all(exp.Schema):
             column_defs = schema.find_all(exp.ColumnDef)
             if column_defs and isinstance(schema.parent, exp.Property):
+                # The column definitions are shared with the schema, so they're not reparented
                 expression.expressions.extend(column_defs)
+                expression._mutated()
 
     return self.schema_sql(expression)
 
@@ -47,7 +47,7 @@ def _transform_create(expression: exp.Expression) -> exp.Expression:
             column.append(
                 "constraints", exp.ColumnConstraint(kind=exp.PrimaryKeyColumnConstraint())
             )
-            schema.expressions.remove(primary_key)
+            primary_key.pop()
         else:
             for column in defs.values():
                 auto_increment = None
@@ -799,7 +799,8 @@ class TSQL(Dialect):
 
         def create_sql(self, expression: exp.Create) -> str:
             kind = self.sql(expression, "kind").upper()
-            exists = expression.args.pop("exists", None)
+            exists = expression.args.get("exists")
+            expression.set("exists", None)
             sql = super().create_sql(expression)
 
             table = expression.find(exp.Table)
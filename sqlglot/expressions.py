@@ -13,6 +13,7 @@ SQL expressions, such as `sqlglot.expressions.select`.
 from __future__ import annotations
 
 import datetime
+import heapq
 import math
 import numbers
 import re
@@ -20,7 +21,7 @@ import textwrap
 import typing as t
 from collections import deque
 from copy import deepcopy
-from enum import auto
+from enum import Enum, auto
 from functools import reduce
 
 from sqlglot._typing import E
@@ -41,6 +42,9 @@ if t.TYPE_CHECKING:
 
 class _Expression(type):
     def __new__(cls, clsname, bases, attrs):
+        # Expressions only store state in the slots declared by Expression, so subclasses don't
+        # need a per-instance __dict__
+        attrs.setdefault("__slots__", ())
         klass = super().__new__(cls, clsname, bases, attrs)
 
         # When an Expression class is created, its key is automatically set to be
@@ -92,6 +96,9 @@ class Expression(metaclass=_Expression):
     arg_types = {"this": True}
     __slots__ = ("args", "parent", "arg_key", "comments", "_type", "_meta", "_hash")
 
+    # The number of mutations made through the Expression API, across all trees
+    _mutations: t.ClassVar[int] = 0
+
     def __init__(self, **args: t.Any):
         self.args: t.Dict[str, t.Any] = args
         self.parent: t.Optional[Expression] = None
@@ -116,10 +123,41 @@ class Expression(metaclass=_Expression):
         )
 
     def __hash__(self) -> int:
-        if self._hash is not None:
-            return self._hash
+        if self._hash is None:
+            # Descendants are hashed first, bottom-up, so that hashing a deep tree doesn't recurse
+            # all the way down. Nodes with a cached hash only have descendants with cached hashes
+            stack = [self]
+            nodes = []
+
+            while stack:
+                node = stack.pop()
+                nodes.append(node)
+
+                for vs in node.args.values():
+                    if type(vs) is list:
+                        stack.extend(v for v in vs if isinstance(v, Expression) and v._hash is None)
+                    elif isinstance(vs, Expression) and vs._hash is None:
+                        stack.append(vs)
+
+            for node in reversed(nodes):
+                node._hash = hash((node.__class__, node.hashable_args))
+        return t.cast(int, self._hash)
 
-        return hash((self.__class__, self.hashable_args))
+    def _mutated(self) -> None:
+        """
+        Records that the args of this expression changed.
+
+        This clears the cached hash of this expression and of its ancestors, since they depend on
+        it. A cached hash implies that the hashes of all the descendants are cached as well, so we
+        can stop at the first ancestor whose hash isn't. It also bumps the mutation counter, which
+        tells `TypeIndex` instances that they need to be rebuilt.
+        """
+        Expression._mutations += 1
+
+        node: t.Optional[Expression] = self
+        while node is not None and node._hash is not None:
+            node._hash = None
+            node = node.parent
 
     @property
     def this(self) -> t.Any:
@@ -253,30 +291,63 @@ class Expression(metaclass=_Expression):
         return self._meta
 
     def __deepcopy__(self, memo):
-        copy = self.__class__(**deepcopy(self.args))
-        if self.comments is not None:
-            copy.comments = deepcopy(self.comments)
-
-        if self._type is not None:
-            copy._type = self._type.copy()
-
-        if self._meta is not None:
-            copy._meta = deepcopy(self._meta)
-
-        return copy
+        # The tree is cloned iteratively, so that deep trees don't exhaust the recursion limit
+        root = self.__class__()
+        stack = [(self, root)]
+
+        while stack:
+            node, copy = stack.pop()
+
+            if node.comments is not None:
+                copy.comments = list(node.comments)
+            if node._type is not None:
+                copy._type = node._type.copy()
+            if node._meta is not None:
+                copy._meta = deepcopy(node._meta)
+
+            # The copy is structurally equal, so the cached hash still holds. The args are filled in
+            # directly rather than through set and append, which would clear it again
+            copy._hash = node._hash
+
+            for k, vs in node.args.items():
+                if isinstance(vs, Expression):
+                    stack.append((vs, vs.__class__()))
+                    copy.args[k] = stack[-1][1]
+                elif type(vs) is list:
+                    copy.args[k] = []
+                    for v in vs:
+                        if isinstance(v, Expression):
+                            stack.append((v, v.__class__()))
+                            copy.args[k].append(stack[-1][1])
+                        else:
+                            copy.args[k].append(_copy_arg(v))
+                else:
+                    copy.args[k] = _copy_arg(vs)
+                    continue
+
+                copy._set_parent(k, copy.args[k])
+
+        return root
 
     def copy(self):
         """
         Returns a deep copy of the expression.
         """
-        new = deepcopy(self)
+        new = self.__deepcopy__(None)
         new.parent = self.parent
         return new
 
+    def __reduce__(self):
+        # Pickle the tree through the flat binary format of sqlglot.serde, instead of letting pickle
+        # recurse into the object graph, which is slow and can't handle deep trees
+        from sqlglot.serde import _dump_pickled, _load_pickled
+
+        return _load_pickled, (_dump_pickled(self),)
+
     def add_comments(self, comments: t.Optional[t.List[str]]) -> None:
-        if self.comments is None:
-            self.comments = []
         if comments:
+            if self.comments is None:
+                self.comments = []
             for comment in comments:
                 _, *meta = comment.split(SQLGLOT_META)
                 if meta:
@@ -298,6 +369,7 @@ class Expression(metaclass=_Expression):
             self.args[arg_key] = []
         self.args[arg_key].append(value)
         self._set_parent(arg_key, value)
+        self._mutated()
 
     def set(self, arg_key: str, value: t.Any) -> None:
         """
@@ -307,6 +379,8 @@ class Expression(metaclass=_Expression):
             arg_key: name of the expression arg.
             value: value to set the arg to.
         """
+        self._mutated()
+
         if value is None:
             self.args.pop(arg_key, None)
             return
@@ -370,7 +444,7 @@ class Expression(metaclass=_Expression):
         Returns:
             The generator object.
         """
-        for expression, *_ in self.walk(bfs=bfs):
+        for expression in self.walk_nodes(bfs=bfs):
             if isinstance(expression, expression_types):
                 yield expression
 
@@ -436,13 +510,17 @@ class Expression(metaclass=_Expression):
         Returns:
             The generator object.
         """
-        parent = parent or self.parent
-        yield self, parent, key
-        if prune and prune(self, parent, key):
-            return
+        stack = [(self, parent or self.parent, key)]
+
+        while stack:
+            item, parent, key = stack.pop()
+
+            yield item, parent, key
+            if prune and prune(item, parent, key):
+                continue
 
-        for k, v in self.iter_expressions():
-            yield from v.dfs(self, k, prune)
+            for k, v in reversed(tuple(item.iter_expressions())):
+                stack.append((v, item, k))
 
     def bfs(self, prune=None):
         """
@@ -464,6 +542,40 @@ class Expression(metaclass=_Expression):
             for k, v in item.iter_expressions():
                 queue.append((v, item, k))
 
+    def walk_nodes(
+        self, bfs: bool = True, prune: t.Optional[t.Callable[[Expression], bool]] = None
+    ) -> t.Iterator[Expression]:
+        """
+        Like `walk`, but only yields the nodes, without their parents and arg keys.
+
+        Args:
+            bfs: if set to True the BFS traversal order will be applied,
+                otherwise the DFS traversal will be used instead.
+            prune: callable that returns True if the generator should stop traversing
+                the children of the node it's called with.
+
+        Returns:
+            The generator object.
+        """
+        nodes: t.Deque[Expression] = deque([self])
+        pop = nodes.popleft if bfs else nodes.pop
+
+        while nodes:
+            node = pop()
+
+            yield node
+            if prune and prune(node):
+                continue
+
+            children: t.List[Expression] = []
+            for vs in node.args.values():
+                if type(vs) is list:
+                    children.extend(v for v in vs if isinstance(v, Expression))
+                elif isinstance(vs, Expression):
+                    children.append(vs)
+
+            nodes.extend(children if bfs else reversed(children))
+
     def unnest(self):
         """
         Returns the first non parenthesis child or self.
@@ -892,6 +1004,56 @@ class Expression(metaclass=_Expression):
         return not_(self.copy())
 
 
+class TypeIndex:
+    """
+    Indexes the nodes of a tree by their type, so that repeated searches don't have to walk it.
+
+    The index is rebuilt lazily on the first search after any expression is mutated through
+    `set`, `append`, `replace` or `pop`. Mutating `args` directly is not tracked.
+
+    Example:
+        >>> index = TypeIndex(maybe_parse("SELECT a, b FROM x WHERE c > 1"))
+        >>> [column.name for column in index.find_all(Column)]
+        ['a', 'b', 'c']
+
+    Args:
+        expression: the root of the tree to index.
+    """
+
+    def __init__(self, expression: Expression):
+        self.expression = expression
+        self._nodes: t.Dict[t.Type[Expression], t.List[t.Tuple[int, Expression]]] = {}
+        self._mutations = -1
+
+    def _index(self) -> t.Dict[t.Type[Expression], t.List[t.Tuple[int, Expression]]]:
+        if self._mutations != Expression._mutations:
+            nodes: t.Dict[t.Type[Expression], t.List[t.Tuple[int, Expression]]] = {}
+            for i, node in enumerate(self.expression.walk_nodes()):
+                nodes.setdefault(type(node), []).append((i, node))
+
+            self._nodes = nodes
+            self._mutations = Expression._mutations
+
+        return self._nodes
+
+    def find_all(self, *expression_types: t.Type[E]) -> t.Iterator[E]:
+        """
+        Yields the nodes that match at least one of the specified expression types, in the
+        same order as `Expression.find_all` with BFS.
+        """
+        index = self._index()
+        matches = [nodes for klass, nodes in index.items() if issubclass(klass, expression_types)]
+
+        if len(matches) == 1:
+            return (t.cast(E, node) for _, node in matches[0])
+
+        return (t.cast(E, node) for _, node in heapq.merge(*matches, key=lambda item: item[0]))
+
+    def find(self, *expression_types: t.Type[E]) -> t.Optional[E]:
+        """Returns the first node that matches at least one of the specified expression types."""
+        return next(self.find_all(*expression_types), None)
+
+
 IntoType = t.Union[
     str,
     t.Type[Expression],
@@ -1804,6 +1966,71 @@ class Literal(Condition):
         return self.name
 
 
+class LiteralBlock(Expression):
+    """
+    A compact stand-in for a long run of literals, e.g. the elements of a large IN list or the rows
+    of a bulk INSERT ... VALUES, which keeps their values instead of one node per literal.
+
+    The values are either the text of a string or number literal, None for NULL, or a bool for TRUE
+    and FALSE. They're kept in tuples, which aren't traversed like lists of child nodes are.
+
+    Args:
+        values: the values, row after row if the block stands for tuples.
+        is_string: whether each value is a string literal.
+        width: the number of values in each tuple, if the block stands for tuples.
+    """
+
+    arg_types = {"values": True, "is_string": True, "width": False}
+
+    def __init__(self, **args: t.Any):
+        for key in ("values", "is_string"):
+            if type(args.get(key)) is list:
+                args[key] = tuple(args[key])
+        super().__init__(**args)
+
+    @property
+    def hashable_args(self) -> t.Any:
+        return (self.args["values"], self.args["is_string"], self.args.get("width"))
+
+    @property
+    def size(self) -> int:
+        """The number of nodes that this block stands for, i.e. its literals or its tuples."""
+        return len(self.args["values"]) // (self.args.get("width") or 1)
+
+    def expand(self, limit: t.Optional[int] = None) -> t.List[Expression]:
+        """
+        Returns the literals, or the tuples of literals, that this block stands for.
+
+        Args:
+            limit: the maximum number of literals or tuples to return.
+        """
+        width = self.args.get("width")
+        values = self.args["values"]
+        is_strings = self.args["is_string"]
+        if limit is not None:
+            values = values[: limit * (width or 1)]
+            is_strings = is_strings[: len(values)]
+
+        literals: t.List[Expression] = []
+
+        for value, is_string in zip(values, is_strings):
+            if is_string:
+                literals.append(Literal(this=value, is_string=True))
+            elif value is None:
+                literals.append(Null())
+            elif type(value) is bool:
+                literals.append(Boolean(this=value))
+            elif value.startswith("-"):
+                literals.append(Neg(this=Literal(this=value[1:], is_string=False)))
+            else:
+                literals.append(Literal(this=value, is_string=False))
+
+        if not width:
+            return literals
+
+        return [Tuple(expressions=literals[i : i + width]) for i in range(0, len(literals), width)]
+
+
 class Join(Expression):
     arg_types = {
         "this": True,
@@ -2711,6 +2938,11 @@ class Update(Expression):
 class Values(UDTF):
     arg_types = {"expressions": True, "alias": False}
 
+    @property
+    def rows(self) -> t.List[Expression]:
+        """The rows of this VALUES clause, with literal blocks expanded into tuples."""
+        return expand_literal_blocks(self.expressions)
+
 
 class Var(Expression):
     pass
@@ -5618,6 +5850,14 @@ class NextValueFor(Func):
     arg_types = {"this": True, "order": False}
 
 
+def _copy_arg(arg: t.Any) -> t.Any:
+    # Immutable values are shared between copies, everything else is deep-copied. The only tuples
+    # in args are those of LiteralBlock, which hold immutable values
+    if arg is None or isinstance(arg, (str, int, float, Enum, tuple)):
+        return arg
+    return deepcopy(arg)
+
+
 def _norm_arg(arg):
     return arg.lower() if type(arg) is str else arg
 
@@ -6770,10 +7010,35 @@ def convert(value: t.Any, copy: bool = False) -> Expression:
     raise ValueError(f"Cannot convert {value}")
 
 
+def expand_literal_blocks(expressions: t.Iterable[Expression]) -> t.List[Expression]:
+    """
+    Expands the literal blocks in a list of expressions, e.g. the elements of an IN list.
+
+    Example:
+        >>> import sqlglot
+        >>> expression = sqlglot.parse_one("x IN (" + ", ".join(["1"] * 1000) + ")")
+        >>> len(expression.expressions), len(expand_literal_blocks(expression.expressions))
+        (1, 1000)
+
+    Args:
+        expressions: the expressions to expand.
+
+    Returns:
+        The expressions, with each literal block replaced by the nodes it stands for.
+    """
+    return [
+        node
+        for expression in expressions
+        for node in (expression.expand() if isinstance(expression, LiteralBlock) else [expression])
+    ]
+
+
 def replace_children(expression: Expression, fun: t.Callable, *args, **kwargs) -> None:
     """
     Replace children of an expression with the result of a lambda fun(child) -> exp.
     """
+    changed = False
+
     for k, v in expression.args.items():
         is_list_arg = type(v) is list
 
@@ -6782,15 +7047,22 @@ def replace_children(expression: Expression, fun: t.Callable, *args, **kwargs) -
 
         for cn in child_nodes:
             if isinstance(cn, Expression):
-                for child_node in ensure_collection(fun(cn, *args, **kwargs)):
+                new_nodes = ensure_collection(fun(cn, *args, **kwargs))
+
+                for child_node in new_nodes:
                     new_child_nodes.append(child_node)
                     child_node.parent = expression
                     child_node.arg_key = k
+
+                changed = changed or len(new_nodes) != 1 or child_node is not cn
             else:
                 new_child_nodes.append(cn)
 
         expression.args[k] = new_child_nodes if is_list_arg else seq_get(new_child_nodes, 0)
 
+    if changed:
+        expression._mutated()
+
 
 def column_table_names(expression: Expression, exclude: str = "") -> t.Set[str]:
     """
@@ -20,6 +20,12 @@ logger = logging.getLogger("sqlglot")
 
 ESCAPED_UNICODE_RE = re.compile(r"\\(\d+)")
 
+# The placeholder that stands for the rows of a VALUES clause in `Generator.generate_to`
+STREAMED_VALUES_RE = re.compile(
+    r"__SQLGLOT__VALUES_(\d+)_START__(\n[^\n]*?)__SQLGLOT__VALUES_\1_MIDDLE__"
+    r"(\n[^\n]*?)__SQLGLOT__VALUES_\1_END__"
+)
+
 
 class Generator:
     """
@@ -385,6 +391,10 @@ class Generator:
 
     SENTINEL_LINE_BREAK = "__SQLGLOT__LB__"
 
+    # Maps expression classes to the functions that generate their SQL. Each Generator subclass has
+    # its own table, which is filled lazily by `_resolve_handler`
+    _HANDLERS: t.Dict[t.Type[exp.Expression], t.Callable[[Generator, t.Any], str]] = {}
+
     __slots__ = (
         "pretty",
         "identify",
@@ -399,10 +409,16 @@ class Generator:
         "comments",
         "dialect",
         "unsupported_messages",
+        "_chain_sqls",
+        "_streamed_values",
         "_escaped_quote_end",
         "_escaped_identifier_end",
     )
 
+    def __init_subclass__(cls, **kwargs: t.Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._HANDLERS = {}
+
     def __init__(
         self,
         pretty: t.Optional[bool] = None,
@@ -439,6 +455,13 @@ class Generator:
         )
 
         self.unsupported_messages: t.List[str] = []
+
+        # SQL generated ahead of time for the operands of operator chains, see `_pregenerate_chain`
+        self._chain_sqls: t.Dict[int, t.Tuple[exp.Expression, str]] = {}
+
+        # VALUES clauses whose rows are written directly to the stream, see `generate_to`
+        self._streamed_values: t.Optional[t.List[exp.Values]] = None
+
         self._escaped_quote_end: str = (
             self.dialect.tokenizer_class.STRING_ESCAPES[0] + self.dialect.QUOTE_END
         )
@@ -465,12 +488,111 @@ class Generator:
 
         self.unsupported_messages = []
         sql = self.sql(expression).strip()
+        self._chain_sqls.clear()
+
+        if self.pretty:
+            sql = sql.replace(self.SENTINEL_LINE_BREAK, "\n")
+
+        self.check_unsupported()
+        return sql
+
+    def generate_to(
+        self,
+        expression: exp.Expression,
+        stream: t.Union[t.TextIO, t.List[str]],
+        copy: bool = True,
+    ) -> None:
+        """
+        Writes the SQL string corresponding to the given syntax tree to a stream, in fragments.
+
+        This produces the same SQL as `generate`, but the rows of a top-level VALUES clause, e.g.
+        in `INSERT INTO t VALUES ...`, are generated and written one at a time instead of being
+        joined into a single string first, so large dumps aren't copied over and over in memory.
+
+        Since rows are written as they're generated, an unsupported feature in one of them is
+        only reported, according to `unsupported_level`, after the rest of the SQL was written.
+
+        Args:
+            expression: The syntax tree.
+            stream: The text stream to write to, or a list that fragments are appended to.
+            copy: Whether or not to copy the expression. The generator performs mutations so
+                it is safer to copy.
+        """
+        write = stream.append if isinstance(stream, list) else stream.write
+
+        if copy:
+            expression = expression.copy()
+
+        expression = self.preprocess(expression)
+
+        self.unsupported_messages = []
+        streamed: t.List[exp.Values] = []
+        self._streamed_values = streamed
+        try:
+            sql = self.sql(expression).strip()
+        finally:
+            self._streamed_values = None
+            self._chain_sqls.clear()
 
         if self.pretty:
             sql = sql.replace(self.SENTINEL_LINE_BREAK, "\n")
 
+        position = 0
+        for match in STREAMED_VALUES_RE.finditer(sql):
+            write(sql[position : match.start()])
+            position = match.end()
+
+            # The placeholder spans three lines, so that the prefixes added to its second and last
+            # lines by enclosing indents are the ones that apply to the lines of the actual rows
+            middle = match.group(2)[1:]
+            last = match.group(3)[1:]
+            self._write_rows(streamed[int(match.group(1))], write, middle, last)
+
+        write(sql[position:])
+        self.check_unsupported()
+
+    def _write_rows(
+        self, expression: exp.Values, write: t.Callable[[str], t.Any], middle: str, last: str
+    ) -> None:
+        num_rows = self._num_rows(expression)
+        rows = self._expression_sqls(self._rows(expression), num_rows, sep=", ")
+
+        if not self.pretty:
+            for row in rows:
+                write(row)
+            return
+
+        pad = " " * self.pad
+
+        for i, row in enumerate(rows):
+            lines = row.split("\n")
+            final = len(lines) - 1 if i + 1 == num_rows else -1
+
+            write(
+                "".join(
+                    f"{pad}{line}"
+                    if i == 0 and j == 0
+                    else f"\n{last if j == final else middle}{pad}{line}"
+                    for j, line in enumerate(lines)
+                ).replace(self.SENTINEL_LINE_BREAK, "\n")
+            )
+
+    def _rows(self, expression: exp.Values) -> t.Iterator[str | exp.Expression]:
+        for row in expression.expressions:
+            if isinstance(row, exp.LiteralBlock):
+                yield from self._literal_block_sqls(row)
+            else:
+                yield row
+
+    def _num_rows(self, expression: exp.Values) -> int:
+        return sum(
+            row.size if isinstance(row, exp.LiteralBlock) else 1 for row in expression.expressions
+        )
+
+    def check_unsupported(self) -> None:
+        """Logs or raises the unsupported messages collected so far, according to `unsupported_level`."""
         if self.unsupported_level == ErrorLevel.IGNORE:
-            return sql
+            return
 
         if self.unsupported_level == ErrorLevel.WARN:
             for msg in self.unsupported_messages:
@@ -478,8 +600,6 @@ class Generator:
         elif self.unsupported_level == ErrorLevel.RAISE and self.unsupported_messages:
             raise UnsupportedError(concat_messages(self.unsupported_messages, self.max_unsupported))
 
-        return sql
-
     def preprocess(self, expression: exp.Expression) -> exp.Expression:
         """Apply generic preprocessing transformations to a given expression."""
         if (
@@ -581,14 +701,20 @@ class Generator:
             return sql
 
         pad = self.pad if pad is None else pad
-        lines = sql.split("\n")
+        prefix = " " * (level * self._indent + pad)
+        indented = f"\n{prefix}"
+
+        # Lines are prefixed with a single replace instead of being split and joined, since nested
+        # clauses are indented again at every level of nesting
+        if skip_last:
+            head, newline, last = sql.rpartition("\n")
+            if not newline:
+                return sql
+            sql = f"{head.replace(newline, indented)}{newline}{last}"
+        else:
+            sql = sql.replace("\n", indented)
 
-        return "\n".join(
-            line
-            if (skip_first and i == 0) or (skip_last and i == len(lines) - 1)
-            else f"{' ' * (level * self._indent + pad)}{line}"
-            for i, line in enumerate(lines)
-        )
+        return sql if skip_first else f"{prefix}{sql}"
 
     def sql(
         self,
@@ -608,27 +734,71 @@ class Generator:
                 return self.sql(value)
             return ""
 
-        transform = self.TRANSFORMS.get(expression.__class__)
+        if self._chain_sqls and comment:
+            pregenerated = self._chain_sqls.pop(id(expression), None)
+            if pregenerated:
+                return pregenerated[1]
+
+        handler = self._HANDLERS.get(expression.__class__) or self._resolve_handler(expression)
+        sql = handler(self, expression)
+
+        return self.maybe_comment(sql, expression) if self.comments and comment else sql
+
+    @classmethod
+    def _resolve_handler(cls, expression: exp.Expression) -> t.Callable[[Generator, t.Any], str]:
+        """
+        Finds the function that generates the SQL of the expression's class and caches it, so that
+        `sql` only needs a single lookup per node. Handlers are looked up, in order, in TRANSFORMS,
+        among the `<key>_sql` methods, and finally among the fallbacks for functions and properties.
+        """
+        klass = expression.__class__
+
+        if not isinstance(expression, exp.Expression):
+            raise ValueError(f"Expected an Expression. Received {klass}: {expression}")
+
+        transform = cls.TRANSFORMS.get(klass)
+        handler: t.Optional[t.Callable[[Generator, t.Any], str]] = None
 
         if callable(transform):
-            sql = transform(self, expression)
+            handler = transform
         elif transform:
-            sql = transform
-        elif isinstance(expression, exp.Expression):
-            exp_handler_name = f"{expression.key}_sql"
-
-            if hasattr(self, exp_handler_name):
-                sql = getattr(self, exp_handler_name)(expression)
-            elif isinstance(expression, exp.Func):
-                sql = self.function_fallback_sql(expression)
-            elif isinstance(expression, exp.Property):
-                sql = self.property_sql(expression)
-            else:
-                raise ValueError(f"Unsupported expression type {expression.__class__.__name__}")
-        else:
-            raise ValueError(f"Expected an Expression. Received {type(expression)}: {expression}")
+            handler = lambda self, e: transform  # noqa: E731
+        elif hasattr(cls, f"{klass.key}_sql"):
+            handler = getattr(cls, f"{klass.key}_sql")
+        elif issubclass(klass, exp.Func):
+            handler = cls.function_fallback_sql
+        elif issubclass(klass, exp.Property):
+            handler = cls.property_sql
 
-        return self.maybe_comment(sql, expression) if self.comments and comment else sql
+        if handler is None:
+            raise ValueError(f"Unsupported expression type {klass.__name__}")
+
+        cls._HANDLERS[klass] = handler
+        return handler
+
+    def _pregenerate_chain(self, expression: exp.Binary) -> None:
+        """
+        Generates the left operands of a chain of binary operators, e.g. `a + b + c + ...`, from the
+        bottom up, so that generating `expression` itself doesn't recurse down the whole chain.
+
+        The parser builds such chains as left-deep trees, so a naive recursive generator would
+        exhaust the recursion limit for a few thousand terms. The generated SQL is stashed along
+        with its node, which keeps the node's id from being reused, and the `sql` calls that the
+        handlers make for these operands pick it up instead of recursing.
+        """
+        chain = []
+        node = expression.this
+        while (
+            isinstance(node, exp.Binary)
+            and id(node) not in self._chain_sqls
+            # Pretty connectors generate their whole flattened subtree at once
+            and not (self.pretty and isinstance(node, exp.Connector))
+        ):
+            chain.append(node)
+            node = node.this
+
+        for node in reversed(chain):
+            self._chain_sqls[id(node)] = (node, self.sql(node))
 
     def uncache_sql(self, expression: exp.Uncache) -> str:
         table = self.sql(expression, "this")
@@ -1561,7 +1731,21 @@ class Generator:
     def values_sql(self, expression: exp.Values) -> str:
         # The VALUES clause is still valid in an `INSERT INTO ..` statement, for example
         if self.VALUES_AS_TABLE or not expression.find_ancestor(exp.From, exp.Join):
-            args = self.expressions(expression)
+            streamed = self._streamed_values
+            if (
+                streamed is not None
+                and self._num_rows(expression) > 1
+                and (not expression.parent or isinstance(expression.parent, exp.Insert))
+            ):
+                # The rows are generated later, by `generate_to`, see STREAMED_VALUES_RE
+                index = len(streamed)
+                streamed.append(expression)
+                args = (
+                    f"__SQLGLOT__VALUES_{index}_START__\n__SQLGLOT__VALUES_{index}_MIDDLE__"
+                    f"\n__SQLGLOT__VALUES_{index}_END__"
+                )
+            else:
+                args = self.expressions(expression)
             alias = self.sql(expression, "alias")
             values = f"VALUES{self.seg('')}{args}"
             values = (
@@ -1577,7 +1761,7 @@ class Generator:
 
         selects: t.List[exp.Subqueryable] = []
 
-        for i, tup in enumerate(expression.expressions):
+        for i, tup in enumerate(expression.rows):
             row = tup.expressions
 
             if i == 0 and column_names:
@@ -1780,6 +1964,56 @@ class Generator:
 
         return f"{lock_type}{expressions}{wait or ''}"
 
+    def literalblock_sql(self, expression: exp.LiteralBlock) -> str:
+        sqls = self._literal_block_sqls(expression)
+
+        # Tuples are laid out like the rows of a VALUES clause that aren't part of a block
+        if self.pretty and expression.args.get("width"):
+            return "\n, ".join(sqls) if self.leading_comma else ",\n".join(sqls)
+        return ", ".join(sqls)
+
+    def _literal_block_sqls(self, expression: exp.LiteralBlock) -> t.Iterator[str]:
+        width = expression.args.get("width")
+
+        # The values are formatted directly, unless this generator customizes how any of the nodes
+        # they stand for are generated, in which case these nodes are generated instead
+        if any(
+            klass in self.TRANSFORMS
+            or getattr(self.__class__, f"{klass.key}_sql")
+            is not getattr(Generator, f"{klass.key}_sql")
+            for klass in (exp.Literal, exp.Boolean, exp.Null, exp.Neg, exp.Tuple)
+        ):
+            for node in expression.expand():
+                # The nodes are generated as if they took the block's place, since their SQL may
+                # depend on their parent
+                node.parent = expression.parent
+                node.arg_key = expression.arg_key
+                yield self.sql(node)
+            return
+
+        quote_start = self.dialect.QUOTE_START
+        quote_end = self.dialect.QUOTE_END
+        escape_str = self.escape_str
+
+        def literal(value: t.Any, is_string: bool) -> str:
+            if is_string:
+                return f"{quote_start}{escape_str(value)}{quote_end}"
+            if value is None:
+                return "NULL"
+            if type(value) is bool:
+                return "TRUE" if value else "FALSE"
+            return value
+
+        values = expression.args["values"]
+        is_string = expression.args["is_string"]
+
+        if not width:
+            yield from map(literal, values, is_string)
+            return
+
+        for i in range(0, len(values), width):
+            yield f"({', '.join(map(literal, values[i : i + width], is_string[i : i + width]))})"
+
     def literal_sql(self, expression: exp.Literal) -> str:
         text = expression.this or ""
         if expression.is_string:
@@ -2781,6 +3015,9 @@ class Generator:
         return f"USE{kind}{this}"
 
     def binary(self, expression: exp.Binary, op: str) -> str:
+        if isinstance(expression.this, exp.Binary):
+            self._pregenerate_chain(expression)
+
         op = self.maybe_comment(op, comments=expression.comments)
         return f"{self.sql(expression, 'this')} {op} {self.sql(expression, 'expression')}"
 
@@ -2847,13 +3084,21 @@ class Generator:
         if flat:
             return sep.join(sql for sql in (self.sql(e) for e in expressions) if sql)
 
-        num_sqls = len(expressions)
+        result_sqls = self._expression_sqls(expressions, len(expressions), prefix=prefix, sep=sep)
+        result_sql = "\n".join(result_sqls) if self.pretty else "".join(result_sqls)
+        return self.indent(result_sql, skip_first=skip_first) if indent else result_sql
 
+    def _expression_sqls(
+        self,
+        expressions: t.Iterable[str | exp.Expression],
+        num_sqls: int,
+        prefix: str = "",
+        sep: str = ", ",
+    ) -> t.Iterator[str]:
         # These are calculated once in case we have the leading_comma / pretty option set, correspondingly
         pad = " " * self.pad
         stripped_sep = sep.strip()
 
-        result_sqls = []
         for i, e in enumerate(expressions):
             sql = self.sql(e, comment=False)
             if not sql:
@@ -2863,16 +3108,11 @@ class Generator:
 
             if self.pretty:
                 if self.leading_comma:
-                    result_sqls.append(f"{sep if i > 0 else pad}{prefix}{sql}{comments}")
+                    yield f"{sep if i > 0 else pad}{prefix}{sql}{comments}"
                 else:
-                    result_sqls.append(
-                        f"{prefix}{sql}{stripped_sep if i + 1 < num_sqls else ''}{comments}"
-                    )
+                    yield f"{prefix}{sql}{stripped_sep if i + 1 < num_sqls else ''}{comments}"
             else:
-                result_sqls.append(f"{prefix}{sql}{comments}{sep if i + 1 < num_sqls else ''}")
-
-        result_sql = "\n".join(result_sqls) if self.pretty else "".join(result_sqls)
-        return self.indent(result_sql, skip_first=skip_first) if indent else result_sql
+                yield f"{prefix}{sql}{comments}{sep if i + 1 < num_sqls else ''}"
 
     def op_expressions(self, op: str, expression: exp.Expression, flat: bool = False) -> str:
         flat = flat or isinstance(expression.parent, exp.Properties)
@@ -208,14 +208,11 @@ def while_changing(expression: Expression, func: t.Callable[[Expression], E]) ->
         The transformed expression.
     """
     while True:
-        for n, *_ in reversed(tuple(expression.walk())):
-            n._hash = hash(n)
-
+        # Hashes are cached on the nodes and invalidated when they're mutated, so this is
+        # only computed from scratch for the parts of the tree that changed in the last pass
         start = hash(expression)
         expression = func(expression)
 
-        for n, *_ in expression.walk():
-            n._hash = None
         if start == hash(expression):
             break
 
@@ -0,0 +1,180 @@
+"""
+Declarative structural patterns over syntax trees.
+
+A `Matcher` compiles any number of `Pattern`s into a dispatch table keyed by expression type, so
+that looking for all of them in a tree costs a single walk, instead of one `find_all` per pattern:
+
+    >>> import sqlglot
+    >>> from sqlglot import exp
+    >>> matcher = Matcher(
+    ...     [
+    ...         Pattern("select_star", exp.Star, parent=exp.Select),
+    ...         Pattern("cartesian_join", exp.Join, args={"on": None, "using": None}),
+    ...     ]
+    ... )
+    >>> expression = sqlglot.parse_one("SELECT * FROM a CROSS JOIN b")
+    >>> [(match.pattern, match.expression.sql()) for match in matcher.find(expression)]
+    [('select_star', '*'), ('cartesian_join', 'CROSS JOIN b')]
+"""
+
+from __future__ import annotations
+
+import typing as t
+from dataclasses import dataclass, field
+
+from sqlglot import expressions as exp
+
+if t.TYPE_CHECKING:
+    from sqlglot.dialects.dialect import DialectType
+
+    Types = t.Union[t.Type[exp.Expression], t.Tuple[t.Type[exp.Expression], ...]]
+
+
+# Patterns are compared and hashed by identity, since their constraints can be dicts and callables
+@dataclass(frozen=True, eq=False)
+class Pattern:
+    """
+    Describes the nodes to look for.
+
+    Constraints on args and on the parent can be:
+        - None, which requires the value to be missing (or an empty list),
+        - an expression type or a tuple of types, which the value must be an instance of,
+        - a nested `Pattern`, which the value must match,
+        - any other callable, which is called with the value and must return a truthy value,
+        - any other value, which the value must be equal to.
+
+    Args:
+        name: the name of the pattern, which is reported in its matches.
+        types: the expression type, or tuple of types, that the node must be an instance of.
+        args: constraints on the args of the node, keyed by arg name.
+        parent: a constraint on the parent of the node. There's no constraint if it's omitted.
+        within: the node must have an ancestor of this type, or tuple of types.
+        where: a predicate for anything that the other constraints can't express.
+    """
+
+    name: str
+    types: Types
+    args: t.Dict[str, t.Any] = field(default_factory=dict)
+    parent: t.Any = None
+    within: t.Optional[Types] = None
+    where: t.Optional[t.Callable[[exp.Expression], t.Any]] = None
+
+    def matches(self, expression: exp.Expression) -> bool:
+        """Checks whether `expression` matches this pattern."""
+        if not isinstance(expression, self.types):
+            return False
+
+        for key, constraint in self.args.items():
+            if not _satisfies(expression.args.get(key), constraint):
+                return False
+
+        if self.parent is not None and not _satisfies(expression.parent, self.parent):
+            return False
+        if self.within and not expression.find_ancestor(*_as_tuple(self.within)):
+            return False
+
+        return not self.where or bool(self.where(expression))
+
+
+@dataclass(frozen=True)
+class Match:
+    """A node that matches a pattern"""
+
+    pattern: str
+    expression: exp.Expression
+
+
+class Matcher:
+    """
+    Looks for many patterns at once.
+
+    Each node is only checked against the patterns whose types it's an instance of, and the
+    patterns that apply to each expression class are computed once and cached.
+
+    Args:
+        patterns: the patterns to look for.
+    """
+
+    def __init__(self, patterns: t.Iterable[Pattern]):
+        self.patterns = list(patterns)
+        self._dispatch: t.Dict[t.Type[exp.Expression], t.List[Pattern]] = {}
+
+    def find(self, expression: exp.Expression) -> t.Iterator[Match]:
+        """
+        Finds the nodes of a tree that match any of the patterns, in a single BFS walk.
+
+        Args:
+            expression: the root of the tree.
+
+        Yields:
+            The matches, in BFS order. A node that matches several patterns is reported once per
+            pattern, in the order the patterns were given.
+        """
+        dispatch = self._dispatch
+
+        for node in expression.walk_nodes():
+            klass = node.__class__
+            patterns = dispatch.get(klass)
+
+            if patterns is None:
+                patterns = dispatch[klass] = [
+                    pattern for pattern in self.patterns if issubclass(klass, pattern.types)
+                ]
+
+            for pattern in patterns:
+                if pattern.matches(node):
+                    yield Match(pattern.name, node)
+
+    def scan(
+        self,
+        queries: t.Iterable[str | exp.Expression],
+        dialect: DialectType = None,
+        **opts,
+    ) -> t.Iterator[t.Tuple[int, Match]]:
+        """
+        Finds the matches of a stream of queries, lazily, so that large corpora don't have to be
+        loaded in memory at once.
+
+        Args:
+            queries: the queries, either as syntax trees or as SQL strings. A string may contain
+                several statements.
+            dialect: the dialect used to parse the SQL strings.
+            opts: other options for the parser.
+
+        Yields:
+            Pairs of the position of the query in `queries` and one of its matches.
+        """
+        from sqlglot.dialects.dialect import Dialect
+
+        for index, query in enumerate(queries):
+            if isinstance(query, str):
+                expressions = Dialect.get_or_raise(dialect).parse(query, **opts)
+            else:
+                expressions = [query]
+
+            for expression in expressions:
+                if expression:
+                    for match in self.find(expression):
+                        yield index, match
+
+
+def _as_tuple(types: Types) -> t.Tuple[t.Type[exp.Expression], ...]:
+    return types if isinstance(types, tuple) else (types,)
+
+
+def _is_types(constraint: t.Any) -> bool:
+    if isinstance(constraint, tuple):
+        return bool(constraint) and all(isinstance(c, type) for c in constraint)
+    return isinstance(constraint, type)
+
+
+def _satisfies(value: t.Any, constraint: t.Any) -> bool:
+    if constraint is None:
+        return value is None or value == []
+    if isinstance(constraint, Pattern):
+        return isinstance(value, exp.Expression) and constraint.matches(value)
+    if _is_types(constraint):
+        return isinstance(value, constraint)
+    if callable(constraint):
+        return bool(constraint(value))
+    return value == constraint
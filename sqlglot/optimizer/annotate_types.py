@@ -31,6 +31,7 @@ def annotate_types(
     schema: t.Optional[t.Dict | Schema] = None,
     annotators: t.Optional[t.Dict[t.Type[E], t.Callable[[TypeAnnotator, E], E]]] = None,
     coerces_to: t.Optional[t.Dict[exp.DataType.Type, t.Set[exp.DataType.Type]]] = None,
+    incremental: bool = False,
 ) -> E:
     """
     Infers the types of an expression, annotating its AST accordingly.
@@ -48,6 +49,9 @@ def annotate_types(
         schema: Database schema.
         annotators: Maps expression type to corresponding annotation function.
         coerces_to: Maps expression type to set of types that it can be coerced into.
+        incremental: Only annotate the parts of an already annotated expression that changed,
+            i.e. nodes without a type and their ancestors. Subtrees that kept their types are
+            reused as they are, so changes to the schema itself require a full annotation.
 
     Returns:
         The expression annotated with types.
@@ -55,7 +59,9 @@ def annotate_types(
 
     schema = ensure_schema(schema)
 
-    return TypeAnnotator(schema, annotators, coerces_to).annotate(expression)
+    return TypeAnnotator(schema, annotators, coerces_to).annotate(
+        expression, incremental=incremental
+    )
 
 
 def _annotate_with_type_lambda(data_type: exp.DataType.Type) -> t.Callable[[TypeAnnotator, E], E]:
@@ -94,6 +100,26 @@ def swap_all(coercions: BinaryCoercions) -> BinaryCoercions:
     return {**coercions, **{(b, a): swap_args(func) for (a, b), func in coercions.items()}}
 
 
+def _annotated(expression: exp.Expression) -> t.Set[int]:
+    """
+    Returns the ids of the nodes in `expression` whose types can be reused, i.e. the nodes that
+    are annotated and don't contain any node which isn't. Annotated columns are treated as leaves,
+    since their types don't depend on their children.
+    """
+    nodes = [
+        node
+        for node, *_ in expression.dfs(prune=lambda e, *_: isinstance(e, exp.Column) and e.type)
+    ]
+    stale: t.Set[int] = set()
+
+    # Children come after their parents in a depth-first traversal, so this visits them first
+    for node in reversed(nodes):
+        if node.type is None or id(node) in stale:
+            stale.add(id(node.parent))
+
+    return {id(node) for node in nodes if node.type is not None and id(node) not in stale}
+
+
 class _TypeAnnotator(type):
     def __new__(cls, clsname, bases, attrs):
         klass = super().__new__(cls, clsname, bases, attrs)
@@ -130,6 +156,14 @@ class _TypeAnnotator(type):
                 klass.COERCES_TO[data_type] = coerces_to.copy()
                 coerces_to |= {data_type}
 
+        # Precompute the result of coercing any two types of the same precedence group
+        klass.COERCIONS = {
+            (type1, type2): type2 if type2 in klass.COERCES_TO.get(type1, {}) else type1
+            for type_precedence in (text_precedence, numeric_precedence, timelike_precedence)
+            for type1 in type_precedence
+            for type2 in type_precedence
+        }
+
         return klass
 
 
@@ -287,6 +321,9 @@ class TypeAnnotator(metaclass=_TypeAnnotator):
     # Specifies what types a given type can be coerced into (autofilled)
     COERCES_TO: t.Dict[exp.DataType.Type, t.Set[exp.DataType.Type]] = {}
 
+    # Maps pairs of types to the type they're coerced into (autofilled from COERCES_TO)
+    COERCIONS: t.Dict[t.Tuple[exp.DataType.Type, exp.DataType.Type], exp.DataType.Type] = {}
+
     # Coercion functions for binary operations.
     # Map of type pairs to a callable that takes both sides of the binary operation and returns the resulting type.
     BINARY_COERCIONS: BinaryCoercions = {
@@ -332,13 +369,22 @@ class TypeAnnotator(metaclass=_TypeAnnotator):
         # Caches the ids of annotated sub-Expressions, to ensure we only visit them once
         self._visited: t.Set[int] = set()
 
+        # Memoizes _maybe_coerce for pairs of non-nested types. The precomputed table only
+        # holds if the coercion rules weren't overridden
+        self._coercions: t.Dict[
+            t.Tuple[exp.DataType.Type, exp.DataType.Type], exp.DataType.Type
+        ] = ({} if coerces_to else dict(self.COERCIONS))
+
     def _set_type(
         self, expression: exp.Expression, target_type: exp.DataType | exp.DataType.Type
     ) -> None:
         expression.type = target_type  # type: ignore
         self._visited.add(id(expression))
 
-    def annotate(self, expression: E) -> E:
+    def annotate(self, expression: E, incremental: bool = False) -> E:
+        if incremental:
+            self._visited |= _annotated(expression)
+
         for scope in traverse_scope(expression):
             selects = {}
             for name, source in scope.sources.items():
@@ -351,7 +397,13 @@ class TypeAnnotator(metaclass=_TypeAnnotator):
                         if isinstance(source.expression.this, exp.Explode):
                             values = [source.expression.this.this]
                     else:
-                        values = source.expression.expressions[0].expressions
+                        row = source.expression.expressions[0]
+                        if isinstance(row, exp.LiteralBlock):
+                            # The tuples of a literal block aren't in the tree, so the first one is
+                            # annotated here, and its ids are forgotten since they can be reused
+                            row = self._maybe_annotate(row.expand(limit=1)[0])
+                            self._visited.difference_update(id(node) for node in row.walk_nodes())
+                        values = row.expressions
 
                     if not values:
                         continue
@@ -375,15 +427,26 @@ class TypeAnnotator(metaclass=_TypeAnnotator):
 
                 source = scope.sources.get(col.table)
                 if isinstance(source, exp.Table):
-                    self._set_type(col, self.schema.get_column_type(source, col))
+                    if id(col) not in self._visited:
+                        self._set_type(col, self.schema.get_column_type(source, col))
                 elif source and col.table in selects and col.name in selects[col.table]:
-                    self._set_type(col, selects[col.table][col.name].type)
+                    select = selects[col.table][col.name]
+                    if id(col) not in self._visited or select.type != col.type:
+                        self._invalidate(col)
+                        self._set_type(col, select.type)
 
             # Then (possibly) annotate the remaining expressions in the scope
             self._maybe_annotate(scope.expression)
 
         return self._maybe_annotate(expression)  # This takes care of non-traversable expressions
 
+    def _invalidate(self, expression: exp.Expression) -> None:
+        """Marks the ancestors of an expression whose type changed as needing annotation."""
+        parent = expression.parent
+        while parent and id(parent) in self._visited:
+            self._visited.remove(id(parent))
+            parent = parent.parent
+
     def _maybe_annotate(self, expression: E) -> E:
         if id(expression) in self._visited:
             return expression  # We've already inferred the expression's type
@@ -408,6 +471,11 @@ class TypeAnnotator(metaclass=_TypeAnnotator):
         type1_value = type1.this if isinstance(type1, exp.DataType) else type1
         type2_value = type2.this if isinstance(type2, exp.DataType) else type2
 
+        key = (type1_value, type2_value)
+        coerced = self._coercions.get(key)
+        if coerced is not None:
+            return coerced
+
         # We propagate the NULL / UNKNOWN types upwards if found
         if exp.DataType.Type.NULL in (type1_value, type2_value):
             return exp.DataType.Type.NULL
@@ -419,7 +487,10 @@ class TypeAnnotator(metaclass=_TypeAnnotator):
         if type2_value in self.NESTED_TYPES:
             return type2
 
-        return type2_value if type2_value in self.coerces_to.get(type1_value, {}) else type1_value  # type: ignore
+        coerces_to = self.coerces_to.get(type1_value, {})  # type: ignore
+        coerced = type2_value if type2_value in coerces_to else type1_value
+        self._coercions[key] = coerced
+        return coerced
 
     # Note: the following "no_type_check" decorators were added because mypy was yelling due
     # to assigning Type values to expression.type (since its getter returns Optional[DataType]).
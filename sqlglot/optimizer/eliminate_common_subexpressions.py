@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import itertools
+import typing as t
+from collections import Counter
+
+from sqlglot import exp
+from sqlglot.helper import ensure_list, find_new_name
+from sqlglot.optimizer.scope import Scope, traverse_scope, walk_in_scope
+from sqlglot.optimizer.simplify import NONDETERMINISTIC
+
+# The clauses of a SELECT that are evaluated on top of the rows kept by its FROM, JOINs and WHERE
+CLAUSES = ("expressions", "group", "having", "qualify", "order")
+
+# Functions which may return a different value every time they're called with the same arguments
+UNSAFE = (exp.AggFunc, exp.Anonymous, exp.Window, *NONDETERMINISTIC)
+
+
+def eliminate_common_subexpressions(expression: exp.Expression) -> exp.Expression:
+    """
+    Hoist function calls that a SELECT repeats across its clauses into a derived table, so that
+    they're only computed once per row.
+
+    The WHERE moves into the derived table along with the FROM and JOINs, so that the hoisted
+    functions still only run on the rows it keeps, e.g. a CAST that would fail on filtered out rows.
+
+    This expects a qualified expression and is not part of the default rules, since merge_subqueries
+    would fold the derived table back into the outer query.
+
+    Example:
+        >>> import sqlglot
+        >>> sql = "SELECT UPPER(x.a) AS b FROM x AS x WHERE x.b > 1 ORDER BY UPPER(x.a)"
+        >>> expression = sqlglot.parse_one(sql)
+        >>> eliminate_common_subexpressions(expression).sql()
+        'SELECT _q_0._cse_0 AS b FROM (SELECT UPPER(x.a) AS _cse_0 FROM x AS x WHERE x.b > 1) AS _q_0 ORDER BY _q_0._cse_0'
+
+    Args:
+        expression: expression to optimize.
+
+    Returns:
+        The optimized expression.
+    """
+    scopes = traverse_scope(expression)
+
+    taken = {table.alias_or_name for table in expression.find_all(exp.Table)}
+    for scope in scopes:
+        taken.update(scope.sources)
+
+    for scope in scopes:
+        _eliminate(scope, taken)
+
+    return expression
+
+
+def _eliminate(scope: Scope, taken: t.Set[str]) -> None:
+    select = scope.expression
+
+    if not _is_eligible(scope):
+        return
+
+    counts = Counter(
+        node
+        for clause in _clauses(select)
+        for node, *_ in walk_in_scope(clause)
+        if _is_hoistable(node)
+    )
+    repeated = {node for node, count in counts.items() if count > 1}
+
+    if not repeated:
+        return
+
+    alias = next(name for name in (f"_q_{i}" for i in itertools.count()) if name not in taken)
+    taken.add(alias)
+
+    # Maps each hoisted expression or (table, column) pair to its name in the derived table
+    names: t.Dict[t.Any, str] = {}
+    projections: t.List[exp.Alias] = []
+
+    def _project(key: t.Any, expression: exp.Expression, name: str) -> str:
+        if key not in names:
+            names[key] = find_new_name({projection.alias for projection in projections}, name)
+            projections.append(exp.alias_(expression, names[key]))
+        return names[key]
+
+    for clause in _clauses(select):
+        for node, *_ in list(walk_in_scope(clause, prune=lambda n, *_: n in repeated)):
+            if node in repeated:
+                name = _project(node, node.copy(), f"_cse_{len(names)}")
+                node.replace(exp.column(name, table=alias))
+
+    for clause in _clauses(select):
+        for column, *_ in list(walk_in_scope(clause)):
+            if not isinstance(column, exp.Column) or column.table not in scope.selected_sources:
+                continue
+
+            name = _project((column.table, column.name), column.copy(), column.name)
+            new_column = exp.column(exp.to_identifier(name, quoted=column.this.quoted), table=alias)
+
+            if column.parent is select and name != column.name:
+                new_column = exp.alias_(new_column, column.this.copy())
+
+            column.replace(new_column)
+
+    projections.sort(key=lambda projection: isinstance(projection.this, exp.Column), reverse=True)
+    inner = exp.Select(expressions=projections, joins=select.args.get("joins"))
+    inner.set("from", select.args["from"])
+    inner.set("where", select.args.get("where"))
+
+    select.set("from", exp.From(this=inner.subquery(alias, copy=False)))
+    select.set("joins", None)
+    select.set("where", None)
+
+
+def _is_eligible(scope: Scope) -> bool:
+    select = scope.expression
+
+    if not isinstance(select, exp.Select) or not select.args.get("from"):
+        return False
+    distinct = select.args.get("distinct")
+    if select.is_star or select.args.get("laterals") or (distinct and distinct.args.get("on")):
+        return False
+    if not all(isinstance(e, (exp.Alias, exp.Column)) for e in select.expressions):
+        return False
+
+    for join in select.args.get("joins") or []:
+        if join.args.get("using") or not isinstance(join.this, (exp.Table, exp.Subquery)):
+            return False
+    if not isinstance(select.args["from"].this, (exp.Table, exp.Subquery)):
+        return False
+
+    # Correlated columns would lose the sources they reference once these are moved
+    if scope.external_columns or any(
+        s.external_columns for child in scope.subquery_scopes for s in child.traverse()
+    ):
+        return False
+
+    return True
+
+
+def _clauses(select: exp.Expression) -> t.Iterator[exp.Expression]:
+    for key in CLAUSES:
+        yield from ensure_list(select.args.get(key) or [])
+
+
+def _is_hoistable(node: exp.Expression) -> bool:
+    return (
+        isinstance(node, exp.Func)
+        and not isinstance(node, UNSAFE)
+        and bool(node.find(exp.Column))
+        and not node.find(exp.Subqueryable, *UNSAFE)
+    )
@@ -1,20 +1,79 @@
 from __future__ import annotations
 
 import logging
+import time
+import typing as t
 
 from sqlglot import exp
 from sqlglot.errors import OptimizeError
 from sqlglot.helper import while_changing
 from sqlglot.optimizer.scope import find_all_in_scope
-from sqlglot.optimizer.simplify import flatten, rewrite_between, uniq_sort
+from sqlglot.optimizer.simplify import Interner, flatten, rewrite_between, uniq_sort
 
 logger = logging.getLogger("sqlglot")
 
+# Set in the meta of a connector that was left as is, with the reason why it wasn't normalized
+SKIPPED = "normalization_skipped"
 
-def normalize(expression: exp.Expression, dnf: bool = False, max_distance: int = 128):
+
+class NormalizationBudget:
+    """
+    Bounds the work done while distributing a single predicate, so that one pathological
+    filter is left untouched instead of stalling the optimizer.
+
+    Args:
+        max_nodes: the maximum number of nodes that can be created while distributing.
+        timeout: the maximum number of seconds that can be spent distributing.
+    """
+
+    def __init__(self, max_nodes: t.Optional[int] = None, timeout: t.Optional[float] = None):
+        self.max_nodes = max_nodes
+        self.timeout = timeout
+        self.nodes = 0
+        self.reused = 0
+        self.start = time.monotonic()
+
+        # Clauses that were already built, keyed by the interned ids of their operands
+        self.interner = Interner()
+        self.clauses: t.Dict[t.Tuple[int, int], t.Tuple[exp.Expression, int]] = {}
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self.start
+
+    def spend(self, nodes: int) -> None:
+        """Accounts for `nodes` newly created nodes and raises if the budget is exhausted."""
+        self.nodes += nodes
+
+        if self.max_nodes is not None and self.nodes > self.max_nodes:
+            raise OptimizeError(
+                f"Normalization created {self.nodes} nodes, exceeding max {self.max_nodes}"
+            )
+        if self.timeout is not None and self.elapsed > self.timeout:
+            raise OptimizeError(
+                f"Normalization took {self.elapsed:.3f}s, exceeding timeout {self.timeout}s"
+            )
+
+    def __repr__(self) -> str:
+        return (
+            f"NormalizationBudget(nodes={self.nodes}, reused={self.reused}, "
+            f"elapsed={self.elapsed:.3f}s)"
+        )
+
+
+def normalize(
+    expression: exp.Expression,
+    dnf: bool = False,
+    max_distance: int = 128,
+    max_nodes: t.Optional[int] = None,
+    timeout: t.Optional[float] = None,
+):
     """
     Rewrite sqlglot AST into conjunctive normal form or disjunctive normal form.
 
+    Connectors that can't be normalized within the given limits are left as is and the reason
+    is stored in their meta, under the `SKIPPED` key.
+
     Example:
         >>> import sqlglot
         >>> expression = sqlglot.parse_one("(x AND y) OR z")
@@ -25,6 +84,8 @@ def normalize(expression: exp.Expression, dnf: bool = False, max_distance: int =
         expression: expression to normalize
         dnf: rewrite in disjunctive normal form instead.
         max_distance (int): the maximal estimated distance from cnf/dnf to attempt conversion
+        max_nodes: the maximal number of nodes that can be created when normalizing a predicate
+        timeout: the maximal number of seconds that can be spent normalizing a predicate
     Returns:
         sqlglot.Expression: normalized expression
     """
@@ -39,22 +100,27 @@ def normalize(expression: exp.Expression, dnf: bool = False, max_distance: int =
             distance = normalization_distance(node, dnf=dnf)
 
             if distance > max_distance:
-                logger.info(
-                    f"Skipping normalization because distance {distance} exceeds max {max_distance}"
-                )
+                reason = f"distance {distance} exceeds max {max_distance}"
+                logger.info(f"Skipping normalization because {reason}")
+                node.meta[SKIPPED] = reason
                 return expression
 
+            budget = NormalizationBudget(max_nodes=max_nodes, timeout=timeout)
+
             try:
                 node = node.replace(
-                    while_changing(node, lambda e: distributive_law(e, dnf, max_distance))
+                    while_changing(node, lambda e: distributive_law(e, dnf, max_distance, budget))
                 )
             except OptimizeError as e:
-                logger.info(e)
+                logger.info(f"Skipping normalization: {e} ({budget})")
+                original.meta[SKIPPED] = str(e)
                 node.replace(original)
                 if root:
                     return original
                 return expression
 
+            logger.debug(f"Normalized predicate: {budget}")
+
             if root:
                 expression = node
 
@@ -130,11 +196,13 @@ def _predicate_lengths(expression, dnf):
     return _predicate_lengths(left, dnf) + _predicate_lengths(right, dnf)
 
 
-def distributive_law(expression, dnf, max_distance):
+def distributive_law(expression, dnf, max_distance, budget=None):
     """
     x OR (y AND z) -> (x OR y) AND (x OR z)
     (x AND y) OR (y AND z) -> (x OR y) AND (x OR z) AND (y OR y) AND (y OR z)
     """
+    budget = budget or NormalizationBudget()
+
     if normalized(expression, dnf=dnf):
         return expression
 
@@ -143,7 +211,7 @@ def distributive_law(expression, dnf, max_distance):
     if distance > max_distance:
         raise OptimizeError(f"Normalization distance {distance} exceeds max {max_distance}")
 
-    exp.replace_children(expression, lambda e: distributive_law(e, dnf, max_distance))
+    exp.replace_children(expression, lambda e: distributive_law(e, dnf, max_distance, budget))
     to_exp, from_exp = (exp.Or, exp.And) if dnf else (exp.And, exp.Or)
 
     if isinstance(expression, from_exp):
@@ -154,31 +222,51 @@ def distributive_law(expression, dnf, max_distance):
 
         if isinstance(a, to_exp) and isinstance(b, to_exp):
             if len(tuple(a.find_all(exp.Connector))) > len(tuple(b.find_all(exp.Connector))):
-                return _distribute(a, b, from_func, to_func)
-            return _distribute(b, a, from_func, to_func)
+                return _distribute(a, b, from_func, to_func, budget)
+            return _distribute(b, a, from_func, to_func, budget)
         if isinstance(a, to_exp):
-            return _distribute(b, a, from_func, to_func)
+            return _distribute(b, a, from_func, to_func, budget)
         if isinstance(b, to_exp):
-            return _distribute(a, b, from_func, to_func)
+            return _distribute(a, b, from_func, to_func, budget)
 
     return expression
 
 
-def _distribute(a, b, from_func, to_func):
+def _distribute(a, b, from_func, to_func, budget):
+    # The operands of b are combined with every operand of a, so they're only interned once
+    ids: t.Dict[int, int] = {}
+
+    def _id(e):
+        i = ids.get(id(e))
+        if i is None:
+            i = ids[id(e)] = budget.interner.id(e)
+        return i
+
+    def _clause(c, d):
+        """Builds `c <from_func> d`, reusing an identical clause if one was already built."""
+        key = (_id(c), _id(d))
+        cached = budget.clauses.get(key)
+
+        if cached:
+            # Clauses are only ever rewritten into equivalent ones, so it's safe to copy
+            # the one that was handed out, even if it has been normalized further since
+            clause, size = cached
+            budget.reused += 1
+            clause = clause.copy()
+        else:
+            clause = uniq_sort(flatten(from_func(c, d)))
+            size = sum(1 for _ in clause.walk())
+            budget.clauses[key] = (clause, size)
+
+        budget.spend(size)
+        return clause
+
     if isinstance(a, exp.Connector):
         exp.replace_children(
             a,
-            lambda c: to_func(
-                uniq_sort(flatten(from_func(c, b.left))),
-                uniq_sort(flatten(from_func(c, b.right))),
-                copy=False,
-            ),
+            lambda c: to_func(_clause(c, b.left), _clause(c, b.right), copy=False),
         )
     else:
-        a = to_func(
-            uniq_sort(flatten(from_func(a, b.left))),
-            uniq_sort(flatten(from_func(a, b.right))),
-            copy=False,
-        )
+        a = to_func(_clause(a, b.left), _clause(a, b.right), copy=False)
 
     return a
@@ -0,0 +1,270 @@
+from __future__ import annotations
+
+import datetime
+import typing as t
+
+from sqlglot import exp
+from sqlglot.dialects.dialect import Dialect, DialectType
+from sqlglot.optimizer.scope import Scope, traverse_scope, walk_in_scope
+from sqlglot.optimizer.simplify import (
+    DATETRUNCS,
+    cast_as_datetime,
+    date_literal,
+    extract_ranges,
+    simplify_datetrunc,
+    simplify_ranges,
+)
+from sqlglot.schema import Schema, ensure_schema
+
+# The date formats whose string order matches the order of the dates they represent, mapped to the
+# unit that the dates are truncated to when they're formatted
+MONOTONIC_FORMATS = {
+    "%Y": "year",
+    "%Y%m": "month",
+    "%Y-%m": "month",
+    "%Y%m%d": "day",
+    "%Y-%m-%d": "day",
+}
+
+# Functions that format a date as a number, mapped to the equivalent date format
+NUMERIC_FORMATS: t.Dict[t.Type[exp.Expression], str] = {
+    exp.ToYyyymm: "%Y%m",
+    exp.ToYyyymmdd: "%Y%m%d",
+}
+
+# NEQ is left alone, since its DATE_TRUNC counterpart can't be pruned on
+COMPARISONS = (exp.EQ, exp.GT, exp.GTE, exp.LT, exp.LTE)
+FLIPPED: t.Dict[t.Type[exp.Expression], t.Type[exp.Expression]] = {
+    exp.GT: exp.LT,
+    exp.GTE: exp.LTE,
+    exp.LT: exp.GT,
+    exp.LTE: exp.GTE,
+}
+
+
+def prune_partitions(
+    expression: exp.Expression,
+    schema: t.Optional[t.Dict | Schema] = None,
+    dialect: DialectType = None,
+    **kwargs,
+) -> exp.Expression:
+    """
+    Rewrite the predicates that wrap a partition column in DATE_FORMAT or DATE_TRUNC into ranges over
+    the bare column, so that engines like Doris, which only prune partitions on predicates of that
+    shape, can skip the partitions that the query doesn't need.
+
+    The partition columns are read from the schema, e.g. `MappingSchema(partitions=...)`, and must
+    have a temporal type. This expects a qualified expression and is not part of the default rules.
+
+    Example:
+        >>> import sqlglot
+        >>> sql = "SELECT * FROM t AS t WHERE DATE_FORMAT(t.dt, '%Y%m') = '202401'"
+        >>> expression = sqlglot.parse_one(sql, read="doris")
+        >>> schema = {"t": {"dt": "DATE"}}
+        >>> prune_partitions(expression, schema, "doris", partitions={"t": ["dt"]}).sql("doris")
+        "SELECT * FROM t AS t WHERE t.dt >= CAST('2024-01-01' AS DATE) AND t.dt < CAST('2024-02-01' AS DATE)"
+
+    Args:
+        expression: expression to optimize.
+        schema: the database schema, including its partition columns.
+        dialect: the dialect used to normalize the names in `schema` and to truncate dates.
+        **kwargs: other options for `ensure_schema`, e.g. `partitions`.
+
+    Returns:
+        The optimized expression.
+    """
+    schema = ensure_schema(schema, dialect=dialect, **kwargs)
+    dialect = Dialect.get_or_raise(dialect or schema.dialect)
+
+    for scope in traverse_scope(expression):
+        where = scope.expression.args.get("where")
+        if not where:
+            continue
+
+        predicates = [
+            node for node, *_ in walk_in_scope(where) if isinstance(node, (*COMPARISONS, exp.In))
+        ]
+
+        columns: t.Set[exp.Column] = set()
+
+        for predicate in predicates:
+            pruned = _prune(predicate, scope, schema, dialect)
+            if pruned is not predicate:
+                predicate.replace(pruned)
+                columns.update(pruned.find_all(exp.Column))
+
+        if columns:
+            connectors = [
+                node
+                for node, *_ in walk_in_scope(where)
+                if isinstance(node, exp.And) and not node.same_parent
+            ]
+            for connector in connectors:
+                connector.replace(_merge_ranges(connector, columns))
+
+    return expression
+
+
+def _prune(
+    predicate: exp.Expression, scope: Scope, schema: Schema, dialect: Dialect
+) -> exp.Expression:
+    comparison = predicate.__class__
+
+    if isinstance(predicate, exp.In):
+        if predicate.args.get("query") or not predicate.expressions:
+            return predicate
+        this, values = predicate.this, exp.expand_literal_blocks(predicate.expressions)
+    elif isinstance(predicate.this, (exp.TimeToStr, *NUMERIC_FORMATS, *DATETRUNCS)):
+        this, values = predicate.this, [predicate.expression]
+    else:
+        # The value is on the left, e.g. '202401' < DATE_FORMAT(dt, '%Y%m')
+        this, values = predicate.expression, [predicate.this]
+        comparison = FLIPPED.get(comparison, comparison)
+
+    truncated = _truncate(this, scope, schema)
+    if not truncated:
+        return predicate
+
+    unit, fmt = truncated
+    dates = [_parse_date(value, fmt) for value in values]
+    if not all(dates):
+        return predicate
+
+    trunc = exp.TimestampTrunc(this=this.this.copy(), unit=exp.Literal.string(unit))
+    literals = [date_literal(date) for date in dates]
+
+    if comparison is exp.In:
+        truncated_predicate: exp.Expression = exp.In(this=trunc, expressions=literals)
+    else:
+        truncated_predicate = comparison(this=trunc, expression=literals[0])
+
+    pruned = simplify_datetrunc(truncated_predicate, dialect)
+    if pruned is truncated_predicate:
+        return predicate
+
+    # IN is turned into ranges over DATE_TRUNC, so their bounds need to be simplified in turn
+    pruned = pruned.transform(simplify_datetrunc, dialect, copy=False)
+    return predicate if pruned.find(*DATETRUNCS) else pruned
+
+
+def _merge_ranges(connector: exp.And, columns: t.Set[exp.Column]) -> exp.Expression:
+    """
+    Intersects the ranges of the partition columns in a conjunction, so that the ranges which were
+    rewritten from different predicates collapse into a single one, or into FALSE if they don't
+    overlap. The other operands of the conjunction are left as they are.
+    """
+    operands = list(connector.flatten())
+    partition_predicates = {
+        id(predicate)
+        for this, value_range in extract_ranges(operands).items()
+        if this in columns
+        for predicate in value_range.predicates
+    }
+    if len(partition_predicates) < 2:
+        return connector
+
+    merged = simplify_ranges(exp.and_(*(o for o in operands if id(o) in partition_predicates)))
+    if merged == exp.false():
+        return merged
+
+    merged_operands = list(merged.flatten()) if isinstance(merged, exp.And) else [merged]
+    redundant = set()
+
+    for this, value_range in extract_ranges(merged_operands).items():
+        if value_range.values is not None:
+            continue
+
+        low = (value_range.low, value_range.low_inclusive)
+        high = (value_range.high, value_range.high_inclusive)
+        kept = set()
+
+        # Only the tightest bound on each side is kept
+        for predicate in value_range.predicates:
+            bound = extract_ranges([predicate])[this]
+            if bound.low is not None:
+                side, tightest = "low", (bound.low, bound.low_inclusive) == low
+            elif bound.high is not None:
+                side, tightest = "high", (bound.high, bound.high_inclusive) == high
+            else:
+                continue
+
+            if tightest and side not in kept:
+                kept.add(side)
+            else:
+                redundant.add(id(predicate))
+
+    # The merged predicates take the place of the first one they were merged from
+    rest = [o for o in merged_operands if id(o) not in redundant]
+    result = []
+    for operand in operands:
+        if id(operand) not in partition_predicates:
+            result.append(operand)
+        elif rest:
+            result.extend(rest)
+            rest = []
+
+    return exp.and_(*result, copy=False)
+
+
+def _truncate(
+    expression: exp.Expression, scope: Scope, schema: Schema
+) -> t.Optional[t.Tuple[str, t.Optional[str]]]:
+    """
+    Returns the unit that a partition column is truncated to by `expression` and the format of the
+    values that it's compared against, which is None for date strings.
+    """
+    if isinstance(expression, exp.TimeToStr):
+        fmt = expression.text("format")
+        unit = MONOTONIC_FORMATS.get(fmt)
+    elif isinstance(expression, tuple(NUMERIC_FORMATS)):
+        fmt = NUMERIC_FORMATS[expression.__class__]
+        unit = MONOTONIC_FORMATS[fmt]
+    elif isinstance(expression, DATETRUNCS):
+        fmt = None
+        unit = expression.text("unit").lower()
+    else:
+        return None
+
+    if not unit or not _is_partition_column(expression.this, scope, schema):
+        return None
+
+    return unit, fmt
+
+
+def _is_partition_column(column: exp.Expression, scope: Scope, schema: Schema) -> bool:
+    if not isinstance(column, exp.Column):
+        return False
+
+    if column.table:
+        source = scope.sources.get(column.table)
+    elif len(scope.sources) == 1:
+        source = next(iter(scope.sources.values()))
+    else:
+        return False
+
+    if not isinstance(source, exp.Table) or column.name not in schema.partition_columns(source):
+        return False
+
+    return schema.get_column_type(source, column).is_type(*exp.DataType.TEMPORAL_TYPES)
+
+
+def _parse_date(value: exp.Expression, fmt: t.Optional[str]) -> t.Optional[datetime.date]:
+    if fmt is None:
+        if isinstance(value, exp.Cast) and value.to.is_type(*exp.DataType.TEMPORAL_TYPES):
+            value = value.this
+        if not value.is_string:
+            return None
+
+        date = cast_as_datetime(value.name)
+        return date.date() if date and date.time() == datetime.time() else None
+
+    if not isinstance(value, exp.Literal):
+        return None
+
+    try:
+        date = datetime.datetime.strptime(value.name, fmt)
+    except ValueError:
+        return None
+
+    # Values like '2024-1' don't sort like the formatted dates they're compared against
+    return date.date() if date.strftime(fmt) == value.name else None
@@ -52,7 +52,8 @@ def qualify_tables(
             if isinstance(derived_table, exp.Subquery):
                 unnested = derived_table.unnest()
                 if isinstance(unnested, exp.Table):
-                    joins = unnested.args.pop("joins", None)
+                    joins = unnested.args.get("joins")
+                    unnested.set("joins", None)
                     derived_table.this.replace(exp.select("*").from_(unnested.copy(), copy=False))
                     derived_table.this.set("joins", joins)
 
@@ -109,7 +110,13 @@ def qualify_tables(
                 if not table_alias.name:
                     table_alias.set("this", exp.to_identifier(next_alias_name()))
                 if isinstance(udtf, exp.Values) and not table_alias.columns:
-                    for i, e in enumerate(udtf.expressions[0].expressions):
+                    row = udtf.expressions[0]
+                    width = (
+                        row.args.get("width") or 1
+                        if isinstance(row, exp.LiteralBlock)
+                        else len(row.expressions)
+                    )
+                    for i in range(width):
                         table_alias.append("columns", exp.to_identifier(f"_col_{i}"))
 
     return expression
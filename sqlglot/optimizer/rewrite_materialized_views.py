@@ -0,0 +1,368 @@
+from __future__ import annotations
+
+import typing as t
+
+from sqlglot import exp
+from sqlglot.dialects.dialect import Dialect, DialectType
+from sqlglot.helper import ensure_list
+from sqlglot.optimizer.qualify import qualify
+from sqlglot.optimizer.scope import Scope, traverse_scope
+from sqlglot.optimizer.simplify import ValueRange, extract_ranges, simplify
+from sqlglot.schema import Schema, ensure_schema
+
+# The clauses of a SELECT that are rewritten to read from a view
+CLAUSES = ("expressions", "where", "group", "having", "order")
+
+# The args that a SELECT may have in order to be matched
+SUPPORTED_ARGS = {"with", "kind", "hint", "distinct", "from", "limit", "offset", *CLAUSES}
+
+# The args that make a SELECT lose rows that a query could need, so it can't define a view
+UNSUPPORTED_VIEW_ARGS = ("with", "distinct", "having", "limit", "offset")
+
+# Aggregates that can be computed from the aggregates of a finer grouping, mapped to the aggregate
+# function that combines them, e.g. the COUNT of a group is the SUM of the COUNTs of its subgroups.
+# The SUM of no rows is NULL though, so rolled up COUNTs are wrapped in COALESCE(..., 0)
+ROLLUPS: t.Dict[t.Type[exp.Expression], t.Type[exp.Func]] = {
+    exp.Count: exp.Sum,
+    exp.Max: exp.Max,
+    exp.Min: exp.Min,
+    exp.Sum: exp.Sum,
+}
+
+
+class UnsupportedView(Exception):
+    pass
+
+
+class MaterializedView:
+    """
+    A materialized view or rollup over a single table, in a normalized form that queries are
+    matched against.
+
+    Args:
+        name: the name of the view, which the rewritten queries read from.
+        definition: the qualified SELECT that defines the view.
+    """
+
+    def __init__(self, name: str, definition: exp.Select):
+        if not _is_matchable(definition) or any(
+            definition.args.get(key) for key in UNSUPPORTED_VIEW_ARGS
+        ):
+            raise UnsupportedView(f"Unsupported materialized view definition: {definition.sql()}")
+
+        self.name = name
+        self.table = _table_key(definition.args["from"].this)
+        self.predicates = {_predicate_key(p) for p in _conjuncts(definition.args.get("where"))}
+        self.grouped = bool(definition.args.get("group")) or any(
+            projection.find(exp.AggFunc) for projection in definition.expressions
+        )
+        self.grouping_keys = _grouping_keys(definition)
+
+        # Maps the normalized expression of each column of the view to its name
+        self.columns = {
+            _key(projection.unalias()): projection.alias_or_name
+            for projection in definition.expressions
+        }
+
+
+def rewrite_materialized_views(
+    expression: exp.Expression,
+    views: t.Dict[str, str | exp.Expression],
+    schema: t.Optional[t.Dict | Schema] = None,
+    dialect: DialectType = None,
+) -> exp.Expression:
+    """
+    Rewrite the SELECTs that can be answered by a materialized view or rollup to read from it
+    instead, so that engines like Doris, whose matching is syntactic, can use them.
+
+    A SELECT over a table can read from a view over the same table if:
+        - every predicate of the view's WHERE is also a predicate of the query's WHERE, or is
+          implied by the range of values that the query's WHERE allows, e.g. a view filtered on
+          dt >= '2024-01-01' can answer a query filtered on dt >= '2024-02-01' if it has dt,
+        - the expressions that the query needs can be computed from the columns of the view and
+        - if the view is grouped, the query is grouped by expressions of the view's grouping keys
+          and its aggregates can be derived from the view's, e.g. COUNT(x) is the SUM of the
+          COUNT(x) column of the view and AVG(x) is the SUM of its SUM(x) column divided by the
+          SUM of its COUNT(x) column.
+
+    Only views that are defined by a SELECT over a single table are matched, and the projections
+    of the view should be aliased with the names of its columns. This expects a qualified
+    expression and is not part of the default rules.
+
+    Example:
+        >>> import sqlglot
+        >>> views = {"mv": "SELECT k, SUM(v) AS total FROM t GROUP BY k"}
+        >>> sql = "SELECT t.k AS k, SUM(t.v) AS s FROM t AS t WHERE t.k > 1 GROUP BY t.k"
+        >>> expression = sqlglot.parse_one(sql)
+        >>> rewrite_materialized_views(expression, views).sql()
+        'SELECT t.k AS k, SUM(t.total) AS s FROM mv AS t WHERE t.k > 1 GROUP BY t.k'
+
+    Args:
+        expression: expression to optimize.
+        views: the definitions of the views, keyed by their names, in order of preference.
+        schema: the database schema, which is used to qualify the definitions of the views.
+        dialect: the dialect used to parse and qualify the definitions of the views.
+
+    Returns:
+        The optimized expression.
+    """
+    schema = ensure_schema(schema, dialect=dialect)
+    dialect = Dialect.get_or_raise(dialect or schema.dialect)
+
+    materialized_views = []
+
+    for name, definition in views.items():
+        definition = qualify(
+            exp.maybe_parse(definition, dialect=dialect),
+            dialect=dialect,
+            schema=schema,
+            quote_identifiers=False,
+        )
+
+        try:
+            materialized_views.append(MaterializedView(name, t.cast(exp.Select, definition)))
+        except UnsupportedView:
+            continue
+
+    for scope in traverse_scope(expression):
+        if not _is_matchable(scope.expression) or scope.subquery_scopes or scope.external_columns:
+            continue
+
+        for view in materialized_views:
+            if _rewrite(scope, view, dialect):
+                break
+
+    return expression
+
+
+def _rewrite(scope: Scope, view: MaterializedView, dialect: Dialect) -> bool:
+    select = scope.expression
+    table = select.args["from"].this
+    alias = table.alias_or_name
+
+    # The table may also refer to a CTE
+    if not isinstance(scope.sources.get(alias), exp.Table) or _table_key(table) != view.table:
+        return False
+
+    residual = []
+    predicates = set()
+
+    for predicate in _conjuncts(select.args.get("where")):
+        key = _predicate_key(predicate)
+        predicates.add(key)
+
+        if key not in view.predicates:
+            residual.append(predicate)
+
+    missing = view.predicates - predicates
+    if missing and not _implied(missing, predicates):
+        return False
+
+    grouped = bool(select.args.get("group")) or any(
+        node.find(exp.AggFunc) for node in (*select.expressions, select.args.get("having")) if node
+    )
+    if view.grouped and not grouped:
+        return False
+
+    translator = _Translator(view, alias, _grouping_keys(select) == view.grouping_keys)
+
+    try:
+        where = [translator.translate(predicate.copy()) for predicate in residual]
+        clauses = {
+            key: [translator.translate(node.copy()) for node in select.args[key]]
+            if isinstance(select.args[key], list)
+            else translator.translate(select.args[key].copy())
+            for key in CLAUSES
+            if key != "where" and select.args.get(key)
+        }
+    except _Unmatched:
+        return False
+
+    for arg, value in clauses.items():
+        select.set(arg, value)
+
+    select.set("where", exp.Where(this=exp.and_(*where, copy=False)) if where else None)
+
+    view_table = exp.to_table(view.name, dialect=dialect)
+    view_table.set("alias", exp.TableAlias(this=exp.to_identifier(alias)))
+    table.replace(view_table)
+
+    return True
+
+
+class _Unmatched(Exception):
+    pass
+
+
+class _Translator:
+    """
+    Rewrites the expressions of a query in terms of the columns of a view
+
+    Args:
+        view: the view that the query is rewritten to read from.
+        alias: the alias of the view in the query.
+        same_grouping: whether the query is grouped by the same keys as the view, in which case each
+            of its groups is a single row of the view.
+    """
+
+    def __init__(self, view: MaterializedView, alias: str, same_grouping: bool):
+        self.view = view
+        self.alias = alias
+        self.same_grouping = same_grouping
+
+    def translate(self, node: exp.Expression) -> exp.Expression:
+        # Unqualified columns refer to projections, e.g. in the ORDER BY
+        if isinstance(node, exp.Column) and not node.table:
+            return node
+
+        column = self._column(node)
+        aggregated = self.view.grouped and node.find(exp.AggFunc)
+
+        # The columns of a grouped view that hold aggregates are only valid for its own groups
+        if column and not aggregated:
+            return column
+
+        if isinstance(node, exp.AggFunc) and self.view.grouped:
+            rolled_up = self._roll_up(node)
+            if rolled_up:
+                return rolled_up
+
+        if column and self.same_grouping:
+            # Each group of the query is a single row of the view, so aggregating the column over
+            # it gives the view's value, e.g. SUM(v) + 1 becomes MAX(t.s1)
+            return exp.Max(this=column)
+
+        if isinstance(node, exp.AggFunc) and self.view.grouped:
+            # Aggregates over grouping keys, e.g. MAX(k) or COUNT(DISTINCT k), can still be
+            # computed from the view's rows, but not the other ones
+            if not isinstance(node, (exp.Max, exp.Min)) and not node.find(exp.Distinct):
+                raise _Unmatched
+        elif isinstance(node, exp.Column):
+            raise _Unmatched
+
+        for _, child in list(node.iter_expressions()):
+            translated = self.translate(child)
+            if translated is not child:
+                child.replace(translated)
+
+        return node
+
+    def _column(self, node: exp.Expression) -> t.Optional[exp.Expression]:
+        name = self.view.columns.get(_key(node))
+        return exp.column(name, table=self.alias) if name else None
+
+    def _roll_up(self, node: exp.AggFunc) -> t.Optional[exp.Expression]:
+        if node.find(exp.Distinct):
+            return None
+
+        if isinstance(node, exp.Avg):
+            total = self._roll_up(exp.Sum(this=node.this.copy()))
+            count = self._roll_up(exp.Count(this=node.this.copy()))
+            return exp.Div(this=total, expression=count) if total and count else None
+
+        rollup = ROLLUPS.get(node.__class__)
+        column = self._column(node)
+        if not rollup or not column:
+            return None
+
+        rolled_up = rollup(this=column)
+        if isinstance(node, exp.Count):
+            return exp.Coalesce(this=rolled_up, expressions=[exp.Literal.number(0)])
+        return rolled_up
+
+
+def _implied(predicates: t.Set[exp.Expression], conditions: t.Set[exp.Expression]) -> bool:
+    """Checks whether every value that satisfies all of `conditions` satisfies `predicates` too."""
+    ranges = extract_ranges(list(conditions))
+
+    for predicate in predicates:
+        bounds = extract_ranges([predicate])
+        if len(bounds) != 1:
+            return False
+
+        (this, bound), *_ = bounds.items()
+        if this not in ranges or not _contains(bound, ranges[this]):
+            return False
+
+    return True
+
+
+def _contains(outer: ValueRange, inner: ValueRange) -> bool:
+    if outer.kind != inner.kind:
+        return False
+
+    if inner.values is not None:
+        return all(
+            outer.contains(value) and (outer.values is None or value in outer.values)
+            for value in inner.values
+            if inner.contains(value)
+        )
+    if outer.values is not None:
+        return False
+
+    if outer.low is not None and (
+        inner.low is None
+        or inner.low < outer.low
+        or (inner.low == outer.low and inner.low_inclusive and not outer.low_inclusive)
+    ):
+        return False
+    if outer.high is not None and (
+        inner.high is None
+        or inner.high > outer.high
+        or (inner.high == outer.high and inner.high_inclusive and not outer.high_inclusive)
+    ):
+        return False
+
+    return all(not inner.contains(value) for value in outer.excluded)
+
+
+def _is_matchable(select: exp.Expression) -> bool:
+    if not isinstance(select, exp.Select) or select.is_star:
+        return False
+    if any(select.args.get(key) for key in select.args if key not in SUPPORTED_ARGS):
+        return False
+
+    distinct = select.args.get("distinct")
+    from_ = select.args.get("from")
+
+    if not from_ or not isinstance(from_.this, exp.Table) or (distinct and distinct.args.get("on")):
+        return False
+
+    return not any(
+        node.find(exp.Window, exp.Subqueryable)
+        for key in CLAUSES
+        for node in ensure_list(select.args.get(key) or [])
+    )
+
+
+def _grouping_keys(select: exp.Select) -> t.Set[exp.Expression]:
+    group = select.args.get("group")
+    return {_key(key) for key in group.expressions} if group else set()
+
+
+def _table_key(table: exp.Table) -> t.Tuple[str, ...]:
+    return tuple(part.name for part in table.parts)
+
+
+def _key(expression: exp.Expression) -> exp.Expression:
+    """Normalizes an expression of a single-table SELECT, so that it's independent of its alias"""
+    key = expression.copy()
+
+    for node in key.walk_nodes():
+        if isinstance(node, exp.Column):
+            node.set("table", None)
+        elif isinstance(node, exp.Identifier):
+            node.set("quoted", False)
+
+    return key
+
+
+def _predicate_key(predicate: exp.Expression) -> exp.Expression:
+    return simplify(_key(predicate))
+
+
+def _conjuncts(where: t.Optional[exp.Expression]) -> t.List[exp.Expression]:
+    if not where:
+        return []
+    condition = where.this
+    return list(condition.flatten()) if isinstance(condition, exp.And) else [condition]
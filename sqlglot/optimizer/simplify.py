@@ -5,7 +5,7 @@ import functools
 import itertools
 import typing as t
 from collections import deque
-from decimal import Decimal
+from decimal import Decimal, InvalidOperation
 
 import sqlglot
 from sqlglot import Dialect, exp
@@ -27,6 +27,37 @@ class UnsupportedUnit(Exception):
     pass
 
 
+class Interner:
+    """
+    Interns predicates by structure: structurally equal expressions share a single integer id,
+    so that sets of predicates can be represented as bitmasks and deduplication, complement
+    detection and absorption become integer operations.
+
+    Example:
+        >>> import sqlglot
+        >>> interner = Interner()
+        >>> interner.id(sqlglot.parse_one("a = 1")) == interner.id(sqlglot.parse_one("a = 1"))
+        True
+    """
+
+    def __init__(self) -> None:
+        self._ids: t.Dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def id(self, expression: exp.Expression) -> int:
+        """Returns the id shared by all the expressions that are structurally equal to `expression`."""
+        return self._ids.setdefault(hash(expression), len(self._ids))
+
+    def mask(self, expressions: t.Iterable[exp.Expression]) -> int:
+        """Returns the set of ids of `expressions`, represented as a bitmask."""
+        mask = 0
+        for expression in expressions:
+            mask |= 1 << self.id(expression)
+        return mask
+
+
 def simplify(
     expression: exp.Expression, constant_propagation: bool = False, dialect: DialectType = None
 ):
@@ -48,6 +79,7 @@ def simplify(
     """
 
     dialect = Dialect.get_or_raise(dialect)
+    interner = Interner()
 
     def _simplify(expression, root=True):
         if expression.meta.get(FINAL):
@@ -79,7 +111,7 @@ def simplify(
         node = expression
         node = rewrite_between(node)
         node = uniq_sort(node, root)
-        node = absorb_and_eliminate(node, root)
+        node = absorb_and_eliminate(node, root, interner)
         node = simplify_concat(node)
         node = simplify_conditionals(node)
 
@@ -92,7 +124,8 @@ def simplify(
         node = simplify_not(node)
         node = flatten(node)
         node = simplify_connectors(node, root)
-        node = remove_complements(node, root)
+        node = remove_complements(node, root, interner)
+        node = simplify_ranges(node, root)
         node = simplify_coalesce(node)
         node.parent = expression.parent
         node = simplify_literals(node, root)
@@ -330,7 +363,225 @@ def _simplify_comparison(expression, left, right, or_=False):
     return None
 
 
-def remove_complements(expression, root=True):
+class ValueRange:
+    """
+    The values an expression can take according to the comparisons of a conjunction.
+
+    Bounds come from `<`, `<=`, `>`, `>=`, allowed values from `=` and `IN` and excluded values
+    from `<>`. Only comparisons against literals of a single kind (numbers, strings, dates or
+    datetimes) are taken into account.
+    """
+
+    def __init__(self, kind: str) -> None:
+        self.kind = kind
+        self.low: t.Any = None
+        self.low_inclusive = True
+        self.high: t.Any = None
+        self.high_inclusive = True
+        # Maps each allowed value to the literal it was parsed from, None means any value
+        self.values: t.Optional[t.Dict[t.Any, exp.Expression]] = None
+        self.excluded: t.Set[t.Any] = set()
+        # The predicates this range was built from
+        self.predicates: t.List[exp.Expression] = []
+        self.pruned = False
+
+    def __repr__(self) -> str:
+        low = f"{'[' if self.low_inclusive else '('}{self.low}"
+        high = f"{self.high}{']' if self.high_inclusive else ')'}"
+        values = "" if self.values is None else f", values={list(self.values)}"
+        return f"ValueRange({self.kind}, {low}, {high}{values})"
+
+    def restrict(self, comparison: t.Type[exp.Expression], value: t.Any) -> None:
+        if comparison in GT_GTE:
+            inclusive = comparison is exp.GTE
+            if self.low is None or value > self.low or (value == self.low and not inclusive):
+                self.low, self.low_inclusive = value, inclusive
+        elif comparison in LT_LTE:
+            inclusive = comparison is exp.LTE
+            if self.high is None or value < self.high or (value == self.high and not inclusive):
+                self.high, self.high_inclusive = value, inclusive
+        elif comparison is exp.NEQ:
+            self.excluded.add(value)
+
+    def intersect(self, values: t.Dict[t.Any, exp.Expression]) -> None:
+        if self.values is None:
+            self.values = values
+        else:
+            self.pruned = True
+            self.values = {v: e for v, e in self.values.items() if v in values}
+
+    def contains(self, value: t.Any) -> bool:
+        if value in self.excluded:
+            return False
+        if self.low is not None and (
+            value < self.low or (value == self.low and not self.low_inclusive)
+        ):
+            return False
+        if self.high is not None and (
+            value > self.high or (value == self.high and not self.high_inclusive)
+        ):
+            return False
+        return True
+
+    def allowed_values(self) -> t.Optional[t.List[exp.Expression]]:
+        """The literals of the allowed values that satisfy the bounds, or None if unrestricted."""
+        if self.values is None:
+            return None
+
+        allowed = [e for v, e in self.values.items() if self.contains(v)]
+        if len(allowed) < len(self.values):
+            self.pruned = True
+        return allowed
+
+    @property
+    def is_empty(self) -> bool:
+        """Whether no value can satisfy all of the predicates this range was built from."""
+        if self.values is not None:
+            return not self.allowed_values()
+        if self.low is None or self.high is None:
+            return False
+        if self.low == self.high:
+            return not (self.low_inclusive and self.high_inclusive) or self.low in self.excluded
+        return self.low > self.high
+
+
+def _range_literal(expression: exp.Expression) -> t.Optional[t.Tuple[str, t.Any]]:
+    """Returns the kind and the python value of a literal that can be used to build a range."""
+    if expression.is_number:
+        try:
+            return "number", Decimal(expression.name)
+        except InvalidOperation:
+            return None
+    if expression.is_string:
+        return "string", expression.name
+
+    date = extract_date(expression)
+    if date is None:
+        return None
+    return ("datetime" if isinstance(date, datetime.datetime) else "date"), date
+
+
+def extract_ranges(
+    expression: exp.Expression | t.Iterable[exp.Expression],
+) -> t.Dict[exp.Expression, ValueRange]:
+    """
+    Computes the range of values of every expression compared against literals in a conjunction.
+
+    Example:
+        >>> import sqlglot
+        >>> extract_ranges(sqlglot.parse_one("x > 1 AND x <= 5 AND y IN (1, 2)"))
+        {Column(
+          this=Identifier(this=x, quoted=False)): ValueRange(number, (1, 5]), Column(
+          this=Identifier(this=y, quoted=False)): ValueRange(number, [None, None], values=[Decimal('1'), Decimal('2')])}
+
+    Args:
+        expression: a conjunction, or its operands.
+
+    Returns:
+        A mapping from each compared expression to its range. Expressions that are compared
+        against literals of different kinds are left out.
+    """
+    if isinstance(expression, exp.Expression):
+        operands: t.Iterable[exp.Expression] = (
+            expression.flatten() if isinstance(expression, exp.And) else (expression,)
+        )
+    else:
+        operands = expression
+
+    ranges: t.Dict[exp.Expression, ValueRange] = {}
+    mixed: t.Set[exp.Expression] = set()
+
+    for predicate in operands:
+        comparison = predicate.__class__
+
+        if comparison in (*LT_LTE, *GT_GTE, exp.EQ, exp.NEQ):
+            this, other = predicate.this, predicate.expression
+            if _is_constant(this):
+                this, other = other, this
+                comparison = INVERSE_COMPARISONS.get(comparison, comparison)
+            literals = [other]
+        elif comparison is exp.In and not any(
+            predicate.args.get(k) for k in ("query", "unnest", "field")
+        ):
+            this, literals = predicate.this, exp.expand_literal_blocks(predicate.expressions)
+        else:
+            continue
+
+        if not literals or _is_constant(this) or this.find(*NONDETERMINISTIC):
+            continue
+
+        values = []
+        for literal in literals:
+            value = _range_literal(literal)
+            if not value:
+                break
+            values.append(value)
+
+        kinds = {kind for kind, _ in values}
+        if len(values) != len(literals) or len(kinds) != 1:
+            continue
+
+        kind = kinds.pop()
+        value_range = ranges.get(this)
+        if value_range is None:
+            value_range = ranges[this] = ValueRange(kind)
+        elif value_range.kind != kind:
+            mixed.add(this)
+            continue
+
+        value_range.predicates.append(predicate)
+        if comparison in (exp.EQ, exp.In):
+            allowed: t.Dict[t.Any, exp.Expression] = {}
+            for (_, value), literal in zip(values, literals):
+                allowed.setdefault(value, literal)
+            value_range.intersect(allowed)
+        else:
+            value_range.restrict(comparison, values[0][1])
+
+    return {this: value_range for this, value_range in ranges.items() if this not in mixed}
+
+
+def simplify_ranges(expression, root=True):
+    """
+    Intersects the values that each expression can take in a conjunction.
+
+    x > 5 AND y = 1 AND x < 3 -> FALSE
+    x IN (1, 2, 10) AND x < 5 -> x IN (1, 2)
+    x IN (1, 2) AND x IN (2, 3) AND x <> 3 -> x = 2
+    """
+    if not isinstance(expression, exp.And) or not (root or not expression.same_parent):
+        return expression
+
+    operands = list(expression.flatten())
+    replacements: t.Dict[int, t.Optional[exp.Expression]] = {}
+
+    for this, value_range in extract_ranges(operands).items():
+        if value_range.is_empty:
+            return exp.false()
+
+        allowed = value_range.allowed_values()
+        if allowed is None or (len(value_range.predicates) == 1 and not value_range.pruned):
+            continue
+
+        # Every other comparison is implied by the allowed values, so they're all merged into one
+        first, *rest = value_range.predicates
+        if len(allowed) == 1:
+            replacements[id(first)] = exp.EQ(this=this.copy(), expression=allowed[0].copy())
+        else:
+            replacements[id(first)] = exp.In(
+                this=this.copy(), expressions=[literal.copy() for literal in allowed]
+            )
+        for predicate in rest:
+            replacements[id(predicate)] = None
+
+    if not replacements:
+        return expression
+
+    operands = [replacements.get(id(o), o) for o in operands]
+    return exp.and_(*(o for o in operands if o), copy=False)
+
+
+def remove_complements(expression, root=True, interner=None):
     """
     Removing complements.
 
@@ -338,11 +589,14 @@ def remove_complements(expression, root=True):
     A OR NOT A -> TRUE
     """
     if isinstance(expression, exp.Connector) and (root or not expression.same_parent):
-        complement = exp.false() if isinstance(expression, exp.And) else exp.true()
+        interner = interner or Interner()
+        operands = tuple(expression.flatten())
+        negated = interner.mask(
+            operand.this for operand in operands if isinstance(operand, exp.Not)
+        )
 
-        for a, b in itertools.permutations(expression.flatten(), 2):
-            if is_complement(a, b):
-                return complement
+        if negated & interner.mask(operands):
+            return exp.false() if isinstance(expression, exp.And) else exp.true()
     return expression
 
 
@@ -372,7 +626,7 @@ def uniq_sort(expression, root=True):
     return expression
 
 
-def absorb_and_eliminate(expression, root=True):
+def absorb_and_eliminate(expression, root=True, interner=None):
     """
     absorption:
         A AND (A OR B) -> A
@@ -385,6 +639,19 @@ def absorb_and_eliminate(expression, root=True):
     """
     if isinstance(expression, exp.Connector) and (root or not expression.same_parent):
         kind = exp.Or if isinstance(expression, exp.And) else exp.And
+        interner = interner or Interner()
+
+        # The operands of each connector of the opposite kind, keyed by the connector's id().
+        # An entry is dropped when one of the connector's operands is replaced below.
+        masks: t.Dict[int, int] = {}
+
+        def _mask(e):
+            if not isinstance(e, kind):
+                return 1 << interner.id(e)
+            mask = masks.get(id(e))
+            if mask is None:
+                mask = masks[id(e)] = interner.mask(e.flatten())
+            return mask
 
         for a, b in itertools.permutations(expression.flatten(), 2):
             if isinstance(a, kind):
@@ -393,9 +660,11 @@ def absorb_and_eliminate(expression, root=True):
                 # absorb
                 if is_complement(b, aa):
                     aa.replace(exp.true() if kind == exp.And else exp.false())
+                    masks.pop(id(a), None)
                 elif is_complement(b, ab):
                     ab.replace(exp.true() if kind == exp.And else exp.false())
-                elif (set(b.flatten()) if isinstance(b, kind) else {b}) < set(a.flatten()):
+                    masks.pop(id(a), None)
+                elif _is_proper_subset(_mask(b), _mask(a)):
                     a.replace(exp.false() if kind == exp.And else exp.true())
                 elif isinstance(b, kind):
                     # eliminate
@@ -412,6 +681,10 @@ def absorb_and_eliminate(expression, root=True):
     return expression
 
 
+def _is_proper_subset(a: int, b: int) -> bool:
+    return a != b and not a & ~b
+
+
 def propagate_constants(expression, root=True):
     """
     Propagate constants for conjunctions in DNF:
@@ -896,7 +1169,7 @@ def simplify_datetrunc(expression: exp.Expression, dialect: Dialect) -> exp.Expr
         return DATETRUNC_BINARY_COMPARISONS[comparison](l.this, date, unit, dialect) or expression
     elif isinstance(expression, exp.In):
         l = expression.this
-        rs = expression.expressions
+        rs = exp.expand_literal_blocks(expression.expressions)
 
         if rs and all(_is_datetrunc_predicate(l, r) for r in rs):
             l = t.cast(exp.DateTrunc, l)
@@ -606,6 +606,13 @@ class Parser(metaclass=_Parser):
         ),
     }
 
+    # Runs of at least this many literals in an IN list, or in the rows of a VALUES clause, are
+    # parsed into a single exp.LiteralBlock instead of one node per literal
+    LITERAL_BLOCK_MIN_SIZE = 1000
+
+    # The values of the keyword literals in a LiteralBlock
+    LITERAL_BLOCK_CONSTANTS = {TokenType.NULL: None, TokenType.TRUE: True, TokenType.FALSE: False}
+
     UNARY_PARSERS = {
         TokenType.PLUS: lambda self: self._parse_unary(),  # Unary + is handled as a no-op
         TokenType.NOT: lambda self: self.expression(exp.Not, this=self._parse_equality()),
@@ -1346,7 +1353,8 @@ class Parser(metaclass=_Parser):
         def extend_props(temp_props: t.Optional[exp.Properties]) -> None:
             nonlocal properties
             if properties and temp_props:
-                properties.expressions.extend(temp_props.expressions)
+                for prop in temp_props.expressions:
+                    properties.append("expressions", prop)
             elif temp_props:
                 properties = temp_props
 
@@ -2165,6 +2173,110 @@ class Parser(metaclass=_Parser):
             exp.Partition, expressions=self._parse_wrapped_csv(self._parse_conjunction)
         )
 
+    def _parse_literal_block(self, rows: bool = False) -> t.Optional[exp.LiteralBlock]:
+        """
+        Parses the longest run of comma-separated literals that starts at the current token, or of
+        tuples of literals if `rows` is set, into a single node, if it has enough values.
+        """
+        tokens = self._tokens
+        num_tokens = len(tokens)
+
+        # Each value is followed by at least one token, so short lists are skipped upfront
+        if num_tokens - self._index < 2 * self.LITERAL_BLOCK_MIN_SIZE:
+            return None
+
+        # Dialects that parse literals differently get the nodes they'd produce otherwise
+        negate = self.UNARY_PARSERS.get(TokenType.DASH)
+        if negate is not Parser.UNARY_PARSERS[TokenType.DASH] or any(
+            self.PRIMARY_PARSERS.get(token_type) is not Parser.PRIMARY_PARSERS[token_type]
+            for token_type in (TokenType.STRING, TokenType.NUMBER, *self.LITERAL_BLOCK_CONSTANTS)
+        ):
+            return None
+
+        def token_type(index: int) -> t.Optional[TokenType]:
+            # Tokens with comments end the block, so that the comments are kept in the tree
+            token = tokens[index] if index < num_tokens else None
+            return token.token_type if token and not token.comments else None
+
+        values: t.List[t.Any] = []
+        is_string: t.List[bool] = []
+        width = None
+        index = end = self._index
+        size = 0
+
+        while True:
+            if rows:
+                if token_type(index) != TokenType.L_PAREN:
+                    break
+                index += 1
+
+            count = 0
+            closed = False
+            while True:
+                literal_type = token_type(index)
+                index += 1
+
+                if literal_type == TokenType.STRING:
+                    values.append(tokens[index - 1].text)
+                    is_string.append(True)
+                elif literal_type == TokenType.NUMBER:
+                    values.append(tokens[index - 1].text)
+                    is_string.append(False)
+                elif literal_type == TokenType.DASH and token_type(index) == TokenType.NUMBER:
+                    index += 1
+                    values.append(f"-{tokens[index - 1].text}")
+                    is_string.append(False)
+                elif literal_type in self.LITERAL_BLOCK_CONSTANTS:
+                    values.append(self.LITERAL_BLOCK_CONSTANTS[literal_type])
+                    is_string.append(False)
+                else:
+                    break
+
+                count += 1
+                if not rows or token_type(index) != TokenType.COMMA:
+                    closed = True
+                    break
+                index += 1
+
+            # A row must be closed and as wide as the others, a value can't be part of a larger
+            # expression
+            if rows:
+                if (
+                    not closed
+                    or token_type(index) != TokenType.R_PAREN
+                    or width not in (None, count)
+                ):
+                    break
+                width = count
+                index += 1
+            elif not closed or token_type(index) not in (TokenType.COMMA, TokenType.R_PAREN):
+                break
+
+            size = len(values)
+            end = index
+
+            if token_type(index) != TokenType.COMMA:
+                break
+            index += 1
+
+        if size < self.LITERAL_BLOCK_MIN_SIZE:
+            return None
+
+        self._advance(end - self._index)
+        return self.expression(
+            exp.LiteralBlock, values=values[:size], is_string=is_string[:size], width=width
+        )
+
+    def _parse_values_csv(
+        self, parse_method: t.Callable, rows: bool = False
+    ) -> t.List[exp.Expression]:
+        block = self._parse_literal_block(rows=rows)
+        if not block:
+            return self._parse_csv(parse_method)
+        if not self._match(TokenType.COMMA):
+            return [block]
+        return [block, *self._parse_csv(parse_method)]
+
     def _parse_value(self) -> exp.Tuple:
         if self._match(TokenType.L_PAREN):
             expressions = self._parse_csv(self._parse_expression)
@@ -2274,7 +2386,7 @@ class Parser(metaclass=_Parser):
         elif self._match(TokenType.VALUES):
             this = self.expression(
                 exp.Values,
-                expressions=self._parse_csv(self._parse_value),
+                expressions=self._parse_values_csv(self._parse_value, rows=True),
                 alias=self._parse_table_alias(),
             )
         elif from_:
@@ -2850,7 +2962,7 @@ class Parser(metaclass=_Parser):
         if not is_derived and not self._match(TokenType.VALUES):
             return None
 
-        expressions = self._parse_csv(self._parse_value)
+        expressions = self._parse_values_csv(self._parse_value, rows=True)
         alias = self._parse_table_alias()
 
         if is_derived:
@@ -3369,7 +3481,11 @@ class Parser(metaclass=_Parser):
             this = self.expression(exp.In, this=this, unnest=unnest)
         elif self._match_set((TokenType.L_PAREN, TokenType.L_BRACKET)):
             matched_l_paren = self._prev.token_type == TokenType.L_PAREN
-            expressions = self._parse_csv(lambda: self._parse_select_or_expression(alias=alias))
+            # The values of a PIVOT's IN are kept as nodes, since they name its output columns
+            if matched_l_paren and not alias:
+                expressions = self._parse_values_csv(self._parse_select_or_expression)
+            else:
+                expressions = self._parse_csv(lambda: self._parse_select_or_expression(alias=alias))
 
             if len(expressions) == 1 and isinstance(expressions[0], exp.Subqueryable):
                 this = self.expression(exp.In, this=this, query=expressions[0])
@@ -3477,8 +3593,8 @@ class Parser(metaclass=_Parser):
         else:
             factor = self._parse_tokens(self._parse_unary, self.FACTOR)
         if isinstance(factor, exp.Div):
-            factor.args["typed"] = self.dialect.TYPED_DIVISION
-            factor.args["safe"] = self.dialect.SAFE_DIVISION
+            factor.set("typed", self.dialect.TYPED_DIVISION)
+            factor.set("safe", self.dialect.SAFE_DIVISION)
         return factor
 
     def _parse_exponent(self) -> t.Optional[exp.Expression]:
@@ -106,6 +106,25 @@ class Schema(abc.ABC):
         name = column if isinstance(column, str) else column.name
         return name in self.column_names(table, dialect=dialect, normalize=normalize)
 
+    def partition_columns(
+        self,
+        table: exp.Table | str,
+        dialect: DialectType = None,
+        normalize: t.Optional[bool] = None,
+    ) -> t.List[str]:
+        """
+        Get the names of the columns that a table is partitioned by.
+
+        Args:
+            table: the `Table` expression instance.
+            dialect: the SQL dialect that will be used to parse `table` if it's a string.
+            normalize: whether to normalize identifiers according to the dialect of interest.
+
+        Returns:
+            The list of partition column names, which is empty if the partitioning is unknown.
+        """
+        return []
+
     @property
     @abc.abstractmethod
     def supported_table_args(self) -> t.Tuple[str, ...]:
@@ -203,6 +222,11 @@ class MappingSchema(AbstractMappingSchema, Schema):
             1. {table: set(*cols)}}
             2. {db: {table: set(*cols)}}}
             3. {catalog: {db: {table: set(*cols)}}}}
+        partitions: Optional mapping of the columns each table is partitioned by, e.g. the columns of a
+            Doris `PARTITION BY RANGE` clause. The nesting should mirror that of the schema:
+            1. {table: [*cols]}
+            2. {db: {table: [*cols]}}
+            3. {catalog: {db: {table: [*cols]}}}
         dialect: The dialect to be used for custom type mappings & parsing string arguments.
         normalize: Whether to normalize identifier names according to the given dialect or not.
     """
@@ -213,11 +237,14 @@ class MappingSchema(AbstractMappingSchema, Schema):
         visible: t.Optional[t.Dict] = None,
         dialect: DialectType = None,
         normalize: bool = True,
+        partitions: t.Optional[t.Dict] = None,
     ) -> None:
         self.dialect = dialect
         self.visible = visible or {}
+        self.partitions = partitions or {}
         self.normalize = normalize
         self._type_mapping_cache: t.Dict[str, exp.DataType] = {}
+        self._column_type_cache: t.Dict[t.Tuple, exp.DataType] = {}
         self._depth = 0
 
         super().__init__(self._normalize(schema or {}))
@@ -229,6 +256,7 @@ class MappingSchema(AbstractMappingSchema, Schema):
             visible=mapping_schema.visible,
             dialect=mapping_schema.dialect,
             normalize=mapping_schema.normalize,
+            partitions=mapping_schema.partitions,
         )
 
     def copy(self, **kwargs) -> MappingSchema:
@@ -238,6 +266,7 @@ class MappingSchema(AbstractMappingSchema, Schema):
                 "visible": self.visible.copy(),
                 "dialect": self.dialect,
                 "normalize": self.normalize,
+                "partitions": self.partitions.copy(),
                 **kwargs,
             }
         )
@@ -282,6 +311,7 @@ class MappingSchema(AbstractMappingSchema, Schema):
 
         nested_set(self.mapping, tuple(reversed(parts)), normalized_column_mapping)
         new_trie([parts], self.mapping_trie)
+        self._column_type_cache.clear()
 
     def column_names(
         self,
@@ -302,12 +332,48 @@ class MappingSchema(AbstractMappingSchema, Schema):
         visible = self.nested_get(self.table_parts(normalized_table), self.visible) or []
         return [col for col in schema if col in visible]
 
+    def partition_columns(
+        self,
+        table: exp.Table | str,
+        dialect: DialectType = None,
+        normalize: t.Optional[bool] = None,
+    ) -> t.List[str]:
+        if not self.partitions:
+            return []
+
+        normalized_table = self._normalize_table(table, dialect=dialect, normalize=normalize)
+        partitions = self.nested_get(
+            self.table_parts(normalized_table), self.partitions, raise_on_missing=False
+        )
+
+        return [
+            self._normalize_name(column, dialect=dialect, normalize=normalize)
+            for column in partitions or []
+        ]
+
     def get_column_type(
         self,
         table: exp.Table | str,
         column: exp.Column | str,
         dialect: DialectType = None,
         normalize: t.Optional[bool] = None,
+    ) -> exp.DataType:
+        key = _column_type_key(table, column, dialect, normalize)
+        if key is not None:
+            column_type = self._column_type_cache.get(key)
+            if column_type is None:
+                column_type = self._get_column_type(table, column, dialect, normalize)
+                self._column_type_cache[key] = column_type
+            return column_type
+
+        return self._get_column_type(table, column, dialect, normalize)
+
+    def _get_column_type(
+        self,
+        table: exp.Table | str,
+        column: exp.Column | str,
+        dialect: DialectType = None,
+        normalize: t.Optional[bool] = None,
     ) -> exp.DataType:
         normalized_table = self._normalize_table(table, dialect=dialect, normalize=normalize)
 
@@ -440,6 +506,52 @@ class MappingSchema(AbstractMappingSchema, Schema):
         return self._type_mapping_cache[schema_type]
 
 
+def _identifier_key(identifier: t.Any) -> t.Optional[t.Tuple[str, bool]]:
+    if isinstance(identifier, str):
+        return (identifier, False)
+    if isinstance(identifier, exp.Identifier):
+        return (identifier.this, bool(identifier.quoted))
+    return None
+
+
+def _column_type_key(
+    table: exp.Table | str,
+    column: exp.Column | str,
+    dialect: DialectType,
+    normalize: t.Optional[bool],
+) -> t.Optional[t.Tuple]:
+    """
+    Builds the key under which `MappingSchema.get_column_type` memoizes a lookup, or None if
+    the arguments can't be keyed cheaply (e.g. a table that wraps a function call).
+    """
+    if isinstance(table, str):
+        table_key: t.Tuple = (table,)
+    else:
+        table_key = ()
+        for arg in exp.TABLE_PARTS:
+            value = table.args.get(arg)
+            if value is None:
+                continue
+
+            part = _identifier_key(value)
+            if part is None:
+                return None
+
+            table_key += (arg, *part)
+
+    column_key = _identifier_key(column if isinstance(column, str) else column.this)
+    if column_key is None:
+        return None
+
+    key = (table_key, column_key, dialect, normalize)
+    try:
+        hash(key)
+    except TypeError:
+        return None
+
+    return key
+
+
 def normalize_name(
     identifier: str | exp.Identifier,
     dialect: DialectType = None,
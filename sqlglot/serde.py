@@ -1,10 +1,17 @@
 from __future__ import annotations
 
+import io
+import json
+import mmap
+import pickle
+import struct
 import typing as t
 
 from sqlglot import expressions as exp
 
 if t.TYPE_CHECKING:
+    from multiprocessing.shared_memory import SharedMemory
+
     JSON = t.Union[dict, list, str, float, int, bool, None]
     Node = t.Union[t.List["Node"], exp.DataType.Type, exp.Expression, JSON]
 
@@ -66,3 +73,506 @@ def load(obj: JSON) -> Node:
 
         return expression
     return obj
+
+
+# Binary format
+#
+# A dump starts with MAGIC, followed by one length-prefixed record per AST. Each record is
+# self-contained, so a reader can skip to any record (e.g. in an mmap'd file) without decoding
+# the ones before it. A record holds:
+#
+#   - a string table: every distinct string in the AST, each stored once
+#   - a class table: the string ids of the qualified names of the expression classes used
+#   - the root value, where strings and classes are referenced by their ids
+#
+# Integers (lengths, ids and int values) are encoded as unsigned LEB128 varints, and signed ints
+# are zigzag-encoded first.
+MAGIC = b"SQLGLOT\x01"
+
+_NONE = 0
+_TRUE = 1
+_FALSE = 2
+_INT = 3
+_FLOAT = 4
+_STR = 5
+_LIST = 6
+_NODE = 7
+_TYPE = 8
+
+_HAS_TYPE = 1
+_HAS_COMMENTS = 2
+_HAS_META = 4
+# Set by the records of pickled trees, whose meta is pickled too rather than dumped as JSON
+_HAS_PICKLED_META = 8
+
+# Markers for the non-value entries on the encoder's stack
+_KEY = object()
+_TRAILER = object()
+
+_FLOAT_STRUCT = struct.Struct("<d")
+_SIZE_STRUCT = struct.Struct("<Q")
+
+# Maps qualified class names to the classes themselves, so they're only resolved once
+_CLASSES: t.Dict[str, t.Type[exp.Expression]] = {}
+
+
+def dump_bytes(node: Node) -> bytes:
+    """
+    Dump an AST into the binary format, which is more compact and faster to load than `dump`.
+
+    Example:
+        >>> from sqlglot import parse_one
+        >>> load_bytes(dump_bytes(parse_one("SELECT a FROM x"))).sql()
+        'SELECT a FROM x'
+    """
+    record = _encode(node)
+    return MAGIC + _varint(len(record)) + record
+
+
+def load_bytes(data: bytes | bytearray | memoryview) -> Node:
+    """
+    Load an AST from the output of `dump_bytes`.
+    """
+    return next(load_stream(data))
+
+
+def dump_stream(nodes: t.Iterable[Node], stream: t.BinaryIO) -> None:
+    """
+    Dump a sequence of ASTs into a binary stream, one record at a time.
+    """
+    stream.write(MAGIC)
+
+    for node in nodes:
+        record = _encode(node)
+        stream.write(_varint(len(record)))
+        stream.write(record)
+
+
+def load_stream(
+    source: t.BinaryIO | bytes | bytearray | memoryview | mmap.mmap,
+) -> t.Iterator[Node]:
+    """
+    Lazily load the ASTs written by `dump_stream` or `dump_bytes`.
+
+    Args:
+        source: a binary stream, or a buffer such as bytes or an mmap object. Buffers are read
+            in place, without copying the records out of them.
+
+    Yields:
+        The ASTs, in the order they were dumped.
+    """
+    if hasattr(source, "read") and not isinstance(source, mmap.mmap):
+        stream = t.cast(t.BinaryIO, source)
+
+        if stream.read(len(MAGIC)) != MAGIC:
+            raise ValueError("Not a binary sqlglot dump")
+
+        while True:
+            length = _read_stream_varint(stream)
+            if length is None:
+                return
+
+            record = stream.read(length)
+            if len(record) != length:
+                raise ValueError("Truncated binary sqlglot dump")
+
+            yield _decode(record, 0, length)
+    else:
+        view = memoryview(t.cast(bytes, source))
+
+        if view[: len(MAGIC)] != MAGIC:
+            raise ValueError("Not a binary sqlglot dump")
+
+        pos = len(MAGIC)
+        while pos < len(view):
+            length, start = _read_varint(view, pos)
+            pos = start + length
+
+            if pos > len(view):
+                raise ValueError("Truncated binary sqlglot dump")
+
+            yield _decode(view, start, pos)
+
+
+def _dump_pickled(node: Node) -> bytes:
+    """Dump an AST into a record that `Expression.__reduce__` pickles, along with any meta."""
+    return _encode(node, pickle_meta=True)
+
+
+def _load_pickled(record: bytes) -> Node:
+    """Load an AST from the output of `_dump_pickled`, when it's unpickled."""
+    return _decode(record, 0, len(record), unpickle=True)
+
+
+def dump_shared(nodes: t.Iterable[Node], name: t.Optional[str] = None) -> SharedMemory:
+    """
+    Dump a sequence of ASTs into a new shared memory block, so that other processes can load them
+    by name without re-parsing their SQL or pickling them one by one.
+
+    The caller owns the returned block, and is responsible for closing and unlinking it.
+
+    Example:
+        >>> from sqlglot import parse_one
+        >>> shm = dump_shared([parse_one("SELECT a FROM x")])
+        >>> [e.sql() for e in load_shared(shm.name)]
+        ['SELECT a FROM x']
+        >>> shm.close()
+        >>> shm.unlink()
+
+    Args:
+        nodes: the ASTs to dump.
+        name: the name of the shared memory block. A unique name is generated if omitted.
+
+    Returns:
+        The shared memory block.
+    """
+    from multiprocessing.shared_memory import SharedMemory
+
+    stream = io.BytesIO()
+    dump_stream(nodes, stream)
+    data = stream.getbuffer()
+
+    # The block may be larger than requested, so the dump is prefixed with its actual size
+    shm = SharedMemory(name=name, create=True, size=_SIZE_STRUCT.size + len(data))
+    buf = t.cast(memoryview, shm.buf)
+    _SIZE_STRUCT.pack_into(buf, 0, len(data))
+    buf[_SIZE_STRUCT.size : _SIZE_STRUCT.size + len(data)] = data
+
+    return shm
+
+
+def load_shared(name: str) -> t.List[Node]:
+    """
+    Load the ASTs of a shared memory block created by `dump_shared`.
+    """
+    from multiprocessing.shared_memory import SharedMemory
+
+    shm = SharedMemory(name=name)
+    try:
+        buf = t.cast(memoryview, shm.buf)
+        (size,) = _SIZE_STRUCT.unpack_from(buf, 0)
+        view = buf[_SIZE_STRUCT.size : _SIZE_STRUCT.size + size]
+        try:
+            return list(load_stream(view))
+        finally:
+            view.release()
+    finally:
+        shm.close()
+
+
+def _varint(value: int) -> bytes:
+    out = bytearray()
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def _read_stream_varint(stream: t.BinaryIO) -> t.Optional[int]:
+    result = shift = 0
+
+    while True:
+        byte = stream.read(1)
+        if not byte:
+            if shift:
+                raise ValueError("Truncated binary sqlglot dump")
+            return None
+
+        result |= (byte[0] & 0x7F) << shift
+        if byte[0] < 0x80:
+            return result
+        shift += 7
+
+
+def _class_name(klass: t.Type[exp.Expression]) -> str:
+    name = klass.__qualname__
+    if klass.__module__ != exp.__name__:
+        name = f"{klass.__module__}.{name}"
+    return name
+
+
+def _load_class(name: str) -> t.Type[exp.Expression]:
+    klass = _CLASSES.get(name)
+
+    if klass is None:
+        if "." in name:
+            module_path, class_name = name.rsplit(".", maxsplit=1)
+            module = __import__(module_path, fromlist=[class_name])
+        else:
+            module, class_name = exp, name
+
+        klass = _CLASSES[name] = getattr(module, class_name)
+
+    return klass
+
+
+def _encode(node: Node, pickle_meta: bool = False) -> bytes:
+    strings: t.Dict[str, int] = {}
+    classes: t.Dict[t.Type[exp.Expression], int] = {}
+    body = bytearray()
+
+    def string(value: str) -> None:
+        index = strings.get(value)
+        if index is None:
+            index = strings[value] = len(strings)
+        body.extend(_varint(index))
+
+    # The tree is written iteratively, so that deep trees don't exhaust the recursion limit. The
+    # stack holds values to write, keys as (_KEY, key) and pending node trailers as (_TRAILER, node)
+    stack: t.List[t.Any] = [node]
+
+    while stack:
+        value = stack.pop()
+
+        if type(value) is tuple and value and (value[0] is _KEY or value[0] is _TRAILER):
+            kind, item = value
+            if kind is _KEY:
+                string(item)
+                continue
+
+            if item.comments:
+                body.extend(_varint(len(item.comments)))
+                for comment in item.comments:
+                    string(comment)
+            if item._meta is not None and pickle_meta:
+                payload = pickle.dumps(item._meta, protocol=pickle.HIGHEST_PROTOCOL)
+                body.extend(_varint(len(payload)))
+                body.extend(payload)
+            elif item._meta is not None:
+                string(json.dumps(item._meta))
+        elif value is None:
+            body.append(_NONE)
+        elif value is True:
+            body.append(_TRUE)
+        elif value is False:
+            body.append(_FALSE)
+        elif isinstance(value, exp.Expression):
+            klass = value.__class__
+            class_id = classes.get(klass)
+            if class_id is None:
+                class_id = classes[klass] = len(classes)
+
+            args = [
+                (k, v)
+                for k, v in value.args.items()
+                if v is not None and not (type(v) is list and not v)
+            ]
+            meta_flag = _HAS_PICKLED_META if pickle_meta else _HAS_META
+            flags = (
+                (_HAS_TYPE if value._type is not None else 0)
+                | (_HAS_COMMENTS if value.comments else 0)
+                | (meta_flag if value._meta is not None else 0)
+            )
+
+            body.append(_NODE)
+            body.extend(_varint(class_id))
+            body.append(flags)
+            body.extend(_varint(len(args)))
+
+            if flags & (_HAS_COMMENTS | meta_flag):
+                stack.append((_TRAILER, value))
+            if flags & _HAS_TYPE:
+                stack.append(value._type)
+            for k, v in reversed(args):
+                stack.append(v)
+                stack.append((_KEY, k))
+        elif isinstance(value, str):
+            body.append(_STR)
+            string(value)
+        elif isinstance(value, exp.DataType.Type):
+            body.append(_TYPE)
+            string(value.value)
+        elif isinstance(value, int):
+            body.append(_INT)
+            body.extend(_varint(value << 1 if value >= 0 else (-value << 1) - 1))
+        elif isinstance(value, float):
+            body.append(_FLOAT)
+            body.extend(_FLOAT_STRUCT.pack(value))
+        elif isinstance(value, (list, tuple)):
+            body.append(_LIST)
+            body.extend(_varint(len(value)))
+            stack.extend(reversed(value))
+        else:
+            raise ValueError(f"Can't serialize value of type {type(value).__name__}: {value!r}")
+
+    class_table = [_class_name(klass) for klass in classes]
+    for name in class_table:
+        strings.setdefault(name, len(strings))
+
+    header = bytearray(_varint(len(strings)))
+    for value in strings:
+        encoded = value.encode("utf-8")
+        header.extend(_varint(len(encoded)))
+        header.extend(encoded)
+
+    header.extend(_varint(len(class_table)))
+    for name in class_table:
+        header.extend(_varint(strings[name]))
+
+    return bytes(header + body)
+
+
+def _read_varint(data: bytes | memoryview, pos: int) -> t.Tuple[int, int]:
+    result = shift = 0
+
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+
+def _decode(data: bytes | memoryview, pos: int, end: int, unpickle: bool = False) -> Node:
+    """
+    Decodes a single record. This is iterative rather than recursive, so that deep trees don't
+    exhaust the recursion limit, and it inlines the single-byte case of the varints on hot paths.
+    """
+    size, pos = _read_varint(data, pos)
+    strings = []
+    for _ in range(size):
+        length, pos = _read_varint(data, pos)
+        strings.append(str(data[pos : pos + length], "utf-8"))
+        pos += length
+
+    size, pos = _read_varint(data, pos)
+    classes = []
+    for _ in range(size):
+        index, pos = _read_varint(data, pos)
+        classes.append(_load_class(strings[index]))
+
+    # Node frames are [class, flags, remaining args, args, current key, reading type?, type] and
+    # list frames are [remaining items, items]
+    stack: t.List[t.List[t.Any]] = []
+    value: t.Any = None
+
+    while True:
+        tag = data[pos]
+        pos += 1
+
+        if tag == _NODE or tag == _LIST:
+            size = data[pos]
+            pos += 1
+            if size > 0x7F:
+                size, pos = _read_varint(data, pos - 1)
+
+            if tag == _LIST:
+                if size:
+                    stack.append([size, []])
+                    continue
+                value = []
+            else:
+                klass = classes[size]
+                flags = data[pos]
+                size = data[pos + 1]
+                pos += 2
+                if size > 0x7F:
+                    size, pos = _read_varint(data, pos - 1)
+
+                if size or flags & _HAS_TYPE:
+                    key = None
+                    if size:
+                        index = data[pos]
+                        pos += 1
+                        if index > 0x7F:
+                            index, pos = _read_varint(data, pos - 1)
+                        key = strings[index]
+
+                    stack.append([klass, flags, size, {}, key, not size, None])
+                    continue
+
+                value, pos = _finalize(klass(), flags, None, strings, data, pos, unpickle)
+        elif tag == _STR:
+            index = data[pos]
+            pos += 1
+            if index > 0x7F:
+                index, pos = _read_varint(data, pos - 1)
+            value = strings[index]
+        elif tag == _NONE:
+            value = None
+        elif tag == _TRUE:
+            value = True
+        elif tag == _FALSE:
+            value = False
+        elif tag == _TYPE:
+            index, pos = _read_varint(data, pos)
+            value = exp.DataType.Type(strings[index])
+        elif tag == _INT:
+            value, pos = _read_varint(data, pos)
+            value = value >> 1 if not value & 1 else -((value + 1) >> 1)
+        elif tag == _FLOAT:
+            value = _FLOAT_STRUCT.unpack_from(data, pos)[0]
+            pos += _FLOAT_STRUCT.size
+        else:
+            raise ValueError(f"Unknown tag {tag} in binary sqlglot dump")
+
+        # Hand the value over to the enclosing frames, completing the ones that are now full
+        while stack:
+            frame = stack[-1]
+
+            if len(frame) == 2:
+                frame[1].append(value)
+                frame[0] -= 1
+                if frame[0]:
+                    break
+                value = frame[1]
+            elif frame[5]:
+                value, pos = _finalize(
+                    frame[0](**frame[3]), frame[1], value, strings, data, pos, unpickle
+                )
+            else:
+                frame[3][frame[4]] = value
+                frame[2] -= 1
+
+                if frame[2]:
+                    index, pos = _read_varint(data, pos)
+                    frame[4] = strings[index]
+                    break
+                if frame[1] & _HAS_TYPE:
+                    frame[5] = True
+                    break
+
+                value, pos = _finalize(
+                    frame[0](**frame[3]), frame[1], None, strings, data, pos, unpickle
+                )
+
+            stack.pop()
+        else:
+            if pos != end:
+                raise ValueError("Malformed binary sqlglot dump")
+            return value
+
+
+def _finalize(
+    expression: exp.Expression,
+    flags: int,
+    data_type: t.Any,
+    strings: t.List[str],
+    data: bytes | memoryview,
+    pos: int,
+    unpickle: bool = False,
+) -> t.Tuple[exp.Expression, int]:
+    if data_type is not None:
+        expression.type = data_type
+    if flags & _HAS_COMMENTS:
+        size, pos = _read_varint(data, pos)
+        comments = []
+        for _ in range(size):
+            index, pos = _read_varint(data, pos)
+            comments.append(strings[index])
+        expression.comments = comments
+    if flags & _HAS_META:
+        index, pos = _read_varint(data, pos)
+        expression._meta = json.loads(strings[index])
+    elif flags & _HAS_PICKLED_META:
+        # Unpickling can run arbitrary code, so only pickle itself may load these records
+        if not unpickle:
+            raise ValueError("Pickled sqlglot records can only be loaded by pickle")
+
+        size, pos = _read_varint(data, pos)
+        expression._meta = pickle.loads(data[pos : pos + size])
+        pos += size
+
+    return expression, pos
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+import sys
 import typing as t
 from enum import auto
 
@@ -26,6 +27,11 @@ except ImportError:
 
 
 class TokenType(AutoName):
+    # Enum.__hash__ is implemented in Python, so every lookup in the parser's token type tables
+    # and sets (e.g. in _match_set) paid for a function call. Members are singletons that compare
+    # by identity, so hashing them by identity is equivalent and stays in C
+    __hash__ = object.__hash__
+
     L_PAREN = auto()
     R_PAREN = auto()
     L_BRACKET = auto()
@@ -1030,10 +1036,16 @@ class Tokenizer(metaclass=_Tokenizer):
             self.tokens[-1].comments.extend(self._comments)
             self._comments = []
 
+        text = self._text if text is None else text
+
+        # Names repeat a lot in large scripts, so their text is shared between tokens and ASTs
+        if token_type in (TokenType.VAR, TokenType.IDENTIFIER):
+            text = sys.intern(text)
+
         self.tokens.append(
             Token(
                 token_type,
-                text=self._text if text is None else text,
+                text=text,
                 line=self._line,
                 col=self._col,
                 start=self._start,
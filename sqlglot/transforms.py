@@ -3,11 +3,17 @@ from __future__ import annotations
 import typing as t
 
 from sqlglot import expressions as exp
-from sqlglot.helper import find_new_name, name_sequence
+from sqlglot.helper import ensure_list, find_new_name, name_sequence
 
 if t.TYPE_CHECKING:
     from sqlglot.generator import Generator
 
+    Rule = t.Callable[[exp.Expression], t.Optional[exp.Expression]]
+    RuleSet = t.Dict[
+        t.Union[t.Type[exp.Expression], t.Tuple[t.Type[exp.Expression], ...]],
+        t.Union[Rule, t.Sequence[Rule]],
+    ]
+
 
 def unalias_group(expression: exp.Expression) -> exp.Expression:
     """
@@ -150,7 +156,7 @@ def unnest_to_explode(expression: exp.Expression) -> exp.Expression:
                 alias = unnest.args.get("alias")
                 udtf = exp.Posexplode if unnest.args.get("offset") else exp.Explode
 
-                expression.args["joins"].remove(join)
+                join.pop()
 
                 for e, column in zip(unnest.expressions, alias.columns if alias else []):
                     expression.append(
@@ -169,7 +175,10 @@ def explode_to_unnest(index_offset: int = 0) -> t.Callable[[exp.Expression], exp
     """Convert explode/posexplode into unnest."""
 
     def _explode_to_unnest(expression: exp.Expression) -> exp.Expression:
-        if isinstance(expression, exp.Select):
+        # Building the scope is costly, so we only do it for SELECTs that contain [POS]EXPLODE
+        if isinstance(expression, exp.Select) and any(
+            select.find(exp.Explode) for select in expression.selects
+        ):
             from sqlglot.optimizer.scope import Scope
 
             taken_select_names = set(expression.named_selects)
@@ -402,7 +411,7 @@ def eliminate_full_outer_join(expression: exp.Expression) -> exp.Expression:
             index, full_outer_join = full_outer_joins[0]
             full_outer_join.set("side", "left")
             expression_copy.args["joins"][index].set("side", "right")
-            expression_copy.args.pop("with", None)  # remove CTEs from RIGHT side
+            expression_copy.set("with", None)  # remove CTEs from RIGHT side
 
             return exp.union(expression, expression_copy, copy=False)
 
@@ -434,7 +443,8 @@ def move_ctes_to_top_level(expression: exp.Expression) -> exp.Expression:
             if inner_with.recursive:
                 top_level_with.set("recursive", True)
 
-            top_level_with.expressions.extend(inner_with.expressions)
+            for cte in inner_with.expressions:
+                top_level_with.append("expressions", cte)
 
     return expression
 
@@ -451,9 +461,14 @@ def ensure_bools(expression: exp.Expression) -> exp.Expression:
         ):
             node.replace(node.neq(0))
 
-    for node, *_ in expression.walk():
-        ensure_bools(node, _ensure_bool)
+    def _ensure_bools(node: exp.Expression) -> exp.Expression:
+        return ensure_bools(node, _ensure_bool)
 
+    rewrite(
+        expression,
+        {(exp.Connector, exp.Not, exp.If, exp.Where, exp.Having): _ensure_bools},
+        copy=False,
+    )
     return expression
 
 
@@ -466,6 +481,73 @@ def unqualify_columns(expression: exp.Expression) -> exp.Expression:
     return expression
 
 
+def rewrite(
+    expression: exp.Expression, rules: RuleSet, copy: bool = True
+) -> t.Optional[exp.Expression]:
+    """
+    Applies many node-type-dispatched rules to a tree in a single traversal, instead of running
+    one `Expression.transform` pass (and usually making one copy) per rule.
+
+    The tree is visited top-down and, for each node, the rules registered for its type or any of
+    its base classes are applied in the order they were registered, each receiving the result of
+    the previous one. Like in `Expression.transform`, the replacement of a node isn't visited, and
+    a rule that returns None removes the node from the tree.
+
+    Example:
+        >>> import sqlglot
+        >>> rules = {
+        ...     exp.Column: lambda c: exp.column(c.name),
+        ...     exp.Literal: lambda l: exp.Literal.number(int(l.name) + 1) if l.is_int else l,
+        ... }
+        >>> rewrite(sqlglot.parse_one("SELECT x.a FROM x WHERE x.b = 1"), rules).sql()
+        'SELECT a FROM x WHERE b = 2'
+
+    Args:
+        expression: the root of the tree to rewrite.
+        rules: a mapping from expression types, or tuples of expression types, to the rule or
+            list of rules to apply to the nodes of these types.
+        copy: whether to rewrite a copy of the tree, instead of modifying it in place.
+
+    Returns:
+        The rewritten tree, or None if its root was removed.
+    """
+    registered = [
+        (types, t.cast("t.List[Rule]", ensure_list(rule))) for types, rule in rules.items()
+    ]
+    dispatch: t.Dict[t.Type[exp.Expression], t.List[Rule]] = {}
+
+    root: t.Optional[exp.Expression] = expression.copy() if copy else expression
+    stack = [t.cast(exp.Expression, root)]
+
+    while stack:
+        node = stack.pop()
+        klass = node.__class__
+
+        if klass not in dispatch:
+            dispatch[klass] = [
+                rule for types, rules_ in registered if issubclass(klass, types) for rule in rules_
+            ]
+
+        new_node: t.Optional[exp.Expression] = node
+        for rule in dispatch[klass]:
+            if new_node is None:
+                break
+            new_node = rule(new_node)
+
+        if new_node is not node:
+            if node is root:
+                root = new_node
+                if new_node is not None:
+                    new_node.parent = node.parent
+            else:
+                node.replace(new_node)
+            continue
+
+        stack.extend(reversed([child for _, child in node.iter_expressions()]))
+
+    return root
+
+
 def preprocess(
     transforms: t.List[t.Callable[[exp.Expression], exp.Expression]],
 ) -> t.Callable[[Generator, exp.Expression], str]:
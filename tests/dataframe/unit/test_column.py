@@ -125,6 +125,15 @@ class TestDataframeColumn(unittest.TestCase):
             "CASE WHEN cola = 1 THEN 2 WHEN colb = 2 THEN 3 END",
             F.col("cola").when(F.col("cola") == 1, 2).when(F.col("colb") == 2, 3).sql(),
         )
+
+        # Adding a branch to a hashed CASE clears its cached hash
+        case = F.when(F.col("cola") == 1, 2)
+        hash(case.expression)
+        self.assertEqual(
+            case.when(F.col("colb") == 2, 3).expression,
+            F.when(F.col("cola") == 1, 2).when(F.col("colb") == 2, 3).expression,
+        )
+        self.assertNotEqual(case.when(F.col("colb") == 2, 3).expression, case.expression)
         self.assertEqual(
             "CASE WHEN cola = 1 THEN 2 WHEN colb = 2 THEN 3 ELSE 4 END",
             F.when(F.col("cola") == 1, 2).when(F.col("colb") == 2, 3).otherwise(4).sql(),
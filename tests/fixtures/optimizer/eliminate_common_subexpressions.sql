@@ -0,0 +1,52 @@
+# title: Repeated function across projection and ordering
+SELECT ABS(x.a) AS a FROM x AS x ORDER BY ABS(x.a);
+SELECT _q_0._cse_0 AS a FROM (SELECT ABS(x.a) AS _cse_0 FROM x AS x) AS _q_0 ORDER BY _q_0._cse_0;
+
+# title: The WHERE moves into the derived table, so the filter still guards the hoisted functions
+SELECT CAST(w.d AS INT) + 1 AS a, CAST(w.d AS INT) * 2 AS b FROM w AS w WHERE w.d <> 'a';
+SELECT _q_0._cse_0 + 1 AS a, _q_0._cse_0 * 2 AS b FROM (SELECT CAST(w.d AS INT) AS _cse_0 FROM w AS w WHERE w.d <> 'a') AS _q_0;
+
+# title: Repeated cast in projection and grouping
+SELECT CAST(x.a AS TEXT) AS a, COUNT(*) AS c FROM x AS x WHERE CAST(x.a AS TEXT) <> '2' GROUP BY CAST(x.a AS TEXT) ORDER BY a;
+SELECT _q_0._cse_0 AS a, COUNT(*) AS c FROM (SELECT CAST(x.a AS TEXT) AS _cse_0 FROM x AS x WHERE CAST(x.a AS TEXT) <> '2') AS _q_0 GROUP BY _q_0._cse_0 ORDER BY a;
+
+# title: Uses in the WHERE alone aren't hoisted
+SELECT ABS(x.a) AS a FROM x AS x WHERE ABS(x.a) > 1;
+SELECT ABS(x.a) AS a FROM x AS x WHERE ABS(x.a) > 1;
+
+# title: Only the outermost repeated expression is hoisted
+SELECT ABS(COALESCE(x.a, x.b)) AS a, ABS(COALESCE(x.a, x.b)) + x.b AS b FROM x AS x;
+SELECT _q_0._cse_0 AS a, _q_0._cse_0 + _q_0.b AS b FROM (SELECT x.b AS b, ABS(COALESCE(x.a, x.b)) AS _cse_0 FROM x AS x) AS _q_0;
+
+# title: Joins move into the derived table and clashing columns are renamed
+SELECT x.b, y.b, ABS(x.a - y.c) AS d FROM x AS x JOIN y AS y ON x.b = y.b WHERE x.a < 2 ORDER BY ABS(x.a - y.c);
+SELECT _q_0.b, _q_0.b_2 AS b, _q_0._cse_0 AS d FROM (SELECT x.b AS b, y.b AS b_2, ABS(x.a - y.c) AS _cse_0 FROM x AS x JOIN y AS y ON x.b = y.b WHERE x.a < 2) AS _q_0 ORDER BY _q_0._cse_0;
+
+# title: Repeated expression inside an aggregate
+SELECT SUM(ABS(x.a)) AS s, MAX(ABS(x.a)) AS m FROM x AS x;
+SELECT SUM(_q_0._cse_0) AS s, MAX(_q_0._cse_0) AS m FROM (SELECT ABS(x.a) AS _cse_0 FROM x AS x) AS _q_0;
+
+# title: Nested scopes are rewritten independently
+SELECT ABS(q.a) AS a FROM (SELECT ABS(x.a) AS a, ABS(x.a) + 1 AS b FROM x AS x) AS q ORDER BY ABS(q.a);
+SELECT _q_1._cse_0 AS a FROM (SELECT ABS(q.a) AS _cse_0 FROM (SELECT _q_0._cse_0 AS a, _q_0._cse_0 + 1 AS b FROM (SELECT ABS(x.a) AS _cse_0 FROM x AS x) AS _q_0) AS q) AS _q_1 ORDER BY _q_1._cse_0;
+
+# title: Expressions that appear once are left alone
+SELECT ABS(x.a) AS a, ABS(x.b) AS b FROM x AS x;
+SELECT ABS(x.a) AS a, ABS(x.b) AS b FROM x AS x;
+
+# title: Nondeterministic functions are not hoisted
+# execute: false
+SELECT RAND(x.a) AS a FROM x AS x ORDER BY RAND(x.a);
+SELECT RAND(x.a) AS a FROM x AS x ORDER BY RAND(x.a);
+
+# title: Aggregates are not hoisted
+SELECT SUM(x.a) AS s FROM x AS x HAVING SUM(x.a) > 1;
+SELECT SUM(x.a) AS s FROM x AS x HAVING SUM(x.a) > 1;
+
+# title: Correlated subqueries are left alone
+SELECT ABS(x.a) AS a FROM x AS x WHERE EXISTS(SELECT 1 FROM y AS y WHERE y.b = x.a) ORDER BY ABS(x.a);
+SELECT ABS(x.a) AS a FROM x AS x WHERE EXISTS(SELECT 1 FROM y AS y WHERE y.b = x.a) ORDER BY ABS(x.a);
+
+# title: Uncorrelated subqueries move with the WHERE
+SELECT ABS(x.a) AS a FROM x AS x WHERE x.a IN (SELECT y.b AS b FROM y AS y) ORDER BY ABS(x.a);
+SELECT _q_0._cse_0 AS a FROM (SELECT ABS(x.a) AS _cse_0 FROM x AS x WHERE x.a IN (SELECT y.b AS b FROM y AS y)) AS _q_0 ORDER BY _q_0._cse_0;
@@ -0,0 +1,86 @@
+# dialect: doris
+SELECT t.x AS x FROM t AS t WHERE DATE_FORMAT(t.dt, '%Y%m%d') = '20240101';
+SELECT t.x AS x FROM t AS t WHERE t.dt >= CAST('2024-01-01' AS DATE) AND t.dt < CAST('2024-01-02' AS DATE);
+
+# dialect: doris
+SELECT t.x AS x FROM t AS t WHERE DATE_FORMAT(t.dt, '%Y-%m') >= '2024-01' AND t.x = 1;
+SELECT t.x AS x FROM t AS t WHERE t.dt >= CAST('2024-01-01' AS DATE) AND t.x = 1;
+
+# dialect: doris
+SELECT t.x AS x FROM t AS t WHERE DATE_FORMAT(t.dt, '%Y%m%d') <= '20240105';
+SELECT t.x AS x FROM t AS t WHERE t.dt < CAST('2024-01-06' AS DATE);
+
+# dialect: doris
+SELECT t.x AS x FROM t AS t WHERE '2024' < DATE_FORMAT(t.dt, '%Y');
+SELECT t.x AS x FROM t AS t WHERE t.dt >= CAST('2025-01-01' AS DATE);
+
+# dialect: doris
+SELECT t.x AS x FROM t AS t WHERE DATE_FORMAT(t.dt, '%Y%m') IN ('202401', '202402', '202406');
+SELECT t.x AS x FROM t AS t WHERE (t.dt >= CAST('2024-01-01' AS DATE) AND t.dt < CAST('2024-03-01' AS DATE)) OR (t.dt >= CAST('2024-06-01' AS DATE) AND t.dt < CAST('2024-07-01' AS DATE));
+
+# dialect: doris
+SELECT t.x AS x FROM t AS t WHERE DATE_TRUNC(t.dt, 'month') = '2024-01-01';
+SELECT t.x AS x FROM t AS t WHERE t.dt >= CAST('2024-01-01' AS DATE) AND t.dt < CAST('2024-02-01' AS DATE);
+
+# dialect: doris
+SELECT t.x AS x FROM t AS t WHERE DATE_TRUNC(t.dt, 'year') > CAST('2023-01-01' AS DATE);
+SELECT t.x AS x FROM t AS t WHERE t.dt >= CAST('2024-01-01' AS DATE);
+
+# dialect: clickhouse
+SELECT t.x AS x FROM t AS t WHERE toYYYYMM(t.dt) = 202401;
+SELECT t.x AS x FROM t AS t WHERE t.dt >= CAST('2024-01-01' AS DATE) AND t.dt < CAST('2024-02-01' AS DATE);
+
+# title: partitions of subqueries are pruned too
+# dialect: doris
+SELECT u.x AS x FROM u AS u WHERE u.x IN (SELECT t.x AS x FROM t AS t WHERE DATE_FORMAT(t.dt, '%Y') = '2024');
+SELECT u.x AS x FROM u AS u WHERE u.x IN (SELECT t.x AS x FROM t AS t WHERE t.dt >= CAST('2024-01-01' AS DATE) AND t.dt < CAST('2025-01-01' AS DATE));
+
+# title: the date can never be equal to the truncated column
+# dialect: doris
+SELECT t.x AS x FROM t AS t WHERE DATE_TRUNC(t.dt, 'month') = '2024-01-02';
+SELECT t.x AS x FROM t AS t WHERE DATE_TRUNC(t.dt, 'MONTH') = '2024-01-02';
+
+# title: NEQ isn't rewritten
+# dialect: doris
+SELECT t.x AS x FROM t AS t WHERE DATE_FORMAT(t.dt, '%Y%m') <> '202401';
+SELECT t.x AS x FROM t AS t WHERE DATE_FORMAT(t.dt, '%Y%m') <> '202401';
+
+# title: the value doesn't sort like formatted dates
+# dialect: doris
+SELECT t.x AS x FROM t AS t WHERE DATE_FORMAT(t.dt, '%Y-%m') >= '2024-1';
+SELECT t.x AS x FROM t AS t WHERE DATE_FORMAT(t.dt, '%Y-%m') >= '2024-1';
+
+# title: the format isn't monotonic
+# dialect: doris
+SELECT t.x AS x FROM t AS t WHERE DATE_FORMAT(t.dt, '%m') = '01';
+SELECT t.x AS x FROM t AS t WHERE DATE_FORMAT(t.dt, '%m') = '01';
+
+# title: not a partition column
+# dialect: doris
+SELECT t.x AS x FROM t AS t WHERE DATE_FORMAT(t.created, '%Y%m%d') = '20240101';
+SELECT t.x AS x FROM t AS t WHERE DATE_FORMAT(t.created, '%Y%m%d') = '20240101';
+
+# title: the partition column isn't temporal
+# dialect: doris
+SELECT u.x AS x FROM u AS u WHERE DATE_FORMAT(u.day, '%Y%m%d') = '20240101';
+SELECT u.x AS x FROM u AS u WHERE DATE_FORMAT(u.day, '%Y%m%d') = '20240101';
+
+# title: overlapping ranges are intersected
+# dialect: doris
+SELECT t.x AS x FROM t AS t WHERE DATE_FORMAT(t.dt, '%Y%m') = '202401' AND t.dt >= CAST('2024-01-15' AS DATE) AND t.x = 1;
+SELECT t.x AS x FROM t AS t WHERE t.dt < CAST('2024-02-01' AS DATE) AND t.dt >= CAST('2024-01-15' AS DATE) AND t.x = 1;
+
+# title: contradictory ranges are pruned entirely
+# dialect: doris
+SELECT t.x AS x FROM t AS t WHERE DATE_FORMAT(t.dt, '%Y%m') = '202401' AND DATE_TRUNC(t.dt, 'year') = '2023-01-01';
+SELECT t.x AS x FROM t AS t WHERE FALSE;
+
+# title: predicates on other columns are left as they are
+# dialect: doris
+SELECT t.x AS x FROM t AS t WHERE t.x > 5 AND t.x < 3 AND DATE_FORMAT(t.dt, '%Y%m%d') = '20240101';
+SELECT t.x AS x FROM t AS t WHERE t.x > 5 AND t.x < 3 AND t.dt >= CAST('2024-01-01' AS DATE) AND t.dt < CAST('2024-01-02' AS DATE);
+
+# title: the merged range takes the place of the predicates it was merged from
+# dialect: doris
+SELECT t.x AS x FROM t AS t WHERE t.x IN (1, 2) AND DATE_FORMAT(t.dt, '%Y') = '2024' AND t.x IN (2, 3) AND DATE_FORMAT(t.dt, '%Y%m') >= '202406';
+SELECT t.x AS x FROM t AS t WHERE t.x IN (1, 2) AND t.dt < CAST('2025-01-01' AS DATE) AND t.dt >= CAST('2024-06-01' AS DATE) AND t.x IN (2, 3);
@@ -0,0 +1,79 @@
+# title: the view's predicates subsume the query's
+SELECT t.k AS k, SUM(t.v) AS s FROM t AS t WHERE t.dt >= '2024-01-01' AND t.k > 1 GROUP BY t.k ORDER BY s;
+SELECT t.k AS k, SUM(t.s) AS s FROM mv_agg AS t WHERE t.k > 1 GROUP BY t.k ORDER BY s;
+
+# title: derived aggregates
+SELECT t.k AS k, AVG(t.v) AS a, COUNT(*) AS n, MAX(t.v) AS m, MAX(t.j) AS mj, COUNT(DISTINCT t.j) AS dj FROM t AS t WHERE '2024-01-01' <= t.dt GROUP BY t.k HAVING SUM(t.v) > 10;
+SELECT t.k AS k, SUM(t.s) / COALESCE(SUM(t.c), 0) AS a, COALESCE(SUM(t.n), 0) AS n, MAX(t.mx) AS m, MAX(t.j) AS mj, COUNT(DISTINCT t.j) AS dj FROM mv_agg AS t GROUP BY t.k HAVING SUM(t.s) > 10;
+
+# title: global aggregate
+SELECT SUM(t.v) AS s FROM t AS t WHERE t.dt >= '2024-01-01';
+SELECT SUM(t.s) AS s FROM mv_agg AS t;
+
+# title: counts are zero when no row of the view matches
+SELECT COUNT(*) AS n FROM t AS t WHERE t.dt >= '2024-01-01' AND t.k = 99;
+SELECT COALESCE(SUM(t.n), 0) AS n FROM mv_agg AS t WHERE t.k = 99;
+
+# title: the view's range contains the query's
+SELECT t.j AS j FROM t AS t WHERE t.dt >= '2024-02-01' AND t.dt < '2024-03-01';
+SELECT t.j AS j FROM mv_recent AS t WHERE t.dt >= '2024-02-01' AND t.dt < '2024-03-01';
+
+# title: the view's range contains the query's values
+SELECT t.j AS j FROM t AS t WHERE t.dt IN ('2023-06-01', '2024-06-01');
+SELECT t.j AS j FROM mv_recent AS t WHERE t.dt IN ('2023-06-01', '2024-06-01');
+
+# title: the view's range doesn't contain the query's
+SELECT t.j AS j FROM t AS t WHERE t.dt >= '2022-12-01' AND t.dt < '2024-03-01';
+SELECT t.j AS j FROM t AS t WHERE t.dt >= '2022-12-01' AND t.dt < '2024-03-01';
+
+# title: the view is more selective than the query
+SELECT t.k AS k, SUM(t.v) AS s FROM t AS t GROUP BY t.k;
+SELECT t.k AS k, SUM(t.v) AS s FROM t AS t GROUP BY t.k;
+
+# title: the aggregate can't be derived
+SELECT t.k AS k, MIN(t.v) AS m FROM t AS t WHERE t.dt >= '2024-01-01' GROUP BY t.k;
+SELECT t.k AS k, MIN(t.v) AS m FROM t AS t WHERE t.dt >= '2024-01-01' GROUP BY t.k;
+
+# title: the grouped view can't answer an ungrouped query
+SELECT t.k AS k FROM t AS t WHERE t.dt >= '2024-01-01';
+SELECT t.k AS k FROM t AS t WHERE t.dt >= '2024-01-01';
+
+# title: projection view
+SELECT t.k AS k, t.v + 1 AS x FROM t AS t WHERE t.k = 2;
+SELECT t.k AS k, t.v1 AS x FROM mv_proj AS t WHERE t.k = 2;
+
+# title: aggregate over a projection view
+SELECT t.k AS k, SUM(t.v + 1) AS x FROM t AS t GROUP BY t.k;
+SELECT t.k AS k, SUM(t.v1) AS x FROM mv_proj AS t GROUP BY t.k;
+
+# title: the column isn't in any view
+SELECT t.v AS v FROM t AS t;
+SELECT t.v AS v FROM t AS t;
+
+# title: subqueries are rewritten
+SELECT y.k AS k FROM (SELECT t.k AS k FROM t AS t WHERE t.k > 0) AS y;
+SELECT y.k AS k FROM (SELECT t.k AS k FROM mv_proj AS t WHERE t.k > 0) AS y;
+
+# title: CTEs shadow the table
+WITH t AS (SELECT 1 AS k) SELECT t.k AS k FROM t AS t;
+WITH t AS (SELECT 1 AS k) SELECT t.k AS k FROM t AS t;
+
+# title: joins aren't rewritten
+SELECT t.k AS k FROM t AS t JOIN u AS u ON t.k = u.k;
+SELECT t.k AS k FROM t AS t JOIN u AS u ON t.k = u.k;
+
+# title: a column over the view's aggregates is rolled up for a coarser grouping
+SELECT t.k AS k, SUM(t.v) + 1 AS x FROM t AS t WHERE t.dt >= '2024-01-01' GROUP BY t.k;
+SELECT t.k AS k, SUM(t.s) + 1 AS x FROM mv_agg AS t GROUP BY t.k;
+
+# title: a column over the view's aggregates in the HAVING of a coarser grouping
+SELECT t.k AS k FROM t AS t WHERE t.dt >= '2024-01-01' GROUP BY t.k HAVING SUM(t.v) + 1 > 10;
+SELECT t.k AS k FROM mv_agg AS t GROUP BY t.k HAVING SUM(t.s) + 1 > 10;
+
+# title: a column over the view's aggregates in the ORDER BY of a coarser grouping
+SELECT t.k AS k FROM t AS t WHERE t.dt >= '2024-01-01' GROUP BY t.k ORDER BY SUM(t.v) + 1;
+SELECT t.k AS k FROM mv_agg AS t GROUP BY t.k ORDER BY SUM(t.s) + 1;
+
+# title: a column over the view's aggregates is used as is for the same grouping
+SELECT t.k AS k, t.j AS j, SUM(t.v) + 1 AS x FROM t AS t WHERE t.dt >= '2024-01-01' GROUP BY t.j, t.k ORDER BY SUM(t.v) + 1;
+SELECT t.k AS k, t.j AS j, MAX(t.s1) AS x FROM mv_agg AS t GROUP BY t.j, t.k ORDER BY MAX(t.s1);
@@ -1124,3 +1124,54 @@ STARTS_WITH('x', y);
 
 STARTS_WITH(x, 'y');
 STARTS_WITH(x, 'y');
+
+--------------------------------------
+-- Ranges
+--------------------------------------
+x > 5 AND y = 1 AND x < 3;
+FALSE;
+
+x IN (1, 2, 10) AND x < 5;
+x IN (1, 2);
+
+x IN (1, 2) AND x IN (2, 3) AND x <> 3;
+x = 2;
+
+x > 2 AND y > 0 AND x IN (1, 2);
+FALSE;
+
+x >= 3 AND x <= 3 AND x <> 3;
+FALSE;
+
+x BETWEEN 1 AND 10 AND x IN (0, 5, 11, 10);
+x IN (5, 10);
+
+x IN ('a', 'b') AND x > 'a';
+x = 'b';
+
+x IN (1, 2) AND x IN (1, 2) AND y = 1;
+x IN (1, 2) AND y = 1;
+
+x IN (1, 2, 3) AND y IN (1, 2);
+x IN (1, 2, 3) AND y IN (1, 2);
+
+x IN (1, '2') AND x > 1;
+x > 1 AND x IN (1, '2');
+
+x > 1 AND x < '1';
+x < '1' AND x > 1;
+
+x IN (1, NULL) AND x > 1;
+x > 1 AND x IN (1, NULL);
+
+x IN (1, 2) OR x > 1;
+x > 1 OR x IN (1, 2);
+
+RAND() IN (1, 2) AND RAND() > 1;
+RAND() > 1 AND RAND() IN (1, 2);
+
+d >= CAST('2024-01-01' AS DATE) AND d IN (CAST('2023-06-01' AS DATE), CAST('2024-06-01' AS DATE));
+d = CAST('2024-06-01' AS DATE);
+
+d >= CAST('2024-01-01' AS DATE) AND y = 1 AND d < CAST('2023-01-01' AS DATE);
+FALSE;
@@ -0,0 +1,151 @@
+import itertools
+import socketserver
+import struct
+import threading
+
+from pydoris.batchFetch import DorisError, _scramble_native_password
+
+SCRAMBLE = b"abcdefghijklmnopqrst"
+OK = b"\x00\x00\x00\x02\x00\x00\x00"
+EOF = b"\xfe\x00\x00\x02\x00"
+
+
+class MySQLStandIn:
+    """
+    A local stand-in for the MySQL-protocol port of a Doris FE, which runs in a background thread.
+
+    Args:
+        respond: called with the SQL of each query and the id of its connection, in the thread of
+            the connection. It returns None for an OK packet, a DorisError for an ERR packet, or the
+            columns and rows of a result set, as lists of (name, type code) pairs and of tuples of
+            strings or None. A DorisError in the rows ends the result set with an ERR packet.
+        password: the password that the users must authenticate with.
+    """
+
+    def __init__(self, respond, password="secret"):
+        self.respond = respond
+        self.password = password
+        self.queries = []
+        self.lock = threading.Lock()
+        self._ids = itertools.count(1)
+
+        standin = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                standin._serve(self.rfile, self.request)
+
+        self.server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.port = self.server.server_address[1]
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _serve(self, rfile, connection):
+        with self.lock:
+            connection_id = next(self._ids)
+
+        handshake = (
+            b"\x0a5.7.99\0"
+            + struct.pack("<I", connection_id)
+            + SCRAMBLE[:8]
+            + b"\0"
+            + struct.pack("<HBHH", 0xFFFF, 33, 2, 0x000F)
+            + bytes([len(SCRAMBLE) + 1])
+            + b"\0" * 10
+            + SCRAMBLE[8:]
+            + b"\0mysql_native_password\0"
+        )
+        _send(connection, 0, handshake)
+
+        sequence, response = _receive(rfile)
+        user_end = response.index(b"\0", 32)
+        auth_length = response[user_end + 1]
+        auth = response[user_end + 2 : user_end + 2 + auth_length]
+
+        if auth != _scramble_native_password(self.password, SCRAMBLE):
+            _send(connection, sequence + 1, _error_packet(DorisError(1045, "Access denied")))
+            return
+        _send(connection, sequence + 1, OK)
+
+        while True:
+            try:
+                _, packet = _receive(rfile)
+            except (ConnectionError, IndexError):
+                return
+
+            sql = packet[1:].decode()
+            with self.lock:
+                self.queries.append((connection_id, sql))
+
+            try:
+                result = self.respond(sql, connection_id)
+            except DorisError as e:
+                result = e
+
+            try:
+                self._send_result(connection, result)
+            except OSError:
+                return
+
+    def _send_result(self, connection, result):
+        if result is None:
+            _send(connection, 1, OK)
+            return
+        if isinstance(result, DorisError):
+            _send(connection, 1, _error_packet(result))
+            return
+
+        columns, rows = result
+        sequence = _send(connection, 1, bytes([len(columns)]))
+        for name, type in columns:
+            sequence = _send(connection, sequence, _column_definition(name, type))
+        sequence = _send(connection, sequence, EOF)
+
+        for row in rows:
+            if isinstance(row, DorisError):
+                _send(connection, sequence, _error_packet(row))
+                return
+
+            values = (
+                b"\xfb" if value is None else _length_encoded(value.encode()) for value in row
+            )
+            sequence = _send(connection, sequence, b"".join(values))
+
+        _send(connection, sequence, EOF)
+
+
+def _send(connection, sequence, payload):
+    connection.sendall(struct.pack("<I", len(payload))[:3] + bytes([sequence & 0xFF]) + payload)
+    return sequence + 1
+
+
+def _receive(rfile):
+    header = rfile.read(4)
+    length = header[0] | header[1] << 8 | header[2] << 16
+    return header[3], rfile.read(length)
+
+
+def _length_encoded(value):
+    if len(value) < 0xFB:
+        return bytes([len(value)]) + value
+    return b"\xfc" + struct.pack("<H", len(value)) + value
+
+
+def _column_definition(name, type):
+    fields = (b"def", b"db", b"t", b"t", name.encode(), name.encode())
+    return (
+        b"".join(_length_encoded(field) for field in fields)
+        + b"\x0c"
+        + struct.pack("<HIBHB", 33, 20, type, 0, 0)
+        + b"\0\0"
+    )
+
+
+def _error_packet(error):
+    return (
+        b"\xff" + struct.pack("<H", error.code) + b"#42000" + str(error).split(") ", 1)[1].encode()
+    )
@@ -0,0 +1,98 @@
+import asyncio
+import threading
+import time
+import unittest
+
+from pydoris.asyncClient import AsyncDorisClient
+from tests.pydoris.helpers import MySQLStandIn
+
+
+class TestAsyncClient(unittest.TestCase):
+    def setUp(self):
+        self.lock = threading.Lock()
+        self.running = 0
+        self.max_running = 0
+        self.standin = MySQLStandIn(self.respond)
+
+    def tearDown(self):
+        self.standin.close()
+
+    def respond(self, sql, connection_id):
+        if sql.startswith("KILL QUERY"):
+            return None
+
+        with self.lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+
+        time.sleep(1 if "SLEEP" in sql else 0.02)
+
+        with self.lock:
+            self.running -= 1
+
+        return [("q", 253), ("connection_id", 8)], [(sql, str(connection_id))]
+
+    def client(self, **opts):
+        return AsyncDorisClient("127.0.0.1", self.standin.port, "root", "secret", **opts)
+
+    def connection_id(self, sql):
+        return next(i for i, query in self.standin.queries if query == sql)
+
+    def assertKilled(self, sql):
+        queries = [query for _, query in self.standin.queries]
+        self.assertIn(f"KILL QUERY {self.connection_id(sql)}", queries)
+
+    def test_query(self):
+        async def run():
+            async with self.client() as client:
+                first = await client.query("SELECT 1")
+                second = await client.query("SELECT 2")
+                return first, second
+
+        first, second = asyncio.run(run())
+        self.assertEqual(first.columns["q"].tolist(), ["SELECT 1"])
+        # The connection is returned to the pool and reused
+        self.assertEqual(first.columns["connection_id"][0], second.columns["connection_id"][0])
+
+    def test_timeout(self):
+        async def run():
+            async with self.client(pool_size=2) as client:
+                with self.assertRaises(asyncio.TimeoutError):
+                    await client.query("SELECT SLEEP(1)", timeout=0.2)
+                return [connection.connection_id for connection in client._idle]
+
+        idle = asyncio.run(run())
+        self.assertKilled("SELECT SLEEP(1)")
+        self.assertNotIn(self.connection_id("SELECT SLEEP(1)"), idle)
+
+    def test_cancel(self):
+        async def run():
+            async with self.client(pool_size=2) as client:
+                await client.query("SELECT 1")
+
+                task = asyncio.ensure_future(client.query("SELECT SLEEP(1)"))
+                await asyncio.sleep(0.2)
+                task.cancel()
+                with self.assertRaises(asyncio.CancelledError):
+                    await task
+
+                # A connection whose query was cancelled is never reused
+                idle = [connection.connection_id for connection in client._idle]
+                result = await client.query("SELECT 2")
+                return idle, result.columns["connection_id"][0]
+
+        idle, reused = asyncio.run(run())
+        cancelled = self.connection_id("SELECT SLEEP(1)")
+        self.assertKilled("SELECT SLEEP(1)")
+        self.assertNotIn(cancelled, idle)
+        self.assertNotEqual(reused, cancelled)
+
+    def test_max_concurrency(self):
+        async def run():
+            async with self.client(pool_size=10, max_concurrency=3) as client:
+                return await asyncio.gather(*(client.query(f"SELECT {i}") for i in range(20)))
+
+        results = asyncio.run(run())
+        self.assertEqual(len(results), 20)
+        self.assertLessEqual(self.max_running, 3)
+        self.assertGreater(self.max_running, 1)
@@ -0,0 +1,113 @@
+import unittest
+from decimal import Decimal
+
+import numpy as np
+
+from pydoris.batchFetch import DorisConnection, DorisError
+from tests.pydoris.helpers import MySQLStandIn
+
+COLUMNS = [
+    ("id", 8),
+    ("n", 3),
+    ("price", 246),
+    ("ratio", 5),
+    ("name", 253),
+    ("d", 10),
+    ("ts", 12),
+]
+
+
+def _row(i):
+    return (
+        str(i),
+        None if i % 3 == 0 else str(-i),
+        None if i == 1 else f"12345678901234567.{i:02}",
+        f"{i}.5",
+        None if i == 2 else f"name{i}",
+        "0000-00-00" if i == 4 else f"2024-01-{i % 28 + 1:02}",
+        f"2024-01-02 03:04:{i % 60:02}.123456",
+    )
+
+
+def respond(sql, connection_id):
+    if sql.startswith("SET"):
+        return None
+    if sql.startswith("BAD"):
+        raise DorisError(1064, "Syntax error")
+
+    rows = [_row(i) for i in range(25)]
+    if sql.startswith("BROKEN"):
+        rows[12:] = [DorisError(1105, "Memory limit exceeded")]
+    return COLUMNS, rows
+
+
+class TestBatchFetch(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.standin = MySQLStandIn(respond)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.standin.close()
+
+    def connect(self, password="secret"):
+        return DorisConnection("127.0.0.1", self.standin.port, "root", password, "db", timeout=10)
+
+    def test_auth(self):
+        with self.assertRaises(DorisError) as cm:
+            self.connect(password="wrong")
+        self.assertEqual(cm.exception.code, 1045)
+
+    def test_batches(self):
+        with self.connect() as conn:
+            batches = list(conn.iter_batches("SELECT *", batch_size=10))
+
+        self.assertEqual([batch.num_rows for batch in batches], [10, 10, 5])
+
+        columns = batches[0].columns
+        self.assertEqual(columns["id"].dtype, np.int64)
+        self.assertEqual(columns["id"].tolist(), list(range(10)))
+        self.assertEqual(columns["ratio"].dtype, np.float64)
+        self.assertEqual(columns["d"].dtype, np.dtype("datetime64[D]"))
+        self.assertEqual(columns["ts"].dtype, np.dtype("datetime64[us]"))
+        self.assertEqual(columns["ts"][5], np.datetime64("2024-01-02T03:04:05.123456"))
+
+        # Decimals keep their precision
+        self.assertEqual(columns["price"].dtype, object)
+        self.assertEqual(columns["price"][3], Decimal("12345678901234567.03"))
+
+    def test_nulls(self):
+        with self.connect() as conn:
+            columns = next(conn.iter_batches("SELECT *", batch_size=10)).columns
+
+        self.assertEqual(columns["n"].dtype, np.float64)
+        self.assertTrue(np.isnan(columns["n"][0]))
+        self.assertEqual(columns["n"][1], -1)
+        self.assertIsNone(columns["price"][1])
+        self.assertIsNone(columns["name"][2])
+        self.assertEqual(columns["name"][3], "name3")
+
+        # Zero dates are NaT, instead of failing the whole batch
+        self.assertTrue(np.isnat(columns["d"][4]))
+        self.assertEqual(columns["d"][5], np.datetime64("2024-01-06"))
+
+    def test_stop_early(self):
+        with self.connect() as conn:
+            for batch in conn.iter_batches("SELECT *", batch_size=10):
+                break
+
+            # The rest of the result was discarded, so the connection can be reused
+            self.assertEqual(len(conn.query_to_dataframe("SELECT *")), 25)
+
+    def test_errors(self):
+        with self.connect() as conn:
+            with self.assertRaises(DorisError) as cm:
+                conn.execute("BAD")
+            self.assertEqual(cm.exception.code, 1064)
+
+            with self.assertRaises(DorisError) as cm:
+                list(conn.iter_batches("BROKEN", batch_size=5))
+            self.assertEqual(cm.exception.code, 1105)
+
+            conn.execute("SET x = 1")
+            self.assertEqual(len(conn.query_to_dataframe("SELECT *")), 25)
@@ -0,0 +1,185 @@
+import io
+import threading
+import time
+import unittest
+from unittest import mock
+
+from pydoris.batchFetch import DorisError
+from pydoris.pipeline import Pipeline, PipelineError, iter_statements
+
+
+class FakeConnection:
+    """Records the statements it runs, instead of connecting to Doris."""
+
+    lock = threading.Lock()
+    instances = []
+    log = []
+
+    def __init__(self, *args):
+        self.closed = False
+        self.session = []
+        with self.lock:
+            self.id = len(self.instances)
+            self.instances.append(self)
+
+    def execute(self, sql):
+        start = time.perf_counter()
+        if not sql.startswith(("USE", "SET")):
+            time.sleep(0.02)
+
+        with self.lock:
+            self.log.append((sql, self.id, list(self.session), start, time.perf_counter()))
+
+        if "FAIL" in sql:
+            raise DorisError(1105, "failed")
+        if sql.startswith(("USE", "SET")):
+            self.session.append(sql)
+
+    def close(self):
+        self.closed = True
+
+
+class TestPipeline(unittest.TestCase):
+    def setUp(self):
+        FakeConnection.instances = []
+        FakeConnection.log = []
+        patcher = mock.patch("pydoris.pipeline.DorisConnection", FakeConnection)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def run_pipeline(self, statements, **opts):
+        opts = {"read": "presto", "connections": 4, "transpile_workers": 2, **opts}
+        return Pipeline(**opts).run(statements)
+
+    def executed(self, prefix):
+        return [entry for entry in FakeConnection.log if entry[0].startswith(prefix)]
+
+    def assertBefore(self, first, then):
+        for *_, end in first:
+            for _, _, _, start, _ in then:
+                self.assertLessEqual(end, start)
+
+    def test_iter_statements(self):
+        sql = """
+            SELECT 'a;b', "c;d", `e;f` FROM x; -- a comment; with a semicolon
+            SELECT 'it''s;' /* a block comment;
+            over lines; */ FROM y;;
+            SELECT 'a\\';b' FROM z;
+            SELECT 1
+        """
+        self.assertEqual(
+            list(iter_statements(io.StringIO(sql), escapes="\\")),
+            [
+                """SELECT 'a;b', "c;d", `e;f` FROM x""",
+                """-- a comment; with a semicolon
+            SELECT 'it''s;' /* a block comment;
+            over lines; */ FROM y""",
+                "SELECT 'a\\';b' FROM z",
+                "SELECT 1",
+            ],
+        )
+
+        # Without escapes, the backslash doesn't escape the quote
+        self.assertEqual(list(iter_statements(["SELECT 'a\\';b'"])), ["SELECT 'a\\'", "b'"])
+
+    def test_dependencies(self):
+        statements = ["CREATE TABLE a (x INT)", "CREATE TABLE b (x INT)"]
+        for i in range(5):
+            statements += [
+                f"INSERT INTO a SELECT {i}",
+                "INSERT INTO b SELECT * FROM a",
+                "SELECT COUNT(*) FROM c",
+                "SELECT COUNT(*) FROM a",
+            ]
+        statements += ["DROP TABLE a", "SELECT * FROM b"]
+
+        metrics = self.run_pipeline(statements)
+        self.assertEqual(metrics.statements, len(statements))
+
+        creates = self.executed("CREATE")
+        inserts_a = self.executed("INSERT INTO a")
+        inserts_b = self.executed("INSERT INTO b")
+        reads_a = self.executed("SELECT COUNT(*) FROM a")
+        reads_c = self.executed("SELECT COUNT(*) FROM c")
+        drop = self.executed("DROP")
+        last = self.executed("SELECT * FROM b")
+
+        # DDL statements are barriers
+        self.assertBefore(creates[:1], creates[1:])
+        self.assertBefore(creates, FakeConnection.log[2:])
+        self.assertBefore([entry for entry in FakeConnection.log if entry not in drop + last], drop)
+        self.assertBefore(drop, last)
+
+        for i in range(5):
+            # Writes wait for the earlier writes and reads of their table, and reads for the
+            # earlier writes
+            self.assertBefore(inserts_a[i : i + 1], inserts_b[i : i + 1] + reads_a[i : i + 1])
+            self.assertBefore(inserts_b[i : i + 1], inserts_b[i + 1 : i + 2])
+            self.assertBefore(reads_a[i : i + 1], inserts_a[i + 1 : i + 2])
+
+        # Statements on unrelated tables run concurrently
+        self.assertTrue(
+            any(c[3] < other[4] and other[3] < c[4] for c in reads_c for other in inserts_a)
+        )
+
+        self.assertTrue(all(connection.closed for connection in FakeConnection.instances))
+
+    def test_session(self):
+        statements = ["USE db"]
+        statements += [f"SELECT {i} FROM t{i}" for i in range(8)]
+        statements += ["SET x = 1"]
+        statements += [f"SELECT {i} FROM u{i}" for i in range(8)]
+
+        self.run_pipeline(statements)
+        self.assertGreater(len(FakeConnection.instances), 1)
+
+        # Session statements are replayed on every connection before it runs anything else
+        for sql, _, session, *_ in self.executed("SELECT"):
+            expected = ["USE db", "SET x = 1"] if " FROM u" in sql else ["USE db"]
+            self.assertEqual(session, expected, sql)
+
+        # The SET waits for the statements before it, and the ones after it wait for the SET
+        first, second = (
+            [entry for entry in self.executed("SELECT") if f" FROM {table}" in entry[0]]
+            for table in ("t", "u")
+        )
+        self.assertBefore(first, self.executed("SET"))
+        self.assertBefore(self.executed("SET")[:1], second)
+
+    def test_execution_error(self):
+        statements = [
+            "SELECT 1 FROM a",
+            "INSERT INTO b SELECT FAIL FROM a",
+            "CREATE TABLE c (x INT)",
+            "SELECT 2 FROM d",
+        ]
+
+        with self.assertRaises(PipelineError) as cm:
+            self.run_pipeline(statements)
+
+        self.assertEqual(cm.exception.statement.index, 1)
+        self.assertIn("failed", str(cm.exception))
+
+        # Nothing is started after the failure
+        self.assertEqual(self.executed("CREATE"), [])
+        self.assertEqual(self.executed("SELECT 2"), [])
+        self.assertTrue(all(connection.closed for connection in FakeConnection.instances))
+
+    def test_transpile_error(self):
+        with self.assertRaises(PipelineError) as cm:
+            self.run_pipeline(["SELECT 1 FROM a", "SELECT ((", "SELECT 2 FROM b"])
+
+        self.assertEqual(cm.exception.statement.index, 1)
+        self.assertEqual(self.executed("SELECT 2"), [])
+
+    def test_dry_run(self):
+        output = io.StringIO()
+        metrics = self.run_pipeline(
+            ["SELECT a || b FROM t", "CREATE TABLE u (x INT)"], dry_run=True, output=output
+        )
+
+        self.assertEqual(
+            output.getvalue(), "SELECT CONCAT(a,b) FROM t AS t;\nCREATE TABLE u (x INT);\n"
+        )
+        self.assertEqual(metrics.statements, 2)
+        self.assertEqual(FakeConnection.instances, [])
@@ -0,0 +1,168 @@
+import json
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from pydoris.streamLoad import StreamLoadError, StreamLoadWriter, csv_chunks
+
+
+class StandIn:
+    """
+    A local stand-in for a Doris cluster: the FE redirects every load to the BE, which commits the
+    chunks by label, like Stream Load does.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.loaded = {}
+        self.fe_bodies = []
+        self.be_clients = set()
+        self.running = 0
+        self.max_running = 0
+        # Labels whose response is lost once, after their chunk was committed
+        self.lose_response = set()
+        # Labels that fail with an HTTP 500 on every attempt
+        self.server_errors = set()
+        self.attempts = {}
+
+        standin = self
+
+        class FE(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def do_PUT(self):
+                body = self.rfile.read(int(self.headers["Content-Length"]))
+                with standin.lock:
+                    standin.fe_bodies.append(body)
+
+                location = f"http://127.0.0.1:{standin.be.server_port}{self.path}?redirected=1"
+                self.send_response(307)
+                self.send_header("Location", location)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+        class BE(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def do_PUT(self):
+                body = self.rfile.read(int(self.headers["Content-Length"]))
+                label = self.headers["label"]
+
+                with standin.lock:
+                    standin.be_clients.add(self.client_address)
+                    standin.attempts[label] = standin.attempts.get(label, 0) + 1
+                    standin.running += 1
+                    standin.max_running = max(standin.max_running, standin.running)
+
+                time.sleep(0.02)
+
+                with standin.lock:
+                    standin.running -= 1
+
+                    if label in standin.server_errors:
+                        return self._respond(500, b"internal error")
+                    if label in standin.lose_response:
+                        standin.lose_response.discard(label)
+                        standin.loaded[label] = body
+                        self.close_connection = True
+                        return
+                    if label in standin.loaded:
+                        result = {"Status": "Label Already Exists", "ExistingJobStatus": "FINISHED"}
+                    elif b"bad" in body:
+                        result = {"Status": "Fail", "Message": "too many filtered rows"}
+                    else:
+                        standin.loaded[label] = body
+                        result = {"Status": "Success", "NumberLoadedRows": body.count(b"\n")}
+
+                self._respond(200, json.dumps(result).encode())
+
+            def _respond(self, status, content):
+                self.send_response(status)
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+        self.fe = ThreadingHTTPServer(("127.0.0.1", 0), FE)
+        self.be = ThreadingHTTPServer(("127.0.0.1", 0), BE)
+
+        for server in (self.fe, self.be):
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    def close(self):
+        for server in (self.fe, self.be):
+            server.shutdown()
+            server.server_close()
+
+
+class TestStreamLoad(unittest.TestCase):
+    def setUp(self):
+        self.standin = StandIn()
+
+    def tearDown(self):
+        self.standin.close()
+
+    def writer(self, **opts):
+        opts = {"label_prefix": "load", "retry_backoff": 0.01, **opts}
+        return StreamLoadWriter(
+            "127.0.0.1", self.standin.fe.server_port, "root", "", "db", "tbl", **opts
+        )
+
+    def test_write(self):
+        rows = [(i, f"s{i}") for i in range(1000)]
+
+        with self.writer(parallelism=3) as writer:
+            results = writer.write(csv_chunks(rows, max_bytes=1000))
+
+        self.assertGreater(len(results), 3)
+        self.assertTrue(all(result["Status"] == "Success" for result in results))
+        self.assertEqual(sum(result["NumberLoadedRows"] for result in results), 1000)
+
+        # The data is only sent to the BE that the FE redirects to
+        self.assertEqual(set(self.standin.fe_bodies), {b""})
+        self.assertEqual(
+            b"".join(self.standin.loaded[f"load_{i}"] for i in range(len(results))),
+            b"".join(csv_chunks(rows)),
+        )
+
+    def test_parallelism(self):
+        with self.writer(parallelism=3) as writer:
+            writer.write(f"{i}\n" for i in range(30))
+
+        self.assertLessEqual(self.standin.max_running, 3)
+        self.assertGreater(self.standin.max_running, 1)
+        # The connections to the BE are kept alive and reused
+        self.assertLessEqual(len(self.standin.be_clients), 3)
+
+    def test_lost_response(self):
+        self.standin.lose_response.add("load_1")
+
+        with self.writer() as writer:
+            results = writer.write([b"1\n", b"2\n", b"3\n"])
+
+        self.assertEqual(self.standin.attempts["load_1"], 2)
+        self.assertEqual(results[1]["Status"], "Label Already Exists")
+        self.assertEqual(sorted(self.standin.loaded.values()), [b"1\n", b"2\n", b"3\n"])
+
+    def test_failure(self):
+        with self.writer(parallelism=1) as writer:
+            with self.assertRaises(StreamLoadError) as cm:
+                writer.write([b"1\n", b"bad\n", b"3\n"])
+
+        self.assertEqual(cm.exception.result["Status"], "Fail")
+        self.assertNotIn("load_2", self.standin.loaded)
+
+    def test_retries(self):
+        self.standin.server_errors.add("load_0")
+
+        with self.writer(max_retries=2) as writer:
+            with self.assertRaises(StreamLoadError):
+                writer.write([b"1\n"])
+
+        self.assertEqual(self.standin.attempts["load_0"], 3)
@@ -3,6 +3,7 @@ import math
 import unittest
 
 from sqlglot import ParseError, alias, exp, parse_one
+from sqlglot.tokens import USE_RS_TOKENIZER
 
 
 class TestExpressions(unittest.TestCase):
@@ -430,6 +431,60 @@ class TestExpressions(unittest.TestCase):
             },
         )
 
+    def test_node_storage(self):
+        column = parse_one("a")
+        self.assertFalse(hasattr(column, "__dict__"))
+
+        with self.assertRaises(AttributeError):
+            column.foo = 1
+
+        column.add_comments([])
+        self.assertIsNone(column.comments)
+        column.add_comments(["x"])
+        self.assertEqual(column.comments, ["x"])
+
+        if not USE_RS_TOKENIZER:
+            a, b = parse_one("SELECT col FROM t WHERE col > 1").find_all(exp.Column)
+            self.assertIs(a.this.this, b.this.this)
+
+    def test_hash_invalidation(self):
+        expression = parse_one("SELECT a + 1 AS b FROM x WHERE c")
+        other = expression.copy()
+        self.assertEqual(expression, other)
+
+        expression.find(exp.Literal).replace(exp.Literal.number(2))
+        self.assertNotEqual(expression, other)
+        other.find(exp.Literal).replace(exp.Literal.number(2))
+        self.assertEqual(expression, other)
+
+        expression.find(exp.Identifier).set("this", "z")
+        self.assertNotEqual(expression, other)
+        other.find(exp.Identifier).set("this", "z")
+        self.assertEqual(expression, other)
+
+        expression.append("expressions", exp.column("d"))
+        self.assertNotEqual(expression, other)
+        other.append("expressions", exp.column("d"))
+        self.assertEqual(expression, other)
+
+        expression.args["where"].pop()
+        self.assertNotEqual(expression, other)
+        other.find(exp.Where).pop()
+        self.assertEqual(expression, other)
+
+        # Unchanged children don't invalidate the cached hashes
+        hash(expression)
+        exp.replace_children(expression, lambda child: child)
+        self.assertIsNotNone(expression._hash)
+
+        # Copies keep the cached hash, which is cleared when they're mutated after hashing
+        copy = expression.copy()
+        self.assertEqual(copy._hash, expression._hash)
+        copy.find(exp.Literal).replace(exp.Literal.number(3))
+        self.assertIsNone(copy._hash)
+        self.assertNotEqual(copy, expression)
+        self.assertEqual(copy, parse_one("SELECT a + 3 AS z, d FROM x"))
+
     def test_sql(self):
         self.assertEqual(parse_one("x + y * 2").sql(), "x + y * 2")
         self.assertEqual(parse_one('select "x"').sql(dialect="hive", pretty=True), "SELECT\n  `x`")
@@ -523,6 +578,33 @@ class TestExpressions(unittest.TestCase):
         expression.find(exp.Table).replace(parse_one("y"))
         self.assertEqual(expression.sql(), "SELECT c, b FROM y")
 
+    def test_copy(self):
+        expression = parse_one("SELECT a /* x */, b + 1 AS c FROM x WHERE a IN (1, 2)")
+        expression.find(exp.Column).meta["k"] = ["v"]
+        expression.find(exp.Literal).type = "int"
+
+        copy = expression.copy()
+        self.assertEqual(copy, expression)
+        self.assertEqual(copy.sql(), expression.sql())
+        self.assertEqual(copy.find(exp.Column).meta, {"k": ["v"]})
+        self.assertEqual(copy.find(exp.Literal).type.sql(), "INT")
+
+        for node, original in zip(copy.walk(), expression.walk()):
+            self.assertIsNot(node[0], original[0])
+            self.assertIs(node[0].parent, node[1] if node[1] else original[0].parent)
+
+        self.assertIsNot(copy.find(exp.Column).meta["k"], expression.find(exp.Column).meta["k"])
+        self.assertIsNot(copy.expressions[0].comments, expression.expressions[0].comments)
+
+        copy.find(exp.Literal).replace(exp.Literal.number(3))
+        self.assertEqual(expression.sql(), "SELECT a /* x */, b + 1 AS c FROM x WHERE a IN (1, 2)")
+
+        deep = exp.and_(*(exp.column(f"x{i}") for i in range(5000)))
+        self.assertEqual(
+            [node.name for node, *_ in deep.copy().bfs()],
+            [node.name for node, *_ in deep.bfs()],
+        )
+
     def test_arg_deletion(self):
         # Using the pop helper method
         expression = parse_one("SELECT a, b FROM x")
@@ -557,6 +639,43 @@ class TestExpressions(unittest.TestCase):
             all(isinstance(e, exp.Expression) for e, _, _ in expression.walk(bfs=False))
         )
 
+    def test_walk_nodes(self):
+        expression = parse_one("SELECT a, b + 1 FROM (SELECT * FROM x) WHERE c IN (1, 2)")
+
+        for bfs in (True, False):
+            self.assertEqual(
+                list(expression.walk_nodes(bfs=bfs)),
+                [node for node, *_ in expression.walk(bfs=bfs)],
+            )
+            self.assertTrue(
+                all(
+                    a is b
+                    for a, (b, *_) in zip(expression.walk_nodes(bfs=bfs), expression.walk(bfs=bfs))
+                )
+            )
+
+        pruned = list(expression.walk_nodes(prune=lambda node: isinstance(node, exp.Subquery)))
+        self.assertFalse(any(isinstance(node, exp.Star) for node in pruned))
+
+        deep = exp.and_(*(exp.column(f"x{i}") for i in range(5000)))
+        self.assertEqual(len(list(deep.dfs())), len(list(deep.walk_nodes(bfs=False))))
+
+    def test_type_index(self):
+        expression = parse_one("SELECT a, b + 1 AS c FROM x WHERE d > 1 AND e IN (1, 2)")
+        index = exp.TypeIndex(expression)
+
+        for types in ((exp.Column,), (exp.Literal, exp.Column), (exp.Binary,), (exp.Window,)):
+            self.assertEqual(list(index.find_all(*types)), list(expression.find_all(*types)))
+
+        self.assertIs(index.find(exp.Column), expression.find(exp.Column))
+        self.assertIsNone(index.find(exp.Window))
+
+        expression.find(exp.Where).pop()
+        self.assertEqual([col.name for col in index.find_all(exp.Column)], ["a", "b"])
+
+        expression.select("f", copy=False)
+        self.assertEqual([col.name for col in index.find_all(exp.Column)], ["a", "f", "b"])
+
     def test_functions(self):
         self.assertIsInstance(parse_one("x LIKE ANY (y)"), exp.Like)
         self.assertIsInstance(parse_one("x ILIKE ANY (y)"), exp.ILike)
@@ -1,6 +1,8 @@
+import io
 import unittest
 
 from sqlglot import exp, parse_one
+from sqlglot.dialects import Dialect
 from sqlglot.expressions import Func
 from sqlglot.parser import Parser
 from sqlglot.tokens import Tokenizer
@@ -43,3 +45,42 @@ class TestGenerator(unittest.TestCase):
         assert parse_one("X").sql(identify="safe") == "X"
         assert parse_one("x as 1").sql(identify="safe") == '"x" AS "1"'
         assert parse_one("X as 1").sql(identify="safe") == 'X AS "1"'
+
+    def test_long_chains(self):
+        # Twice the default recursion limit, so recursing once per term would fail
+        n = 2000
+
+        for op in ("+", "OR"):
+            with self.subTest(op):
+                sql = "SELECT " + f" {op} ".join(f"x{i} = {i}" for i in range(n))
+                expression = parse_one(sql)
+                self.assertEqual(expression.sql(), sql)
+                self.assertEqual(expression, parse_one(sql))
+                self.assertEqual(hash(expression), hash(parse_one(expression.sql())))
+
+        self.assertEqual(len(expression.sql(pretty=True).splitlines()), n + 1)
+
+        sql = "SELECT CASE " + " ".join(f"WHEN x = {i} THEN {i}" for i in range(n)) + " END"
+        self.assertEqual(parse_one(sql).sql(), sql)
+
+    def test_generate_to(self):
+        for sql in (
+            "SELECT a FROM b",
+            "VALUES (1), (2)",
+            "INSERT INTO t (a, b) VALUES (1, 'x\ny'), (2, (SELECT 1)) /* c */, (3, 'z')",
+            "WITH x AS (INSERT INTO t VALUES (1, 2), (3, 4) RETURNING *) SELECT * FROM x",
+            "SELECT * FROM (VALUES (1, 2), (3, 4)) AS t(a, b)",
+        ):
+            expression = parse_one(sql, read="postgres")
+
+            for pretty in (False, True):
+                with self.subTest(f"{sql} (pretty={pretty})"):
+                    stream = io.StringIO()
+                    Dialect.get_or_raise("postgres").generate_to(expression, stream, pretty=pretty)
+                    self.assertEqual(stream.getvalue(), expression.sql("postgres", pretty=pretty))
+
+        expression = parse_one("INSERT INTO t VALUES " + ", ".join(f"({i})" for i in range(1000)))
+        fragments = []
+        Dialect().generate_to(expression, fragments)
+        self.assertGreater(len(fragments), 1000)
+        self.assertEqual("".join(fragments), expression.sql())
@@ -0,0 +1,104 @@
+import unittest
+
+from sqlglot import exp, parse_one
+from sqlglot.matcher import Match, Matcher, Pattern
+
+SELECT_STAR = Pattern("select_star", exp.Star, parent=exp.Select)
+CARTESIAN_JOIN = Pattern("cartesian_join", exp.Join, args={"on": None, "using": None})
+NON_SARGABLE = Pattern(
+    "non_sargable",
+    (exp.EQ, exp.GT, exp.GTE, exp.LT, exp.LTE),
+    args={"this": exp.Func},
+    within=exp.Where,
+)
+
+
+class TestMatcher(unittest.TestCase):
+    def assertMatches(self, matcher, sql, expected):
+        with self.subTest(sql):
+            self.assertEqual(
+                [(match.pattern, match.expression.sql()) for match in matcher.find(parse_one(sql))],
+                expected,
+            )
+
+    def test_patterns(self):
+        matcher = Matcher([SELECT_STAR, CARTESIAN_JOIN, NON_SARGABLE])
+        self.assertEqual(len({SELECT_STAR, CARTESIAN_JOIN, NON_SARGABLE, SELECT_STAR}), 3)
+
+        self.assertMatches(matcher, "SELECT a FROM x JOIN y ON x.a = y.a WHERE x.b = 1", [])
+        self.assertMatches(
+            matcher,
+            "SELECT * FROM x, y WHERE UPPER(x.a) = 'A' AND LOWER(y.b) IN ('b')",
+            [
+                ("select_star", "*"),
+                ("cartesian_join", ", y"),
+                ("non_sargable", "UPPER(x.a) = 'A'"),
+            ],
+        )
+        self.assertMatches(
+            matcher,
+            "SELECT COUNT(*), UPPER(a) = 'A' FROM (SELECT * FROM x CROSS JOIN y) AS t",
+            [("select_star", "*"), ("cartesian_join", "CROSS JOIN y")],
+        )
+
+    def test_constraints(self):
+        self.assertMatches(
+            Matcher([Pattern("count_star", exp.Count, args={"this": exp.Star})]),
+            "SELECT COUNT(*), COUNT(a) FROM x",
+            [("count_star", "COUNT(*)")],
+        )
+        self.assertMatches(
+            Matcher([Pattern("named_x", exp.Table, args={"this": lambda i: i.name == "x"})]),
+            "SELECT a FROM x JOIN y",
+            [("named_x", "x")],
+        )
+        self.assertMatches(
+            Matcher(
+                [
+                    Pattern(
+                        "negated_in",
+                        exp.Not,
+                        args={"this": Pattern("in", exp.In, args={"query": exp.Select})},
+                    )
+                ]
+            ),
+            "SELECT a FROM x WHERE NOT a IN (SELECT b FROM y) AND NOT c IN (1)",
+            [("negated_in", "NOT a IN (SELECT b FROM y)")],
+        )
+        self.assertMatches(
+            Matcher(
+                [
+                    Pattern("distinct", exp.Select, args={"distinct": exp.Distinct}),
+                    Pattern(
+                        "limit_10", exp.Limit, where=lambda limit: limit.expression.name == "10"
+                    ),
+                ]
+            ),
+            "SELECT DISTINCT a FROM (SELECT b FROM x LIMIT 10) LIMIT 5",
+            [
+                ("distinct", "SELECT DISTINCT a FROM (SELECT b FROM x LIMIT 10) LIMIT 5"),
+                ("limit_10", "LIMIT 10"),
+            ],
+        )
+
+    def test_scan(self):
+        matcher = Matcher([SELECT_STAR, CARTESIAN_JOIN])
+        queries = (
+            query
+            for query in [
+                "SELECT a FROM x",
+                "SELECT * FROM x; SELECT a FROM x, y",
+                parse_one("SELECT * FROM x"),
+                "",
+                "SELECT * FROM `x`",
+            ]
+        )
+
+        self.assertEqual(
+            [(index, match.pattern) for index, match in matcher.scan(queries, dialect="mysql")],
+            [(1, "select_star"), (1, "cartesian_join"), (2, "select_star"), (4, "select_star")],
+        )
+        self.assertEqual(
+            next(matcher.scan(["SELECT * FROM x"])),
+            (0, Match("select_star", exp.Star())),
+        )
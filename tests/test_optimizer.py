@@ -1,3 +1,4 @@
+import datetime
 import unittest
 from concurrent.futures import ProcessPoolExecutor, as_completed
 from functools import partial
@@ -9,7 +10,13 @@ from pandas.testing import assert_frame_equal
 import sqlglot
 from sqlglot import exp, optimizer, parse_one
 from sqlglot.errors import OptimizeError, SchemaError
-from sqlglot.optimizer.annotate_types import annotate_types
+from sqlglot.helper import while_changing
+from sqlglot.optimizer.annotate_types import TypeAnnotator, annotate_types
+from sqlglot.optimizer.eliminate_common_subexpressions import (
+    eliminate_common_subexpressions,
+)
+from sqlglot.optimizer.prune_partitions import prune_partitions
+from sqlglot.optimizer.rewrite_materialized_views import rewrite_materialized_views
 from sqlglot.optimizer.scope import build_scope, traverse_scope, walk_in_scope
 from sqlglot.schema import MappingSchema
 from tests.helpers import (
@@ -225,6 +232,37 @@ class TestOptimizer(unittest.TestCase):
 
         self.check_file("normalize", normalize)
 
+    @patch("sqlglot.optimizer.normalize.logger")
+    def test_normalize_budget(self, logger):
+        sql = "(a AND b AND c) OR (d AND e AND f) OR (g AND h AND i)"
+        skipped = optimizer.normalize.SKIPPED
+
+        expression = optimizer.normalize.normalize(parse_one(sql), max_nodes=20)
+        self.assertEqual(expression.sql(), sql)
+        self.assertEqual(
+            expression.meta[skipped], "Normalization created 22 nodes, exceeding max 20"
+        )
+        assert_logger_contains("Skipping normalization: Normalization created", logger, "info")
+
+        expression = optimizer.normalize.normalize(parse_one(sql), timeout=0)
+        self.assertEqual(expression.sql(), sql)
+        self.assertIn("exceeding timeout 0s", expression.meta[skipped])
+
+        expression = optimizer.normalize.normalize(parse_one(f"x AND ({sql})"), max_distance=1)
+        self.assertEqual(expression.meta[skipped], "distance 72 exceeds max 1")
+
+        expression = optimizer.normalize.normalize(parse_one(sql), max_nodes=1000)
+        self.assertNotIn(skipped, expression.meta)
+        self.assertIsInstance(expression, exp.And)
+
+        budget = optimizer.normalize.NormalizationBudget()
+        expression = while_changing(
+            parse_one("(a AND b) OR (a AND c) OR (a AND d)"),
+            lambda e: optimizer.normalize.distributive_law(e, False, 128, budget),
+        )
+        self.assertEqual(budget.reused, 1)
+        self.assertEqual(optimizer.simplify.simplify(expression).sql(), "a AND (b OR c OR d)")
+
     @patch("sqlglot.generator.logger")
     def test_qualify_columns(self, logger):
         self.assertEqual(
@@ -348,6 +386,40 @@ class TestOptimizer(unittest.TestCase):
         self.assertEqual("CONCAT('a', x, 'bc')", simplified_concat.sql(dialect="presto"))
         self.assertEqual("CONCAT('a', x, 'bc')", simplified_safe_concat.sql())
 
+        # Large IN lists are parsed into a literal block, whose values are simplified as well
+        values = ", ".join(str(i) for i in range(1500))
+        self.assertEqual(
+            optimizer.simplify.simplify(parse_one(f"x IN ({values}) AND x < 3")).sql(),
+            "x IN (0, 1, 2)",
+        )
+        self.assertEqual(
+            optimizer.simplify.simplify(parse_one(f"x IN ({values}) AND x > 5000")).sql(), "FALSE"
+        )
+
+    def test_simplify_interner(self):
+        interner = optimizer.simplify.Interner()
+        a, b, not_a = parse_one("a = 1"), parse_one("b"), parse_one("NOT a = 1")
+
+        self.assertEqual(interner.id(a), interner.id(not_a.this))
+        self.assertNotEqual(interner.id(a), interner.id(b))
+        self.assertEqual(interner.mask([a, b, not_a.this]), 0b11)
+        self.assertEqual(len(interner), 2)
+
+        remove_complements = optimizer.simplify.remove_complements
+        self.assertEqual(remove_complements(parse_one("x AND y AND NOT x")).sql(), "FALSE")
+        self.assertEqual(remove_complements(parse_one("x OR y OR NOT x")).sql(), "TRUE")
+        self.assertEqual(remove_complements(parse_one("x AND NOT y")).sql(), "x AND NOT y")
+
+        absorb_and_eliminate = optimizer.simplify.absorb_and_eliminate
+        self.assertEqual(
+            absorb_and_eliminate(parse_one("a AND (a OR b) AND (c OR d)"), interner=interner).sql(),
+            "a AND (TRUE) AND (c OR d)",
+        )
+        self.assertEqual(
+            absorb_and_eliminate(parse_one("(a AND b) OR (a AND b AND c)")).sql(),
+            "(a AND b) OR (FALSE)",
+        )
+
     def test_unnest_subqueries(self):
         self.check_file(
             "unnest_subqueries",
@@ -407,6 +479,51 @@ class TestOptimizer(unittest.TestCase):
 
         self.check_file("merge_subqueries", optimize, execute=True, schema=self.schema)
 
+    def test_eliminate_common_subexpressions(self):
+        self.check_file(
+            "eliminate_common_subexpressions", eliminate_common_subexpressions, execute=True
+        )
+
+    def test_prune_partitions(self):
+        schema = MappingSchema(
+            {
+                "t": {"x": "INT", "dt": "DATETIME", "created": "DATETIME"},
+                "u": {"x": "INT", "day": "VARCHAR"},
+            },
+            partitions={"t": ["dt"], "u": ["day"]},
+        )
+        self.check_file("prune_partitions", prune_partitions, set_dialect=True, schema=schema)
+
+        # Large IN lists are parsed into a literal block
+        start = datetime.date(2020, 1, 1)
+        days = ", ".join(f"'{start + datetime.timedelta(days=i):%Y%m%d}'" for i in range(1500))
+        sql = f"SELECT t.x AS x FROM t AS t WHERE DATE_FORMAT(t.dt, '%Y%m%d') IN ({days})"
+        expression = prune_partitions(parse_one(sql, read="doris"), schema=schema, dialect="doris")
+        self.assertEqual(
+            expression.sql("doris"),
+            "SELECT t.x AS x FROM t AS t "
+            "WHERE t.dt >= CAST('2020-01-01' AS DATE) AND t.dt < CAST('2024-02-09' AS DATE)",
+        )
+
+    def test_rewrite_materialized_views(self):
+        views = {
+            "mv_agg": """
+                SELECT
+                  k, j, SUM(v) AS s, COUNT(v) AS c, COUNT(*) AS n, MAX(v) AS mx, SUM(v) + 1 AS s1
+                FROM t WHERE dt >= '2024-01-01' GROUP BY k, j
+            """,
+            "mv_proj": "SELECT k, v + 1 AS v1 FROM t",
+            "mv_join": "SELECT t.k, u.k AS uk FROM t JOIN u ON t.k = u.k",
+            "mv_recent": "SELECT j, dt FROM t WHERE dt >= '2023-01-01' AND dt < '2025-01-01'",
+        }
+        schema = {
+            "t": {"k": "INT", "j": "INT", "v": "INT", "dt": "DATE"},
+            "u": {"k": "INT"},
+        }
+        self.check_file(
+            "rewrite_materialized_views", rewrite_materialized_views, views=views, schema=schema
+        )
+
     def test_eliminate_subqueries(self):
         self.check_file("eliminate_subqueries", optimizer.eliminate_subqueries.eliminate_subqueries)
 
@@ -725,6 +842,19 @@ FROM READ_CSV('tests/fixtures/optimizer/tpc-h/nation.csv.gz', 'delimiter', '|')
         ).expressions[0]
         self.assertEqual(expression.type.this, exp.DataType.Type.INT)
 
+    def test_values_annotation(self):
+        # The rows of large VALUES lists are parsed into a literal block
+        for size in (15, 1500):
+            with self.subTest(size):
+                rows = ", ".join(f"({i}, 'a', 1.5)" for i in range(size))
+                expression = annotate_types(
+                    parse_one(f"SELECT v.a, v.b, v.c FROM (VALUES {rows}) AS v(a, b, c)")
+                )
+                self.assertEqual(
+                    [select.type.this for select in expression.selects],
+                    [exp.DataType.Type.INT, exp.DataType.Type.VARCHAR, exp.DataType.Type.DOUBLE],
+                )
+
     def test_derived_tables_column_annotation(self):
         schema = {"x": {"cola": "INT"}, "y": {"cola": "FLOAT"}}
         sql = """
@@ -885,6 +1015,56 @@ FROM READ_CSV('tests/fixtures/optimizer/tpc-h/nation.csv.gz', 'delimiter', '|')
         self.assertEqual(concat_expr.left.type.this, exp.DataType.Type.NULL)
         self.assertEqual(concat_expr.right.type.this, exp.DataType.Type.UNKNOWN)
 
+    def test_incremental_annotation(self):
+        schema = {"x": {"a": "INT", "b": "INT"}, "y": {"a": "VARCHAR"}}
+        sql = """
+            SELECT z.a AS a, x.b + 1 AS b, x.a AS c
+            FROM (SELECT x.a AS a FROM x AS x) AS z, x AS x
+        """
+        expression = annotate_types(parse_one(sql), schema=schema)
+        self.assertEqual(expression.selects[0].type.this, exp.DataType.Type.INT)
+        self.assertEqual(expression.selects[1].type.this, exp.DataType.Type.INT)
+
+        unchanged = expression.selects[2]
+        unchanged.type = exp.DataType.Type.UNKNOWN
+
+        expression.selects[1].this.set("expression", parse_one("2.5"))
+        subquery = expression.find(exp.Subquery).this
+        subquery.from_("y AS x", copy=False)
+        subquery.selects[0].this.type = None
+
+        annotate_types(expression, schema=schema, incremental=True)
+        self.assertEqual(expression.selects[0].type.this, exp.DataType.Type.VARCHAR)
+        self.assertEqual(expression.selects[1].type.this, exp.DataType.Type.DOUBLE)
+        self.assertEqual(unchanged.type.this, exp.DataType.Type.UNKNOWN)
+
+        annotate_types(expression, schema=schema)
+        self.assertEqual(unchanged.type.this, exp.DataType.Type.INT)
+
+    def test_coercion_cache(self):
+        annotator = TypeAnnotator(MappingSchema())
+        self.assertEqual(
+            annotator._maybe_coerce(exp.DataType.Type.INT, exp.DataType.Type.DOUBLE),
+            exp.DataType.Type.DOUBLE,
+        )
+        self.assertEqual(
+            annotator._maybe_coerce(exp.DataType.Type.INT, exp.DataType.Type.VARCHAR),
+            exp.DataType.Type.INT,
+        )
+        self.assertIn((exp.DataType.Type.INT, exp.DataType.Type.VARCHAR), annotator._coercions)
+
+        array = exp.DataType.build("ARRAY<INT>")
+        self.assertIs(annotator._maybe_coerce(array, exp.DataType.Type.INT), array)
+        self.assertNotIn((exp.DataType.Type.ARRAY, exp.DataType.Type.INT), annotator._coercions)
+
+        annotator = TypeAnnotator(
+            MappingSchema(), coerces_to={exp.DataType.Type.VARCHAR: {exp.DataType.Type.INT}}
+        )
+        self.assertEqual(
+            annotator._maybe_coerce(exp.DataType.Type.VARCHAR, exp.DataType.Type.INT),
+            exp.DataType.Type.INT,
+        )
+
     def test_nullable_annotation(self):
         nullable = exp.DataType.build("NULLABLE", expressions=exp.DataType.build("BOOLEAN"))
         expression = annotate_types(parse_one("NULL AND FALSE"))
@@ -788,3 +788,44 @@ class TestParser(unittest.TestCase):
             error_level=ErrorLevel.IGNORE,
         )
         self.assertEqual(ast[0].sql(), "CONCAT_WS()")
+
+    def test_parse_literal_blocks(self):
+        values = ", ".join(f"({i}, 'v{i}', -{i}.5, NULL, TRUE)" for i in range(1000))
+        sql = f"INSERT INTO t VALUES {values}, (NOW(), 'x', 1, NULL, FALSE)"
+        ast = parse_one(sql)
+        block, row = ast.expression.expressions
+
+        self.assertIsInstance(block, exp.LiteralBlock)
+        self.assertIsInstance(row, exp.Tuple)
+        self.assertEqual(block.args["width"], 5)
+        self.assertEqual(block.size, 1000)
+        self.assertEqual(ast.sql(), sql)
+        self.assertEqual(ast.copy(), ast)
+        self.assertEqual(block.expand()[1], parse_one("(1, 'v1', -1.5, NULL, TRUE)"))
+        self.assertEqual(len(ast.expression.rows), 1001)
+
+        with patch.object(Parser, "LITERAL_BLOCK_MIN_SIZE", len(sql)):
+            expanded = parse_one(sql)
+
+        self.assertIsNone(expanded.find(exp.LiteralBlock))
+        for dialect in ("duckdb", "tsql", "bigquery"):
+            for pretty in (False, True):
+                self.assertEqual(
+                    ast.sql(dialect, pretty=pretty), expanded.sql(dialect, pretty=pretty)
+                )
+
+        sql = f"SELECT * FROM t WHERE x IN ({', '.join(map(str, range(2000)))}, y)"
+        ast = parse_one(sql)
+        block, column = ast.args["where"].this.expressions
+
+        self.assertIsInstance(block, exp.LiteralBlock)
+        self.assertIsInstance(column, exp.Column)
+        self.assertIsNone(block.args.get("width"))
+        self.assertEqual(ast.sql(), sql)
+
+        # Short lists and lists with comments are parsed into one node per literal
+        for sql in (
+            "SELECT x IN (1, 2, 3)",
+            f"SELECT x IN ({', '.join(f'{i} /* c */' for i in range(2000))})",
+        ):
+            self.assertIsNone(parse_one(sql).find(exp.LiteralBlock))
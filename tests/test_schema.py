@@ -198,6 +198,17 @@ class TestSchema(unittest.TestCase):
         schema = MappingSchema({"foo": {"bar": parse_one("INT", into=exp.DataType)}})
         self.assertEqual(schema.get_column_type("foo", "bar").this, exp.DataType.Type.INT)
 
+    def test_schema_get_column_type_cache(self):
+        schema = MappingSchema({"a": {"b": "varchar"}})
+        column_type = schema.get_column_type("a", "b")
+        self.assertIs(schema.get_column_type(exp.to_table("a"), exp.column("b")), column_type)
+        self.assertEqual(
+            schema.get_column_type(exp.to_table('"A"'), "b").this, exp.DataType.Type.UNKNOWN
+        )
+
+        schema.add_table("a", {"b": "int"})
+        self.assertEqual(schema.get_column_type("a", "b").this, exp.DataType.Type.INT)
+
     def test_schema_normalization(self):
         schema = MappingSchema(
             schema={"x": {"`y`": {"Z": {"a": "INT", "`B`": "VARCHAR"}, "w": {"C": "INT"}}}},
@@ -277,3 +288,13 @@ class TestSchema(unittest.TestCase):
         schema = MappingSchema({"x": {"c": "int"}})
         self.assertTrue(schema.has_column("x", exp.column("c")))
         self.assertFalse(schema.has_column("x", exp.column("k")))
+
+    def test_partition_columns(self):
+        schema = MappingSchema(
+            {"db": {"x": {"dt": "date", "k": "int"}, "y": {"c": "int"}}},
+            partitions={"db": {"x": ["DT"]}},
+        )
+        self.assertEqual(schema.partition_columns("db.x"), ["dt"])
+        self.assertEqual(schema.partition_columns(exp.to_table("db.y")), [])
+        self.assertEqual(schema.copy().partition_columns("db.x"), ["dt"])
+        self.assertEqual(MappingSchema({"x": {"c": "int"}}).partition_columns("x"), [])
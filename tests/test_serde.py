@@ -1,7 +1,12 @@
+import datetime
+import io
 import json
+import mmap
+import pickle
+import tempfile
 import unittest
 
-from sqlglot import exp, parse_one
+from sqlglot import exp, parse_one, serde
 from sqlglot.optimizer.annotate_types import annotate_types
 from tests.helpers import load_sql_fixtures
 
@@ -37,3 +42,89 @@ class TestSerDe(unittest.TestCase):
         before.meta["x"] = 1
         after = self.dump_load(before)
         self.assertEqual(before.meta, after.meta)
+
+    def test_binary(self):
+        for sql in load_sql_fixtures("identity.sql"):
+            with self.subTest(sql):
+                before = parse_one(sql)
+                after = serde.load_bytes(serde.dump_bytes(before))
+                self.assertEqual(before, after)
+
+        self.assertEqual(serde.load_bytes(serde.dump_bytes(CustomExpression())), CustomExpression())
+
+        before = annotate_types(parse_one("SELECT CAST('1' AS STRUCT<x ARRAY<INT>>) /* c */"))
+        before.meta["x"] = [1, -2.5]
+        after = serde.load_bytes(serde.dump_bytes(before))
+        self.assertEqual(before, after)
+        self.assertEqual(before.meta, after.meta)
+        self.assertEqual(before.expressions[0].comments, after.expressions[0].comments)
+        self.assertEqual(before.expressions[0].type, after.expressions[0].type)
+
+        self.assertEqual(
+            serde.load_bytes(serde.dump_bytes([1, -300, "a", None])), [1, -300, "a", None]
+        )
+
+    def test_binary_stream(self):
+        expressions = [parse_one(f"SELECT a{i} FROM x WHERE b = {i * 1000}") for i in range(50)]
+
+        stream = io.BytesIO()
+        serde.dump_stream(expressions, stream)
+        data = stream.getvalue()
+
+        stream.seek(0)
+        self.assertEqual(list(serde.load_stream(stream)), expressions)
+        self.assertEqual(list(serde.load_stream(data)), expressions)
+
+        with tempfile.TemporaryFile() as file:
+            file.write(data)
+            file.flush()
+
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                self.assertEqual(list(serde.load_stream(mapped)), expressions)
+
+        with self.assertRaises(ValueError):
+            list(serde.load_stream(b"NOTSQLGLOT"))
+        with self.assertRaises(ValueError):
+            list(serde.load_stream(data[:-5]))
+        with self.assertRaises(ValueError):
+            list(serde.load_stream(io.BytesIO(data[:-5])))
+
+    def test_pickle(self):
+        for sql in load_sql_fixtures("identity.sql"):
+            with self.subTest(sql):
+                before = parse_one(sql)
+                after = pickle.loads(pickle.dumps(before))
+                self.assertEqual(before, after)
+
+        before = parse_one("SELECT a FROM x")
+        after = pickle.loads(pickle.dumps({"q": before, "col": before.find(exp.Column)}))
+        self.assertEqual(after["q"], before)
+        self.assertIsNone(after["col"].parent)
+
+        before = parse_one("SELECT a FROM x")
+        before.meta[1] = "x"
+        before.find(exp.Column).meta["when"] = datetime.date(2024, 1, 1)
+        after = pickle.loads(pickle.dumps(before))
+        self.assertEqual(after.meta, {1: "x"})
+        self.assertEqual(after.find(exp.Column).meta, {"when": datetime.date(2024, 1, 1)})
+
+        # Unpickling can run arbitrary code, so a pickled record isn't a valid dump
+        record = serde._dump_pickled(before)
+        with self.assertRaises(ValueError):
+            serde.load_bytes(serde.MAGIC + serde._varint(len(record)) + record)
+
+        deep = exp.and_(*(exp.column(f"x{i}") for i in range(5000)))
+        self.assertEqual(
+            [node.name for node, *_ in pickle.loads(pickle.dumps(deep)).bfs()],
+            [node.name for node, *_ in deep.bfs()],
+        )
+
+    def test_shared_memory(self):
+        expressions = [parse_one(f"SELECT a{i} FROM x") for i in range(10)]
+        shm = serde.dump_shared(expressions)
+
+        try:
+            self.assertEqual(serde.load_shared(shm.name), expressions)
+        finally:
+            shm.close()
+            shm.unlink()
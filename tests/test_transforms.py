@@ -1,10 +1,12 @@
 import unittest
 
-from sqlglot import parse_one
+from sqlglot import exp, parse_one
 from sqlglot.transforms import (
     eliminate_distinct_on,
     eliminate_qualify,
+    ensure_bools,
     remove_precision_parameterized_types,
+    rewrite,
     unalias_group,
 )
 
@@ -118,3 +120,38 @@ class TestTransforms(unittest.TestCase):
             "SELECT CAST(1 AS DECIMAL(10, 2)), CAST('13' AS VARCHAR(10))",
             "SELECT CAST(1 AS DECIMAL), CAST('13' AS VARCHAR)",
         )
+
+    def test_rewrite(self):
+        visited = []
+
+        def _visit(node):
+            visited.append(node.key)
+            return node
+
+        expression = parse_one("SELECT x.a + 1 AS b FROM x WHERE x.c > 2 AND x.d")
+        rewritten = rewrite(
+            expression,
+            {
+                exp.Binary: _visit,
+                (exp.Column, exp.Literal): [_visit, lambda node: node],
+                exp.Column: lambda column: exp.column(column.name.upper()),
+                exp.Literal: lambda literal: exp.Literal.number(int(literal.name) * 10),
+                exp.Where: [lambda where: exp.Where(this=where.this.and_("y")), _visit],
+            },
+        )
+
+        self.assertEqual(rewritten.sql(), "SELECT A + 10 AS b FROM x WHERE (x.c > 2 AND x.d) AND y")
+        self.assertEqual(expression.sql(), "SELECT x.a + 1 AS b FROM x WHERE x.c > 2 AND x.d")
+        self.assertEqual(visited, ["add", "column", "literal", "where"])
+
+        expression = parse_one("SELECT a FROM x WHERE b")
+        self.assertIs(rewrite(expression, {exp.Where: lambda _: None}, copy=False), expression)
+        self.assertEqual(expression.sql(), "SELECT a FROM x")
+        self.assertIsNone(rewrite(expression, {exp.Select: lambda _: None}))
+
+    def test_ensure_bools(self):
+        expression = parse_one("SELECT a FROM x WHERE 1 AND NOT b OR IF(c, 1, 2) = 1")
+        self.assertEqual(
+            ensure_bools(expression).sql(),
+            "SELECT a FROM x WHERE 1 <> 0 AND NOT b <> 0 OR CASE WHEN c <> 0 THEN 1 ELSE 2 END = 1",
+        )